@@ -8,21 +8,27 @@ streamlit run app.py
 """
 
 import streamlit as st
-import requests
 import json
-import time
 import os
+import time
 from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 import asyncio
-import nest_asyncio
+import contextvars
+import threading
 import aiohttp
-import pandas as pd
 from dotenv import load_dotenv
-from openai import OpenAI
 import logging
 from enum import Enum
 import re
+import hashlib
+import html
+import shelve
 import io
 import base64
 
@@ -38,6 +44,20 @@ try:
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
+# 고속 JSON 파서 (선택적 import, 없으면 표준 json 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 법률 용어 다중 패턴 매칭 (선택적 import, 없으면 부분 문자열 검사)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # PDF 번역 모듈 (선택적 import)
 try:
     from pdf_translator import PDFTranslator, translate_pdf_file
@@ -45,19 +65,60 @@ try:
 except ImportError:
     PDF_TRANSLATOR_AVAILABLE = False
 
-# Streamlit 환경에서 asyncio 이벤트 루프 충돌 방지
-nest_asyncio.apply()
-
 # 환경변수 로드
 load_dotenv()
 
 # 기본 OpenAI 모델 설정 (환경변수 OPENAI_MODEL로 재정의 가능)
 OPENAI_MODEL_NAME = os.getenv("OPENAI_MODEL", "gpt-5.2")
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+# 종합 검색 결과 캐시 (엔진은 앱 전체에서 1개이므로 전체 세션 공유 LRU) - 최대 항목 수와 유효 시간(초)
+SEARCH_CACHE_MAX_SIZE = 128
+SEARCH_CACHE_TTL = 3600
+
+# 상세 문서 캐시 크기 (엔진별)
+DETAIL_CACHE_MAX_SIZE = 256
+
+# target별 검색 응답 캐시 (전체 세션 공유) - 유효 시간(초)과 최대 항목 수
+SEARCH_RESPONSE_CACHE_TTL = 3600
+SEARCH_RESPONSE_CACHE_MAX_SIZE = 2048
+
+# 검색 응답 디스크 캐시 (서버 재시작/재배포 후에도 재사용) - 유효 시간(초)과 저장 경로
+# 환경변수 LAW_API_CACHE_PATH를 빈 문자열로 설정하면 비활성화
+SEARCH_RESPONSE_DISK_CACHE_TTL = 86400
+SEARCH_RESPONSE_DISK_CACHE_PATH = os.getenv("LAW_API_CACHE_PATH", os.path.join(".cache", "law_search_responses"))
+
+# 일시적 오류(429/503) 재시도 설정 - 지수 백오프 (0.3s, 0.6s, ...)
+API_MAX_RETRIES = 3
+API_RETRY_BACKOFF = 0.3
+RETRYABLE_STATUS_CODES = (429, 503)
+
+# 법제처 웹 주소 (API 응답의 상세링크는 이 주소 기준 상대 경로)
+LAW_GO_KR_BASE_URL = "https://www.law.go.kr"
+
+# 검색 응답에서 결과 배열을 찾을 때 건너뛸 메타데이터 키
+SEARCH_RESULT_SKIP_KEYS = frozenset({
+    'totalCnt', 'page', 'target', 'section', '키워드',
+    'resultMsg', 'resultCode', 'numOfRows',
+})
+
+# 로깅 설정 (환경변수 LOG_LEVEL로 재정의 가능, 예: DEBUG)
+logging.basicConfig(level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO))
 logger = logging.getLogger(__name__)
 
+# 법제처 API 동시 요청 상한 (단일 호스트 과부하/429 방지, 환경변수 LAW_API_MAX_CONCURRENCY로 재정의 가능)
+# 잘못된 값이면 기본값(16)으로 대체 (로거 설정 이후에 파싱하여 경고 기록)
+DEFAULT_MAX_CONCURRENT_REQUESTS = 16
+try:
+    MAX_CONCURRENT_REQUESTS = max(1, int(os.getenv("LAW_API_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENT_REQUESTS))))
+except ValueError:
+    logger.warning(f"LAW_API_MAX_CONCURRENCY 값이 올바르지 않아 기본값 {DEFAULT_MAX_CONCURRENT_REQUESTS} 사용: "
+                   f"{os.getenv('LAW_API_MAX_CONCURRENCY')!r}")
+    MAX_CONCURRENT_REQUESTS = DEFAULT_MAX_CONCURRENT_REQUESTS
+
+# API 응답(bytes) 파싱 함수 - orjson은 UTF-8 bytes를 str 변환 없이 바로 파싱
+# (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 # ===== 페이지 설정 =====
 st.set_page_config(
     page_title="AI 법률 도우미 & PDF 번역",
@@ -67,7 +128,9 @@ st.set_page_config(
 )
 
 # ===== 커스텀 CSS =====
-st.markdown("""
+# Streamlit은 매 rerun마다 스크립트 출력을 다시 그리므로(미출력 요소는 제거됨) 주입 자체는 매번 필요.
+# 대신 문자열은 모듈 로드 시 1회만 만들고 공백을 압축해 rerun당 전송량을 줄인다.
+_CUSTOM_CSS_SOURCE = """
 <style>
     .chat-message {
         padding: 1.5rem;
@@ -102,6 +165,17 @@ st.markdown("""
         border-radius: 5px;
     }
 
+    .result-row {
+        display: flex;
+        justify-content: space-between;
+        align-items: flex-start;
+        gap: 1rem;
+        margin-bottom: 0.5rem;
+    }
+
+    .result-meta { color: rgba(49, 51, 63, 0.6); font-size: 0.875rem; }
+    .result-link { white-space: nowrap; }
+
     .api-status-ok { color: #388e3c; font-weight: bold; }
     .api-status-error { color: #d32f2f; font-weight: bold; }
 
@@ -137,7 +211,14 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+CUSTOM_CSS = re.sub(r'\s*([{};:,])\s*', r'\1', re.sub(r'\s+', ' ', _CUSTOM_CSS_SOURCE)).strip()
+
+def inject_custom_css():
+    """커스텀 CSS 주입"""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+inject_custom_css()
 
 # ===== 서비스 유형 Enum =====
 class ServiceType(Enum):
@@ -163,7 +244,8 @@ def init_session_state():
         'law_api_key': '',
         'openai_api_key': '',
         'api_keys_set': False,
-        'search_results': None
+        'search_results': None,
+        'advice_cache': {}
     }
     for key, value in defaults.items():
         if key not in st.session_state:
@@ -172,8 +254,19 @@ def init_session_state():
 init_session_state()
 
 # ===== API 키 관리 함수 =====
+
+# 백그라운드 이벤트 루프에서 실행 중인 작업의 API 키 (run_async가 요청 시점 값을 전달)
+# 루프 스레드에는 Streamlit 스크립트 컨텍스트가 없어 세션 상태를 읽을 수 없음
+_request_api_keys: contextvars.ContextVar[Optional[Dict[str, str]]] = contextvars.ContextVar(
+    'request_api_keys', default=None
+)
+
 def get_law_api_key() -> str:
     """법제처 API 키 가져오기"""
+    # 0. 백그라운드 루프 작업이면 요청 시점에 전달된 키 사용
+    request_keys = _request_api_keys.get()
+    if request_keys is not None:
+        return request_keys['law']
     # 1. 세션에서 확인
     if st.session_state.law_api_key:
         return st.session_state.law_api_key
@@ -188,6 +281,10 @@ def get_law_api_key() -> str:
 
 def get_openai_api_key() -> str:
     """OpenAI API 키 가져오기"""
+    # 0. 백그라운드 루프 작업이면 요청 시점에 전달된 키 사용
+    request_keys = _request_api_keys.get()
+    if request_keys is not None:
+        return request_keys['openai']
     # 1. 세션에서 확인
     if st.session_state.openai_api_key:
         return st.session_state.openai_api_key
@@ -200,6 +297,13 @@ def get_openai_api_key() -> str:
     # 3. 환경변수 확인
     return os.getenv('OPENAI_API_KEY', '')
 
+@st.cache_resource(max_entries=16)
+def _openai_client(api_key: str):
+    """API 키별 OpenAI 클라이언트 (재실행 간 공유되어 HTTP 커넥션 풀 재사용)"""
+    # openai 패키지는 실제로 클라이언트가 필요할 때만 로드 (콜드 스타트 단축)
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
 def get_openai_client():
     """OpenAI 클라이언트 가져오기"""
     api_key = get_openai_api_key()
@@ -208,7 +312,7 @@ def get_openai_client():
         if not api_key.startswith('sk-'):
             logger.warning(f"잘못된 OpenAI API 키 형식: {api_key[:20]}... (sk-로 시작해야 합니다)")
             return None
-        return OpenAI(api_key=api_key)
+        return _openai_client(api_key)
     return None
 
 # ===== AI 변호사 프롬프트 템플릿 =====
@@ -228,95 +332,480 @@ AI_LAWYER_SYSTEM_PROMPT = """
 구체적인 사안에 대해서는 반드시 변호사 등 전문가의 검토가 필요합니다.
 """
 
+# 검색 결과 기반 법률 조언 프롬프트 (str.format_map으로 채움)
+LEGAL_ADVICE_PROMPT_TEMPLATE = """당신은 한국 법률 전문가입니다. 아래에 법제처 Open API에서 검색된 **실제 법률 자료**가 제공됩니다.
+반드시 이 검색 결과를 기반으로 답변해야 합니다.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+## 의뢰인 질문/상황:
+{query}
+
+## 추출된 검색 키워드:
+{keywords_str}
+
+## 검색 통계:
+{stats_summary}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+## 🔍 법제처에서 검색된 실제 법률 자료:
+{context}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+## ⚠️ 필수 지침 (반드시 준수):
+1. **위에 제공된 검색 결과만 사용하세요.** 일반적인 법률 지식으로 답변하지 마세요.
+2. **판례를 인용할 때는 반드시 위 목록에서 사건번호를 정확히 복사하세요.**
+   예: "대법원 2020다12345 판결에서..."
+3. **법령해석례를 인용할 때는 안건번호를 명시하세요.**
+   예: "법제처 안건번호 22-0123에 따르면..."
+4. **행정심판례를 인용할 때는 사건번호를 명시하세요.**
+   예: "중앙행정심판위원회 2023-12345 재결에서..."
+5. 위 검색 결과에 없는 내용은 "검색 결과에 포함되지 않음"이라고 명시하세요.
+
+## 답변 형식:
+
+### 📋 핵심 요약
+[의뢰인 상황에 대한 2-3문장 핵심 결론]
+
+### 📚 관련 판례 (위 검색 결과에서 인용)
+[검색된 판례 목록에서 관련 판례를 선택하여 사건번호와 함께 상세 설명]
+- **사건번호**: [위에서 복사]
+- **법원/선고일**: [위에서 복사]
+- **판시사항**: [내용 설명]
+- **의뢰인 사안 적용**: [분석]
+
+### 📋 관련 법령해석례/행정심판례 (위 검색 결과에서 인용)
+[검색된 해석례/심판례에서 관련 건을 선택하여 안건번호와 함께 설명]
+
+### 📖 관련 법령
+[검색된 법령 중 관련 법령 인용]
+
+### 💡 종합 의견 및 조언
+[위 자료들을 종합한 분석]
+
+---
+⚖️ 본 내용은 AI가 작성한 참고자료이며, 법률자문이 아닙니다.
+구체적인 사안에 대해서는 반드시 변호사 등 전문가의 검토가 필요합니다.
+"""
+
+# 검색 결과가 없을 때의 법률 조언 프롬프트
+NO_RESULT_ADVICE_PROMPT_TEMPLATE = """당신은 한국 법률 전문가입니다.
+
+## 의뢰인 질문/상황:
+{query}
+
+## 추출된 검색 키워드:
+{keywords_str}
+
+## ⚠️ 검색 결과:
+법제처 Open API 검색 결과가 없습니다.
+
+## 지침:
+1. 검색 결과가 없음을 먼저 안내하세요.
+2. 일반적인 법률 정보를 제공하되, "법제처 검색 결과 없음"을 명시하세요.
+3. 다른 검색어 제안을 포함하세요.
+
+---
+⚖️ 본 내용은 AI가 작성한 참고자료이며, 법률자문이 아닙니다.
+구체적인 사안에 대해서는 반드시 변호사 등 전문가의 검토가 필요합니다.
+"""
+
+# ===== 키워드/사실 추출용 패턴 및 사전 =====
+# 매 호출마다 재컴파일/재생성하지 않도록 모듈 로드 시 1회만 준비
+LAW_NAME_PATTERN = re.compile(r'[가-힣]+(?:법|령|규칙|조례|규정|지침|고시)')
+ARTICLE_PATTERN = re.compile(r'제\d+조(?:의\d+)?(?:제\d+항)?')
+HANGUL_WORD_PATTERN = re.compile(r'[가-힣]{2,}')
+DATE_PATTERN = re.compile(r'\d{4}[년\.\-]\d{1,2}[월\.\-]\d{1,2}[일]?')
+# 날짜 패턴과 동일하되 연/월/일을 그룹으로 추출 (타임라인 정렬 키를 숫자로 만들기 위함)
+DATE_PARTS_PATTERN = re.compile(r'(\d{4})[년\.\-](\d{1,2})[월\.\-](\d{1,2})[일]?')
+MONEY_PATTERN = re.compile(r'\d+[만천백]?\s?원')
+
+# 필드 값 검증용 패턴 (API URL 파라미터, camelCase 필드명)
+URL_PARAM_PATTERN = re.compile(r'[?&](OC|target|ID|type)=')
+CAMEL_CASE_PATTERN = re.compile(r'^[a-z]+[A-Z][a-z]+$')
+
+# HTML 정리용 패턴 (<br>, <p>, </p> → 줄바꿈 / 나머지 태그 제거 / 공백 정리)
+HTML_LINE_BREAK_PATTERN = re.compile(r'<(?:br\s*/?|p\s*/?|/p)>', re.IGNORECASE)
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+MULTI_SPACE_PATTERN = re.compile(r' +')
+
+# 파일명에 사용할 수 없는 문자
+UNSAFE_FILENAME_PATTERN = re.compile(r'[<>:"/\\|?*]')
+
+# 불용어 정의 (일반적인 단어, 조사, 구어체 표현 등)
+KEYWORD_STOPWORD_SUFFIXES = (
+    # 조사
+    '은', '는', '이', '가', '을', '를', '의', '에', '에서', '으로', '로',
+    '와', '과', '도', '만', '뿐', '까지', '부터', '에게', '한테', '께',
+    # 어미/서술어
+    '입니다', '합니다', '있습니다', '없습니다', '됩니다', '습니다',
+    '하는', '되는', '있는', '없는', '한', '된', '할', '될',
+    '했습니다', '했다', '한다', '하다', '이다',
+    # 접속어
+    '것', '수', '때', '등', '및', '또는', '그리고', '하지만', '그러나',
+    # 의문사
+    '어떻게', '무엇', '어디', '언제', '누구', '왜', '어떤',
+    # 부사
+    '좀', '잘', '더', '매우', '정말', '아주', '너무', '많이', '현재', '지금',
+    # 대명사/지시어
+    '저', '제', '나', '내', '우리', '저희', '그', '그녀', '그들',
+    '이것', '저것', '그것', '여기', '거기', '저기',
+    # 일반 명사 (법률과 무관)
+    '현행', '해당', '요건', '확인', '검색', '관련', '판례',
+    '사람', '경우', '상황', '문제', '부분', '방법', '정도',
+    # 구어체/문장 표현
+    '있을까요', '될까요', '인가요', '일까요', '할까요', '싶습니다',
+    '엄마로써', '아빠로써', '찾아가자', '보러', '몇번', '자기에게',
+    '있다고', '한다고', '라고', '다고',
+)
+KEYWORD_STOPWORDS = frozenset(KEYWORD_STOPWORD_SUFFIXES)
+
+# 구체적인 법률 용어 (복합 키워드 우선)
+SPECIFIC_LEGAL_TERMS = (
+    # 가족법/이혼 관련 - 중요!
+    '면접교섭권', '면접교섭', '양육권', '친권', '양육비',
+    '접근금지', '접근금지가처분', '가처분', '임시처분',
+    '이혼소송', '협의이혼', '재판이혼', '재산분할청구',
+    '위자료청구', '양육자지정', '친권자지정',
+    # 금융/대부업 관련
+    '대부업', '대부중개업', '매입채권추심업', '매입채권', '추심업',
+    '자기자본', '자본금', '등록요건', '영업요건',
+    '금융업', '여신업', '신용정보', '채권추심', '채권매입',
+    '등록기준', '허가기준', '인가기준', '자본요건',
+    # 노동법 관련
+    '부당해고', '해고무효', '부당노동행위', '근로계약',
+    '해고예고', '정리해고', '징계해고', '퇴직금청구',
+    # 부동산/임대차 관련
+    '임대차보호', '상가임대차', '주택임대차', '전세보증금',
+    '명도소송', '임대차계약', '보증금반환', '계약갱신',
+    # 민사 일반
+    '손해배상', '불법행위', '채무불이행', '계약위반',
+    '손해배상청구', '위약금', '지체상금',
+    # 개인정보/공정거래
+    '개인정보보호', '정보주체', '개인정보처리',
+    '공정거래', '독점규제', '불공정거래', '시장지배적지위',
+)
+
+# 일반 법률 키워드
+GENERAL_LEGAL_KEYWORDS = (
+    # 가족법
+    '이혼', '양육', '친권', '면접', '교섭', '위자료', '재산분할',
+    '가처분', '임시', '처분', '접근', '금지', '배우자', '자녀',
+    '상속', '유언', '증여', '유류분',
+    # 노동법
+    '해고', '임금', '퇴직금', '근로', '노동', '계약', '위반',
+    # 민사
+    '손해배상', '불법행위', '계약해지', '계약해제',
+    '임대차', '전세', '월세', '보증금', '명도', '인도',
+    # 소송
+    '형사', '민사', '행정', '소송', '재판', '항소', '상고', '판결',
+    # 형사
+    '사기', '횡령', '배임', '폭행', '상해', '명예훼손',
+    # 지재권
+    '저작권', '특허', '상표', '영업비밀', '지식재산',
+    '개인정보', '정보보호', '프라이버시',
+    # 조세
+    '세금', '조세', '부가세', '소득세', '법인세', '상속세', '증여세',
+    # 행정
+    '건축', '인허가', '허가', '신고', '등록', '면허',
+    # 기타
+    '교통사고', '산재', '산업재해', '보험', '보상',
+    '파산', '회생', '도산', '채무', '채권', '담보', '저당', '압류',
+    '해제', '취소', '무효', '철회', '해지',
+    '위임', '대리', '보증', '연대보증'
+)
+
+# 구체 용어 → 일반 키워드 순으로 검사 (우선순위 유지, 중복 제거)
+LEGAL_KEYWORD_TERMS = tuple(dict.fromkeys(SPECIFIC_LEGAL_TERMS + GENERAL_LEGAL_KEYWORDS))
+
+def _build_legal_term_automaton():
+    """법률 용어 Aho-Corasick 오토마톤 생성 (값 = 우선순위 인덱스)"""
+    automaton = ahocorasick.Automaton()
+    for priority, term in enumerate(LEGAL_KEYWORD_TERMS):
+        automaton.add_word(term, priority)
+    automaton.make_automaton()
+    return automaton
+
+# 입력을 한 번만 훑어 모든 법률 용어(겹치는 매치 포함)를 찾기 위한 오토마톤
+LEGAL_TERM_AUTOMATON = _build_legal_term_automaton() if AHOCORASICK_AVAILABLE else None
+
+# pyahocorasick이 없을 때의 대체 경로: 단일 정규식 스캔
+# 각 위치에서 가장 긴 용어를 찾고(긴 용어 우선 alternation + lookahead로 겹치는 매치 허용),
+# 그 용어에 포함된 짧은 용어는 미리 계산한 표로 보충하여 용어별 부분 문자열 검사와 같은 결과를 얻음
+LEGAL_TERM_PATTERN = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(LEGAL_KEYWORD_TERMS, key=len, reverse=True))) + '))'
+)
+LEGAL_TERM_SUBTERMS = {
+    term: tuple(priority for priority, other in enumerate(LEGAL_KEYWORD_TERMS) if other in term)
+    for term in LEGAL_KEYWORD_TERMS
+}
+
+@lru_cache(maxsize=64)
+def _normalize_query(query: str) -> str:
+    """비교용 검색어 정규화 (공백 제거 + 소문자) - 같은 검색어로 필드 검증이 반복되므로 캐시"""
+    return query.strip().lower()
+
+@lru_cache(maxsize=1024)
+def _extract_keywords_cached(user_input: str) -> tuple:
+    """법률 키워드 추출 (입력 문자열에만 의존하므로 결과를 캐시, 공유 가능한 튜플 반환)"""
+    keywords = []
+    seen = set()
+
+    # 1. 법률명 패턴 추출 (XX법, XX령, XX규칙 등) - 최우선
+    for law in LAW_NAME_PATTERN.findall(user_input):
+        if len(law) >= 3 and law not in seen:
+            keywords.append(law)
+            seen.add(law)
+
+    # 2. 조문 관련 추출 (제X조, 제X항 등)
+    for article in ARTICLE_PATTERN.findall(user_input):
+        if article not in seen:
+            keywords.append(article)
+            seen.add(article)
+
+    # 3. 구체적인 법률 용어 / 4. 일반 법률 키워드
+    if LEGAL_TERM_AUTOMATON is not None:
+        # 단일 선형 스캔 후 우선순위(사전 순서)로 정렬
+        priorities = sorted({priority for _, priority in LEGAL_TERM_AUTOMATON.iter(user_input)})
+        found_terms = [LEGAL_KEYWORD_TERMS[priority] for priority in priorities]
+    else:
+        priorities = sorted({priority for term in set(LEGAL_TERM_PATTERN.findall(user_input))
+                             for priority in LEGAL_TERM_SUBTERMS[term]})
+        found_terms = [LEGAL_KEYWORD_TERMS[priority] for priority in priorities]
+    for term in found_terms:
+        if term not in seen:
+            keywords.append(term)
+            seen.add(term)
+
+    # 5. 남은 명사 추출 (2글자 이상, 4글자 이상 우선)
+    words = HANGUL_WORD_PATTERN.findall(user_input)
+    long_words = [w for w in words if len(w) >= 4]
+    short_words = [w for w in words if len(w) < 4]
+
+    for word in long_words + short_words:
+        # 완전 일치는 집합 조회, 접미사는 endswith(tuple)로 C 레벨에서 한 번에 검사
+        # (접미사 정규식 alternation보다 짧은 한글 단어에서 더 빠름)
+        is_stopword = word in KEYWORD_STOPWORDS or word.endswith(KEYWORD_STOPWORD_SUFFIXES)
+        if not is_stopword and word not in seen:
+            keywords.append(word)
+            seen.add(word)
+
+    # 6. 상위 키워드 반환 (모든 단계에서 seen으로 중복을 걸렀으므로 추가 중복 제거 불필요)
+    return tuple(keywords[:10])  # 최대 10개 키워드
+
+# target 코드 정의 ({target 코드: 표시 이름}) - 읽기 전용 매핑으로 모든 세션/엔진이 같은 객체 공유
+
+# 기본 법률 데이터 target 코드
+BASIC_TARGETS = MappingProxyType({
+    'law': '현행법령(공포일)',
+    'eflaw': '현행법령(시행일)',
+    'prec': '판례',
+    'admrul': '행정규칙',
+    'ordin': '자치법규',
+    'detc': '헌재결정례',
+    'expc': '법령해석례',
+    'decc': '행정심판례',
+    'trty': '조약',
+})
+
+# 위원회 결정문 target 코드
+COMMITTEE_TARGETS = MappingProxyType({
+    'ppc': '개인정보보호위원회',
+    'eiac': '고용보험심사위원회',
+    'ftc': '공정거래위원회',
+    'acr': '국민권익위원회',
+    'fsc': '금융위원회',
+    'nlrc': '노동위원회',
+    'kcc': '방송미디어통신위원회',
+    'iaciac': '산업재해보상보험재심사위원회',
+    'oclt': '중앙토지수용위원회',
+    'ecc': '중앙환경분쟁조정위원회',
+    'sfc': '증권선물위원회',
+    'nhrck': '국가인권위원회',
+})
+
+# 부처별 법령해석 target 코드
+MINISTRY_TARGETS = MappingProxyType({
+    'moelCgmExpc': '고용노동부 법령해석',
+    'molitCgmExpc': '국토교통부 법령해석',
+    'moefCgmExpc': '기획재정부 법령해석',
+    'mofCgmExpc': '해양수산부 법령해석',
+    'moisCgmExpc': '행정안전부 법령해석',
+    'meCgmExpc': '기후에너지환경부 법령해석',
+    'kcsCgmExpc': '관세청 법령해석',
+    'ntsCgmExpc': '국세청 법령해석',
+    'moeCgmExpc': '교육부 법령해석',
+    'msitCgmExpc': '과학기술정보통신부 법령해석',
+    'mpvaCgmExpc': '국가보훈부 법령해석',
+    'mndCgmExpc': '국방부 법령해석',
+    'mafraCgmExpc': '농림축산식품부 법령해석',
+    'mcstCgmExpc': '문화체육관광부 법령해석',
+    'mojCgmExpc': '법무부 법령해석',
+    'mohwCgmExpc': '보건복지부 법령해석',
+    'motieCgmExpc': '산업통상자원부 법령해석',
+    'mogefCgmExpc': '성평등가족부 법령해석',
+    'mofaCgmExpc': '외교부 법령해석',
+    'mssCgmExpc': '중소벤처기업부 법령해석',
+    'mouCgmExpc': '통일부 법령해석',
+    'molegCgmExpc': '법제처 법령해석',
+    'mfdsCgmExpc': '식품의약품안전처 법령해석',
+    'mpmCgmExpc': '인사혁신처 법령해석',
+    'kmaCgmExpc': '기상청 법령해석',
+    'khsCgmExpc': '국가유산청 법령해석',
+    'rdaCgmExpc': '농촌진흥청 법령해석',
+    'npaCgmExpc': '경찰청 법령해석',
+    'dapaCgmExpc': '방위사업청 법령해석',
+    'mmaCgmExpc': '병무청 법령해석',
+    'kfsCgmExpc': '산림청 법령해석',
+    'nfaCgmExpc': '소방청 법령해석',
+    'okaCgmExpc': '재외동포청 법령해석',
+    'ppsCgmExpc': '조달청 법령해석',
+    'kdcaCgmExpc': '질병관리청 법령해석',
+    'kostatCgmExpc': '국가데이터처 법령해석',
+    'kipoCgmExpc': '지식재산처 법령해석',
+    'kcgCgmExpc': '해양경찰청 법령해석',
+    'naaccCgmExpc': '행정중심복합도시건설청 법령해석',
+})
+
+# 사이드바 "주요 부처" 묶음 (target 코드, 표시 이름) - 나머지는 "기타 부처"
+MAJOR_MINISTRIES = (
+    ('moelCgmExpc', '고용노동부'),
+    ('molitCgmExpc', '국토교통부'),
+    ('moisCgmExpc', '행정안전부'),
+    ('mohwCgmExpc', '보건복지부'),
+    ('molegCgmExpc', '법제처'),
+    ('mojCgmExpc', '법무부'),
+)
+MAJOR_MINISTRY_KEYS = tuple(key for key, _ in MAJOR_MINISTRIES)
+OTHER_MINISTRY_KEYS = tuple(key for key in MINISTRY_TARGETS if key not in MAJOR_MINISTRY_KEYS)
+
+# 특별행정심판례 target 코드
+SPECIAL_TRIBUNAL_TARGETS = MappingProxyType({
+    'ttSpecialDecc': '조세심판원 특별행정심판례',
+    'kmstSpecialDecc': '해양안전심판원 특별행정심판례',
+    'acrSpecialDecc': '국민권익위원회 특별행정심판례',
+    'adapSpecialDecc': '인사혁신처 소청심사위원회 재결례',
+})
+
+@st.cache_resource
+def get_search_response_cache() -> OrderedDict:
+    """세션 간 공유되는 검색 응답 캐시 ((target, query, display) → (저장 시각, 결과 목록))
+
+    엔진 코루틴은 모두 공유 백그라운드 루프 스레드에서 실행되므로 별도 잠금 불필요
+    """
+    return OrderedDict()
+
+@st.cache_resource
+def get_search_disk_cache() -> Optional[shelve.Shelf]:
+    """재시작 후에도 유지되는 검색 응답 디스크 캐시 (키 → (저장 시각, 결과 목록)), 열 수 없으면 None
+
+    열 때 만료되었거나 형식이 잘못된 항목을 정리함
+    """
+    if not SEARCH_RESPONSE_DISK_CACHE_PATH:
+        return None
+    try:
+        os.makedirs(os.path.dirname(SEARCH_RESPONSE_DISK_CACHE_PATH) or '.', exist_ok=True)
+        db = shelve.open(SEARCH_RESPONSE_DISK_CACHE_PATH)
+        now = time.time()
+        stale_keys = []
+        for key in list(db.keys()):
+            try:
+                stored_at, results = db[key]
+                if now - stored_at > SEARCH_RESPONSE_DISK_CACHE_TTL or not isinstance(results, list):
+                    stale_keys.append(key)
+            except Exception:
+                stale_keys.append(key)
+        for key in stale_keys:
+            del db[key]
+        db.sync()
+        logger.info(f"검색 응답 디스크 캐시 로드: {len(db)}건 (만료 정리 {len(stale_keys)}건)")
+        return db
+    except Exception as e:
+        logger.warning(f"검색 응답 디스크 캐시를 열 수 없습니다 (메모리 캐시만 사용): {e}")
+        return None
+
+def create_http_session() -> aiohttp.ClientSession:
+    """법제처 API용 HTTP 세션 생성 (실행 중인 이벤트 루프 안에서 호출)"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+    )
+
 # ===== 법률 AI 엔진 클래스 =====
 class LegalAIEngine:
     """AI 법률 연구 엔진 - 법제처 API 전체 연동"""
 
     def __init__(self):
-        self.law_api_key = get_law_api_key()
+        # 앱 전체 공용 HTTP 세션과 그 세션이 묶인 백그라운드 루프 (스크립트 스레드에서 미리 획득)
+        self._shared_loop = get_event_loop()
+        self._shared_session = get_http_session()
+        # 그 외 이벤트 루프용 전용 HTTP 세션 (_get_session에서 지연 생성)
+        self._session = None
+        self._session_loop = None
+        self._request_semaphore = None
         self.api_endpoints = {
             'search': 'https://www.law.go.kr/DRF/lawSearch.do',
             'service': 'https://www.law.go.kr/DRF/lawService.do'
         }
 
-        # 기본 법률 데이터 target 코드
-        self.basic_targets = {
-            'law': {'name': '현행법령(공포일)', 'key': 'law'},
-            'eflaw': {'name': '현행법령(시행일)', 'key': 'eflaw'},
-            'prec': {'name': '판례', 'key': 'prec'},
-            'admrul': {'name': '행정규칙', 'key': 'admrul'},
-            'ordin': {'name': '자치법규', 'key': 'ordin'},
-            'detc': {'name': '헌재결정례', 'key': 'detc'},
-            'expc': {'name': '법령해석례', 'key': 'expc'},
-            'decc': {'name': '행정심판례', 'key': 'decc'},
-            'trty': {'name': '조약', 'key': 'trty'},
-        }
-
-        # 위원회 결정문 target 코드
-        self.committee_targets = {
-            'ppc': {'name': '개인정보보호위원회', 'key': 'ppc'},
-            'eiac': {'name': '고용보험심사위원회', 'key': 'eiac'},
-            'ftc': {'name': '공정거래위원회', 'key': 'ftc'},
-            'acr': {'name': '국민권익위원회', 'key': 'acr'},
-            'fsc': {'name': '금융위원회', 'key': 'fsc'},
-            'nlrc': {'name': '노동위원회', 'key': 'nlrc'},
-            'kcc': {'name': '방송미디어통신위원회', 'key': 'kcc'},
-            'iaciac': {'name': '산업재해보상보험재심사위원회', 'key': 'iaciac'},
-            'oclt': {'name': '중앙토지수용위원회', 'key': 'oclt'},
-            'ecc': {'name': '중앙환경분쟁조정위원회', 'key': 'ecc'},
-            'sfc': {'name': '증권선물위원회', 'key': 'sfc'},
-            'nhrck': {'name': '국가인권위원회', 'key': 'nhrck'},
-        }
-
-        # 부처별 법령해석 target 코드
-        self.ministry_targets = {
-            'moelCgmExpc': {'name': '고용노동부 법령해석', 'key': 'moelCgmExpc'},
-            'molitCgmExpc': {'name': '국토교통부 법령해석', 'key': 'molitCgmExpc'},
-            'moefCgmExpc': {'name': '기획재정부 법령해석', 'key': 'moefCgmExpc'},
-            'mofCgmExpc': {'name': '해양수산부 법령해석', 'key': 'mofCgmExpc'},
-            'moisCgmExpc': {'name': '행정안전부 법령해석', 'key': 'moisCgmExpc'},
-            'meCgmExpc': {'name': '기후에너지환경부 법령해석', 'key': 'meCgmExpc'},
-            'kcsCgmExpc': {'name': '관세청 법령해석', 'key': 'kcsCgmExpc'},
-            'ntsCgmExpc': {'name': '국세청 법령해석', 'key': 'ntsCgmExpc'},
-            'moeCgmExpc': {'name': '교육부 법령해석', 'key': 'moeCgmExpc'},
-            'msitCgmExpc': {'name': '과학기술정보통신부 법령해석', 'key': 'msitCgmExpc'},
-            'mpvaCgmExpc': {'name': '국가보훈부 법령해석', 'key': 'mpvaCgmExpc'},
-            'mndCgmExpc': {'name': '국방부 법령해석', 'key': 'mndCgmExpc'},
-            'mafraCgmExpc': {'name': '농림축산식품부 법령해석', 'key': 'mafraCgmExpc'},
-            'mcstCgmExpc': {'name': '문화체육관광부 법령해석', 'key': 'mcstCgmExpc'},
-            'mojCgmExpc': {'name': '법무부 법령해석', 'key': 'mojCgmExpc'},
-            'mohwCgmExpc': {'name': '보건복지부 법령해석', 'key': 'mohwCgmExpc'},
-            'motieCgmExpc': {'name': '산업통상자원부 법령해석', 'key': 'motieCgmExpc'},
-            'mogefCgmExpc': {'name': '성평등가족부 법령해석', 'key': 'mogefCgmExpc'},
-            'mofaCgmExpc': {'name': '외교부 법령해석', 'key': 'mofaCgmExpc'},
-            'mssCgmExpc': {'name': '중소벤처기업부 법령해석', 'key': 'mssCgmExpc'},
-            'mouCgmExpc': {'name': '통일부 법령해석', 'key': 'mouCgmExpc'},
-            'molegCgmExpc': {'name': '법제처 법령해석', 'key': 'molegCgmExpc'},
-            'mfdsCgmExpc': {'name': '식품의약품안전처 법령해석', 'key': 'mfdsCgmExpc'},
-            'mpmCgmExpc': {'name': '인사혁신처 법령해석', 'key': 'mpmCgmExpc'},
-            'kmaCgmExpc': {'name': '기상청 법령해석', 'key': 'kmaCgmExpc'},
-            'khsCgmExpc': {'name': '국가유산청 법령해석', 'key': 'khsCgmExpc'},
-            'rdaCgmExpc': {'name': '농촌진흥청 법령해석', 'key': 'rdaCgmExpc'},
-            'npaCgmExpc': {'name': '경찰청 법령해석', 'key': 'npaCgmExpc'},
-            'dapaCgmExpc': {'name': '방위사업청 법령해석', 'key': 'dapaCgmExpc'},
-            'mmaCgmExpc': {'name': '병무청 법령해석', 'key': 'mmaCgmExpc'},
-            'kfsCgmExpc': {'name': '산림청 법령해석', 'key': 'kfsCgmExpc'},
-            'nfaCgmExpc': {'name': '소방청 법령해석', 'key': 'nfaCgmExpc'},
-            'okaCgmExpc': {'name': '재외동포청 법령해석', 'key': 'okaCgmExpc'},
-            'ppsCgmExpc': {'name': '조달청 법령해석', 'key': 'ppsCgmExpc'},
-            'kdcaCgmExpc': {'name': '질병관리청 법령해석', 'key': 'kdcaCgmExpc'},
-            'kostatCgmExpc': {'name': '국가데이터처 법령해석', 'key': 'kostatCgmExpc'},
-            'kipoCgmExpc': {'name': '지식재산처 법령해석', 'key': 'kipoCgmExpc'},
-            'kcgCgmExpc': {'name': '해양경찰청 법령해석', 'key': 'kcgCgmExpc'},
-            'naaccCgmExpc': {'name': '행정중심복합도시건설청 법령해석', 'key': 'naaccCgmExpc'},
-        }
+        # target 코드 정의는 모듈 상수 공유 (엔진 생성 시 재구성하지 않음)
+        self.basic_targets = BASIC_TARGETS
+        self.committee_targets = COMMITTEE_TARGETS
+        self.ministry_targets = MINISTRY_TARGETS
+        self.special_tribunal_targets = SPECIAL_TRIBUNAL_TARGETS
+
+        # target 코드 튜플 (검색 헬퍼에서 dict 뷰를 매번 만들지 않도록 캐시)
+        self._basic_target_codes = tuple(self.basic_targets)
+        self._committee_target_codes = tuple(self.committee_targets)
+        self._ministry_target_codes = tuple(self.ministry_targets)
+        self._special_tribunal_codes = tuple(self.special_tribunal_targets)
+
+        # target 코드 → 표시 이름 (target 맵이 곧 이름 맵이므로 별칭으로 공유, UI에서도 사용)
+        self.basic_names = self.basic_targets
+        self.committee_names = self.committee_targets
+        self.ministry_names = self.ministry_targets
+        self.special_tribunal_names = self.special_tribunal_targets
+
+        # legal_data 섹션 키 → 이름 맵 (통계/컨텍스트에서 단일 루프로 순회)
+        self._section_name_maps = (
+            ('basic', self.basic_names),
+            ('committees', self.committee_names),
+            ('ministries', self.ministry_names),
+            ('special_tribunals', self.special_tribunal_names),
+        )
 
-        # 특별행정심판례 target 코드
-        self.special_tribunal_targets = {
-            'ttSpecialDecc': {'name': '조세심판원 특별행정심판례', 'key': 'ttSpecialDecc'},
-            'kmstSpecialDecc': {'name': '해양안전심판원 특별행정심판례', 'key': 'kmstSpecialDecc'},
-            'acrSpecialDecc': {'name': '국민권익위원회 특별행정심판례', 'key': 'acrSpecialDecc'},
-            'adapSpecialDecc': {'name': '인사혁신처 소청심사위원회 재결례', 'key': 'adapSpecialDecc'},
+        # 상세 문서 캐시 ((target, ID) → 상세 데이터, 오래된 것부터 제거)
+        self._detail_cache = OrderedDict()
+
+        # 종합 검색 결과 캐시 (엔진은 앱 전체에서 1개이므로 전체 세션 공유 LRU, (저장 시각, 결과) 형태로 만료 검사)
+        self._search_cache = OrderedDict()
+
+        # target별 검색 응답 캐시 (세션 간 공유, 스크립트 스레드에서 미리 획득)
+        self._response_cache = get_search_response_cache()
+        self._disk_cache = get_search_disk_cache()
+
+        # target별로 학습된 결과 배열 경로 (첫 응답에서 찾은 키 경로를 기억)
+        self._learned_paths = {}
+
+        # FIELD_MAPPING 역방향 색인 (한글 필드명 → 영문 필드명들, 매핑 순서 유지)
+        self._field_mapping_rev = {}
+        for eng, kor in self.FIELD_MAPPING.items():
+            self._field_mapping_rev.setdefault(kor, []).append(eng)
+        # 필드 키 후보 조합 → 매핑 키까지 덧붙인 튜플 (_expand_field_keys / _display_candidate_keys 캐시)
+        self._expanded_field_keys = {}
+        self._display_candidate_keys_cache = {}
+
+        # target별 응답 키 후보 (래퍼 키, 데이터 키) - 호출마다 문자열을 만들지 않도록 미리 계산
+        self._response_keys = {
+            target: self._build_response_keys(target)
+            for codes in (self._basic_target_codes, self._committee_target_codes,
+                          self._ministry_target_codes, self._special_tribunal_codes)
+            for target in codes
         }
 
         # 사건번호/안건번호 패턴 정규식
@@ -422,7 +911,7 @@ class LegalAIEngine:
 
         case_type = case_info['type']
         formatted = case_info['formatted']
-        api_key = self.law_api_key or get_law_api_key()
+        api_key = self.law_api_key
 
         if not api_key:
             logger.warning("법제처 API 키가 없습니다.")
@@ -431,52 +920,55 @@ class LegalAIEngine:
         results = {case_type: []}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                if case_type == 'prec':
-                    # 판례: nb 파라미터로 사건번호 검색
-                    params = {
-                        'OC': api_key,
-                        'target': 'prec',
-                        'type': 'JSON',
-                        'nb': formatted,  # 사건번호
-                        'display': 20
-                    }
-                    logger.info(f"판례 사건번호 검색: nb={formatted}")
-
-                elif case_type == 'expc':
-                    # 법령해석례: itmno 파라미터로 안건번호 검색
-                    params = {
-                        'OC': api_key,
-                        'target': 'expc',
-                        'type': 'JSON',
-                        'itmno': formatted,  # 안건번호 (하이픈 제거)
-                        'display': 20
-                    }
-                    logger.info(f"법령해석례 안건번호 검색: itmno={formatted}")
-
-                elif case_type == 'decc':
-                    # 행정심판례: query로 사건번호 검색 (직접 파라미터 없음)
-                    params = {
-                        'OC': api_key,
-                        'target': 'decc',
-                        'type': 'JSON',
-                        'query': case_info['case_numbers'][0],  # 사건번호로 검색
-                        'display': 20
-                    }
-                    logger.info(f"행정심판례 사건번호 검색: query={case_info['case_numbers'][0]}")
-                else:
-                    return {}
+            session = await self._get_session()
+            if case_type == 'prec':
+                # 판례: nb 파라미터로 사건번호 검색
+                params = {
+                    'OC': api_key,
+                    'target': 'prec',
+                    'type': 'JSON',
+                    'nb': formatted,  # 사건번호
+                    'display': 20
+                }
+                logger.info(f"판례 사건번호 검색: nb={formatted}")
+
+            elif case_type == 'expc':
+                # 법령해석례: itmno 파라미터로 안건번호 검색
+                params = {
+                    'OC': api_key,
+                    'target': 'expc',
+                    'type': 'JSON',
+                    'itmno': formatted,  # 안건번호 (하이픈 제거)
+                    'display': 20
+                }
+                logger.info(f"법령해석례 안건번호 검색: itmno={formatted}")
+
+            elif case_type == 'decc':
+                # 행정심판례: query로 사건번호 검색 (직접 파라미터 없음)
+                params = {
+                    'OC': api_key,
+                    'target': 'decc',
+                    'type': 'JSON',
+                    'query': case_info['case_numbers'][0],  # 사건번호로 검색
+                    'display': 20
+                }
+                logger.info(f"행정심판례 사건번호 검색: query={case_info['case_numbers'][0]}")
+            else:
+                return {}
 
+            async with self._request_semaphore:
                 async with session.get(
                     self.api_endpoints['search'],
                     params=params,
                     timeout=aiohttp.ClientTimeout(total=30)
                 ) as response:
                     if response.status == 200:
-                        text = await response.text()
+                        # 문자열 디코딩 없이 바이트에서 바로 파싱 (orjson 사용 시 고속)
+                        raw = await response.read()
                         try:
-                            data = json.loads(text)
-                            logger.info(f"[{case_type}] 사건번호 검색 응답: {list(data.keys())}")
+                            data = json_loads(raw)
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("[%s] 사건번호 검색 응답: %s", case_type, list(data.keys()))
 
                             # 결과 추출
                             items = self._extract_search_results(data, case_type)
@@ -485,6 +977,7 @@ class LegalAIEngine:
 
                         except json.JSONDecodeError as e:
                             logger.error(f"사건번호 검색 JSON 파싱 오류: {e}")
+                            logger.error(f"응답 내용: {raw[:500].decode('utf-8', errors='replace')}")
                     else:
                         logger.error(f"사건번호 검색 API 오류: {response.status}")
 
@@ -493,19 +986,37 @@ class LegalAIEngine:
 
         return results
 
+    @staticmethod
+    def _build_response_keys(target: str) -> tuple:
+        """target 코드로 응답 래퍼 키/데이터 키 후보 생성 (중복 제거, 순서 유지)"""
+        wrapper_keys = tuple(dict.fromkeys([
+            f'{target.capitalize()}Search',  # PrecSearch, LawSearch
+            target.capitalize(),  # Prec, Expc, Decc
+            f'{target.upper()}Search',
+            target,
+            target.lower(),
+            target.upper(),
+        ]))
+        data_keys = tuple(dict.fromkeys([
+            target.lower(),  # prec, expc, decc
+            target,
+            target.capitalize(),
+        ]))
+        return wrapper_keys, data_keys
+
+    def _get_response_keys(self, target: str) -> tuple:
+        """미리 계산된 응답 키 후보 조회 (알 수 없는 target은 즉시 생성 후 저장)"""
+        keys = self._response_keys.get(target)
+        if keys is None:
+            keys = self._response_keys[target] = self._build_response_keys(target)
+        return keys
+
     def _extract_search_results(self, data: Dict, target: str) -> List[Dict]:
         """API 응답에서 검색 결과 배열 추출"""
         results = []
 
         # API 응답 구조에서 실제 데이터 찾기
-        wrapper_keys = [
-            f'{target.capitalize()}Search',
-            target.capitalize(),
-            f'{target.upper()}Search',
-            target,
-            target.lower(),
-            target.upper(),
-        ]
+        wrapper_keys, data_keys = self._get_response_keys(target)
 
         inner_data = data
         for wkey in wrapper_keys:
@@ -516,7 +1027,6 @@ class LegalAIEngine:
                 return data[wkey]
 
         if isinstance(inner_data, dict):
-            data_keys = [target.lower(), target, target.capitalize()]
             for dkey in data_keys:
                 if dkey in inner_data:
                     value = inner_data[dkey]
@@ -524,131 +1034,15 @@ class LegalAIEngine:
                         return value
 
             # 첫 번째 리스트 찾기
-            skip_keys = {'totalCnt', 'page', 'target', 'section', '키워드',
-                        'resultMsg', 'resultCode', 'numOfRows'}
             for key, value in inner_data.items():
-                if key not in skip_keys and isinstance(value, list) and len(value) > 0:
+                if key not in SEARCH_RESULT_SKIP_KEYS and isinstance(value, list) and len(value) > 0:
                     return value
 
         return results
 
     def extract_keywords(self, user_input: str) -> List[str]:
         """사용자 입력에서 법률 관련 핵심 키워드 추출 - 법률명/조문 우선"""
-        # 불용어 정의 (일반적인 단어, 조사, 구어체 표현 등)
-        stopwords = [
-            # 조사
-            '은', '는', '이', '가', '을', '를', '의', '에', '에서', '으로', '로',
-            '와', '과', '도', '만', '뿐', '까지', '부터', '에게', '한테', '께',
-            # 어미/서술어
-            '입니다', '합니다', '있습니다', '없습니다', '됩니다', '습니다',
-            '하는', '되는', '있는', '없는', '한', '된', '할', '될',
-            '했습니다', '했다', '한다', '하다', '이다',
-            # 접속어
-            '것', '수', '때', '등', '및', '또는', '그리고', '하지만', '그러나',
-            # 의문사
-            '어떻게', '무엇', '어디', '언제', '누구', '왜', '어떤',
-            # 부사
-            '좀', '잘', '더', '매우', '정말', '아주', '너무', '많이', '현재', '지금',
-            # 대명사/지시어
-            '저', '제', '나', '내', '우리', '저희', '그', '그녀', '그들',
-            '이것', '저것', '그것', '여기', '거기', '저기',
-            # 일반 명사 (법률과 무관)
-            '현행', '해당', '요건', '확인', '검색', '관련', '판례',
-            '사람', '경우', '상황', '문제', '부분', '방법', '정도',
-            # 구어체/문장 표현
-            '있을까요', '될까요', '인가요', '일까요', '할까요', '싶습니다',
-            '엄마로써', '아빠로써', '찾아가자', '보러', '몇번', '자기에게',
-            '있다고', '한다고', '라고', '다고',
-        ]
-
-        keywords = []
-
-        # 1. 법률명 패턴 추출 (XX법, XX령, XX규칙 등) - 최우선
-        law_patterns = re.findall(r'[가-힣]+(?:법|령|규칙|조례|규정|지침|고시)', user_input)
-        for law in law_patterns:
-            if len(law) >= 3 and law not in keywords:
-                keywords.append(law)
-
-        # 2. 조문 관련 추출 (제X조, 제X항 등)
-        article_patterns = re.findall(r'제\d+조(?:의\d+)?(?:제\d+항)?', user_input)
-        keywords.extend(article_patterns)
-
-        # 3. 구체적인 법률 용어 (복합 키워드 우선)
-        specific_legal_terms = [
-            # 가족법/이혼 관련 - 중요!
-            '면접교섭권', '면접교섭', '양육권', '친권', '양육비',
-            '접근금지', '접근금지가처분', '가처분', '임시처분',
-            '이혼소송', '협의이혼', '재판이혼', '재산분할청구',
-            '위자료청구', '양육자지정', '친권자지정',
-            # 금융/대부업 관련
-            '대부업', '대부중개업', '매입채권추심업', '매입채권', '추심업',
-            '자기자본', '자본금', '등록요건', '영업요건',
-            '금융업', '여신업', '신용정보', '채권추심', '채권매입',
-            '등록기준', '허가기준', '인가기준', '자본요건',
-            # 노동법 관련
-            '부당해고', '해고무효', '부당노동행위', '근로계약',
-            '해고예고', '정리해고', '징계해고', '퇴직금청구',
-            # 부동산/임대차 관련
-            '임대차보호', '상가임대차', '주택임대차', '전세보증금',
-            '명도소송', '임대차계약', '보증금반환', '계약갱신',
-            # 민사 일반
-            '손해배상', '불법행위', '채무불이행', '계약위반',
-            '손해배상청구', '위약금', '지체상금',
-            # 개인정보/공정거래
-            '개인정보보호', '정보주체', '개인정보처리',
-            '공정거래', '독점규제', '불공정거래', '시장지배적지위',
-        ]
-
-        for term in specific_legal_terms:
-            if term in user_input and term not in keywords:
-                keywords.append(term)
-
-        # 4. 일반 법률 키워드
-        general_legal_keywords = [
-            # 가족법
-            '이혼', '양육', '친권', '면접', '교섭', '위자료', '재산분할',
-            '가처분', '임시', '처분', '접근', '금지', '배우자', '자녀',
-            '상속', '유언', '증여', '유류분',
-            # 노동법
-            '해고', '임금', '퇴직금', '근로', '노동', '계약', '위반',
-            # 민사
-            '손해배상', '불법행위', '계약해지', '계약해제',
-            '임대차', '전세', '월세', '보증금', '명도', '인도',
-            # 소송
-            '형사', '민사', '행정', '소송', '재판', '항소', '상고', '판결',
-            # 형사
-            '사기', '횡령', '배임', '폭행', '상해', '명예훼손',
-            # 지재권
-            '저작권', '특허', '상표', '영업비밀', '지식재산',
-            '개인정보', '정보보호', '프라이버시',
-            # 조세
-            '세금', '조세', '부가세', '소득세', '법인세', '상속세', '증여세',
-            # 행정
-            '건축', '인허가', '허가', '신고', '등록', '면허',
-            # 기타
-            '교통사고', '산재', '산업재해', '보험', '보상',
-            '파산', '회생', '도산', '채무', '채권', '담보', '저당', '압류',
-            '해제', '취소', '무효', '철회', '해지',
-            '위임', '대리', '보증', '연대보증'
-        ]
-
-        for kw in general_legal_keywords:
-            if kw in user_input and kw not in keywords:
-                keywords.append(kw)
-
-        # 5. 남은 명사 추출 (2글자 이상, 4글자 이상 우선)
-        words = re.findall(r'[가-힣]{2,}', user_input)
-        long_words = [w for w in words if len(w) >= 4]
-        short_words = [w for w in words if len(w) >= 2 and len(w) < 4]
-
-        for word in long_words + short_words:
-            is_stopword = any(word.endswith(sw) or word == sw for sw in stopwords)
-            if not is_stopword and word not in keywords:
-                keywords.append(word)
-
-        # 6. 중복 제거 및 상위 키워드 반환
-        unique_keywords = list(dict.fromkeys(keywords))
-        return unique_keywords[:10]  # 최대 10개 키워드
+        return list(_extract_keywords_cached(user_input))
 
     def analyze_query_with_ai(self, user_input: str) -> Dict:
         """AI를 사용하여 사용자 질의 의도 파악 및 검색 키워드 생성
@@ -836,11 +1230,11 @@ class LegalAIEngine:
 
             except (json.JSONDecodeError, ValueError) as e:
                 logger.warning(f"AI 응답 JSON 파싱 실패: {e}, 응답: {result_text[:200]}")
-                return default_result
+                return {**default_result, 'is_fallback': True}
 
         except Exception as e:
             logger.error(f"AI 의도 분석 오류: {e}")
-            return default_result
+            return {**default_result, 'is_fallback': True}
 
     def _analyze_no_results(self, query: str, ai_analysis: Dict, search_queries: List[str], search_options: Dict) -> Dict:
         """검색 결과가 없을 때 AI가 원인을 분석하여 설명
@@ -1063,15 +1457,52 @@ class LegalAIEngine:
 
         return results  # 오류 시 원본 반환
 
+    @property
+    def law_api_key(self) -> str:
+        """법제처 API 키 (엔진이 세션에 캐시되므로 사이드바 입력 변경을 매번 반영)"""
+        return get_law_api_key()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """HTTP 세션 반환 (커넥션 풀/DNS 캐시 재사용)
+
+        공유 백그라운드 루프에서는 앱 전체 공용 세션을 사용하고,
+        그 외 루프(단독 asyncio.run 등)에서는 해당 루프에 묶인 전용 세션을 생성
+        """
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # 세마포어/전용 세션은 루프에 묶이므로 루프가 바뀌면 새로 준비
+            self._session_loop = loop
+            self._session = None
+            self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        if loop is self._shared_loop and not self._shared_session.closed:
+            return self._shared_session
+        if self._session is None or self._session.closed:
+            self._session = create_http_session()
+        return self._session
+
+    async def close(self):
+        """전용 HTTP 세션 종료 (앱 전체 공용 세션은 앱 수명 동안 유지)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        self._request_semaphore = None
+
     async def _search_by_target(self, session, query: str, target: str,
                                 display: int = 10) -> List[Dict]:
         """특정 target으로 검색"""
-        # API 키 재확인
-        api_key = self.law_api_key or get_law_api_key()
+        # API 키 확인
+        api_key = self.law_api_key
         if not api_key:
             logger.warning(f"법제처 API 키가 없습니다. ({target} 검색 불가)")
             return []
 
+        # 같은 (target, 검색어, 건수) 요청은 유효 시간 동안 공유 캐시에서 반환
+        cache_key = (target, query, display)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         params = {
             'OC': api_key,
             'target': target,
@@ -1081,88 +1512,174 @@ class LegalAIEngine:
         }
 
         try:
-            async with session.get(
-                self.api_endpoints['search'],
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    try:
-                        data = json.loads(text)
-                        logger.info(f"[{target}] API 응답 키: {list(data.keys())}")
-
-                        # 결과 추출 - 다양한 응답 형식 처리
-                        results = []
-
-                        # API 응답 구조: {'PrecSearch': {'prec': [...], '키워드': '...'}}
-                        # 또는 {'Expc': {'expc': [...], ...}}
-
-                        # 1. 최상위 래퍼 키 확인 (PrecSearch, LawSearch, Expc, Decc 등)
-                        wrapper_keys = [
-                            f'{target.capitalize()}Search',  # PrecSearch, LawSearch
-                            target.capitalize(),  # Prec, Expc, Decc
-                            f'{target.upper()}Search',
-                            target,
-                            target.lower(),
-                            target.upper(),
-                        ]
-
-                        inner_data = data
-                        for wkey in wrapper_keys:
-                            if wkey in data and isinstance(data[wkey], dict):
-                                inner_data = data[wkey]
-                                break
-                            elif wkey in data and isinstance(data[wkey], list):
-                                results = data[wkey]
-                                break
-
-                        # 2. inner_data에서 실제 데이터 배열 추출
-                        if not results and isinstance(inner_data, dict):
-                            # target 이름과 일치하는 키에서 배열 찾기
-                            data_keys = [
-                                target.lower(),  # prec, expc, decc
-                                target,
-                                target.capitalize(),
-                            ]
-
-                            for dkey in data_keys:
-                                if dkey in inner_data:
-                                    value = inner_data[dkey]
-                                    if isinstance(value, list) and len(value) > 0:
-                                        results = value
-                                        break
-
-                            # 3. 그래도 없으면 inner_data에서 첫 번째 리스트 찾기
-                            if not results:
-                                skip_keys = {'totalCnt', 'page', 'target', 'section', '키워드',
-                                           'resultMsg', 'resultCode', 'numOfRows'}
-                                for key, value in inner_data.items():
-                                    if key not in skip_keys:
-                                        if isinstance(value, list) and len(value) > 0:
-                                            results = value
-                                            break
-
-                        logger.info(f"[{target}] 검색 결과: {len(results)}건 (쿼리: {query})")
-                        # 디버깅: 첫 번째 결과의 구조 출력
-                        if results and len(results) > 0:
-                            first_item = results[0]
-                            logger.info(f"[{target}] 첫 번째 결과 키: {list(first_item.keys()) if isinstance(first_item, dict) else type(first_item)}")
-                            logger.info(f"[{target}] 첫 번째 결과 내용: {str(first_item)[:500]}")
-                        return results
-
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON 파싱 오류 ({target}): {e}")
-                        logger.error(f"응답 내용: {text[:500]}")
-                        return []
-                else:
-                    logger.error(f"API 응답 오류 ({target}): 상태코드 {response.status}")
+            # 동시 요청 수 제한 + 일시적 오류 시 지수 백오프 재시도
+            async with self._request_semaphore:
+                for attempt in range(API_MAX_RETRIES):
+                    async with session.get(
+                        self.api_endpoints['search'],
+                        params=params,
+                        timeout=aiohttp.ClientTimeout(total=30)
+                    ) as response:
+                        if (response.status in RETRYABLE_STATUS_CODES
+                                and attempt < API_MAX_RETRIES - 1):
+                            delay = API_RETRY_BACKOFF * 2 ** attempt
+                            logger.warning(f"API 일시 오류 ({target}): 상태코드 {response.status}, {delay:.1f}초 후 재시도")
+                            await asyncio.sleep(delay)
+                            continue
+                        if response.status == 200:
+                            raw = await response.read()
+                            try:
+                                # 항목은 필드 축소(projection) 없이 전체를 유지:
+                                # AI 필터 요약, _get_value/_get_item_display의 대체 필드 탐색,
+                                # 상세 링크/일련번호 기반 중복 제거가 목록에 없는 필드까지 참조함
+                                data = json_loads(raw)
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("[%s] API 응답 키: %s", target, list(data.keys()))
+
+                                # 결과 추출 - 학습된 응답 경로 우선, 없으면 탐색
+                                results = self._find_search_results(data, target)
+
+                                logger.info(f"[{target}] 검색 결과: {len(results)}건 (쿼리: {query})")
+                                # 디버깅: 첫 번째 결과의 구조 출력 (DEBUG 레벨일 때만 문자열 생성)
+                                if results and logger.isEnabledFor(logging.DEBUG):
+                                    first_item = results[0]
+                                    logger.debug("[%s] 첫 번째 결과 키: %s", target,
+                                                 list(first_item.keys()) if isinstance(first_item, dict) else type(first_item))
+                                    logger.debug("[%s] 첫 번째 결과 내용: %.500s", target, first_item)
+                                # 결과가 있을 때만 캐시 (빈 응답은 키 오류/일시 장애일 수 있음)
+                                if results:
+                                    self._store_cached_response(cache_key, results)
+                                return results
+
+                            except json.JSONDecodeError as e:
+                                logger.error(f"JSON 파싱 오류 ({target}): {e}")
+                                logger.error(f"응답 내용: {raw[:500].decode('utf-8', errors='replace')}")
+                                return []
+                        else:
+                            logger.error(f"API 응답 오류 ({target}): 상태코드 {response.status}")
+                        break
         except asyncio.TimeoutError:
             logger.error(f"API 타임아웃 ({target})")
         except Exception as e:
             logger.error(f"검색 오류 ({target}): {e}")
         return []
 
+    def _get_cached_response(self, cache_key: tuple) -> Optional[List[Dict]]:
+        """공유 검색 응답 캐시 조회 (만료 시 제거, 호출자가 목록을 수정해도 안전하도록 복사본 반환)"""
+        entry = self._response_cache.get(cache_key)
+        if entry is None:
+            return self._load_persisted_response(cache_key)
+        stored_at, results = entry
+        if time.monotonic() - stored_at > SEARCH_RESPONSE_CACHE_TTL:
+            del self._response_cache[cache_key]
+            return None
+        self._response_cache.move_to_end(cache_key)
+        return list(results)
+
+    def _store_cached_response(self, cache_key: tuple, results: List[Dict]):
+        """공유 검색 응답 캐시에 저장 (가장 오래 사용되지 않은 항목부터 제거, 디스크 캐시에도 기록)"""
+        self._response_cache[cache_key] = (time.monotonic(), list(results))
+        self._response_cache.move_to_end(cache_key)
+        if len(self._response_cache) > SEARCH_RESPONSE_CACHE_MAX_SIZE:
+            self._response_cache.popitem(last=False)
+
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache[self._disk_cache_key(cache_key)] = (time.time(), list(results))
+                self._disk_cache.sync()
+            except Exception as e:
+                logger.warning(f"검색 응답 디스크 캐시 저장 실패: {e}")
+
+    @staticmethod
+    def _disk_cache_key(cache_key: tuple) -> str:
+        """(target, query, display) 키를 디스크 캐시용 문자열 키로 변환"""
+        return json.dumps(cache_key, ensure_ascii=False)
+
+    def _load_persisted_response(self, cache_key: tuple) -> Optional[List[Dict]]:
+        """디스크 캐시 조회 - 유효한 항목이면 메모리 캐시로 올리고 복사본 반환"""
+        if self._disk_cache is None:
+            return None
+        disk_key = self._disk_cache_key(cache_key)
+        try:
+            entry = self._disk_cache.get(disk_key)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.time() - stored_at > SEARCH_RESPONSE_DISK_CACHE_TTL or not isinstance(results, list):
+                del self._disk_cache[disk_key]
+                return None
+        except Exception as e:
+            logger.warning(f"검색 응답 디스크 캐시 조회 실패: {e}")
+            return None
+
+        self._response_cache[cache_key] = (time.monotonic(), results)
+        if len(self._response_cache) > SEARCH_RESPONSE_CACHE_MAX_SIZE:
+            self._response_cache.popitem(last=False)
+        return list(results)
+
+    def _find_search_results(self, data: Dict, target: str) -> List[Dict]:
+        """응답에서 결과 배열 추출 - target별로 한 번 찾은 경로를 기억해 바로 접근"""
+        path = self._learned_paths.get(target)
+        if path is not None:
+            value = data
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            if isinstance(value, list) and value:
+                return value
+
+        results, path = self._probe_search_results(data, target)
+        if results and path:
+            self._learned_paths[target] = path
+        return results
+
+    def _probe_search_results(self, data: Dict, target: str) -> tuple:
+        """응답 구조를 탐색하여 (결과 배열, 키 경로) 반환 - 다양한 응답 형식 처리
+
+        키 경로는 래퍼 키/데이터 키로 찾은 경우에만 반환 (첫 번째 리스트 대체 탐색은 빈 경로)
+        """
+        results = []
+        path = ()
+
+        # API 응답 구조: {'PrecSearch': {'prec': [...], '키워드': '...'}}
+        # 또는 {'Expc': {'expc': [...], ...}}
+
+        # 1. 최상위 래퍼 키 확인 (PrecSearch, LawSearch, Expc, Decc 등)
+        wrapper_keys, data_keys = self._get_response_keys(target)
+
+        inner_data = data
+        wrapper_path = ()
+        for wkey in wrapper_keys:
+            if wkey in data and isinstance(data[wkey], dict):
+                inner_data = data[wkey]
+                wrapper_path = (wkey,)
+                break
+            elif wkey in data and isinstance(data[wkey], list):
+                results = data[wkey]
+                path = (wkey,)
+                break
+
+        # 2. inner_data에서 실제 데이터 배열 추출
+        if not results and isinstance(inner_data, dict):
+            # target 이름과 일치하는 키에서 배열 찾기
+            for dkey in data_keys:
+                if dkey in inner_data:
+                    value = inner_data[dkey]
+                    if isinstance(value, list) and len(value) > 0:
+                        results = value
+                        path = wrapper_path + (dkey,)
+                        break
+
+            # 3. 그래도 없으면 inner_data에서 첫 번째 리스트 찾기
+            # (응답마다 달라질 수 있는 우연한 경로이므로 기억하지 않음)
+            if not results:
+                for key, value in inner_data.items():
+                    if key not in SEARCH_RESULT_SKIP_KEYS:
+                        if isinstance(value, list) and len(value) > 0:
+                            results = value
+                            break
+
+        return results, path
+
     async def search_basic_legal_data(self, query: str, search_queries: List[str] = None) -> Dict:
         """기본 법률 데이터 검색 (법령, 판례, 행정규칙 등) - AI 검색어 기반
 
@@ -1181,66 +1698,91 @@ class LegalAIEngine:
             'trty': 20,       # 조약 - 증가
         }
 
-        all_results = {target: [] for target in self.basic_targets.keys()}
-
-        # 메인 쿼리로 검색
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for target_code in self.basic_targets.keys():
-                display = display_counts.get(target_code, 20)
-                tasks.append(self._search_by_target(session, query, target_code, display))
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        all_results = {target: [] for target in self._basic_target_codes}
 
-            for idx, target_code in enumerate(self.basic_targets.keys()):
-                if not isinstance(results[idx], Exception) and results[idx]:
-                    all_results[target_code].extend(results[idx])
-
-        # AI가 생성한 추가 검색어로 확장 검색 (판례, 법령해석례, 행정심판례, 법령 대상)
-        # 1차 자료 확보를 위해 더 많은 검색어 활용
+        # 메인 쿼리 + AI 생성 추가 검색어의 고유한 (검색어, target) 조합을 먼저 구성
+        # (판례, 법령해석례, 행정심판례, 법령 대상 확장 - 1차 자료 확보를 위해 더 많은 검색어 활용)
+        # 중복 검색어는 한 번만 요청하고, 같은 조합이면 더 큰 display 사용
+        distinct_pairs = {(query, target_code): display_counts.get(target_code, 20)
+                          for target_code in self._basic_target_codes}
         if search_queries:
             important_targets = ['prec', 'expc', 'decc', 'detc', 'law', 'eflaw', 'admrul']
             for search_query in search_queries[:7]:  # 상위 7개 검색어까지 확장
                 if search_query != query:  # 메인 쿼리와 다른 경우만
-                    async with aiohttp.ClientSession() as session:
-                        tasks = []
-                        for target_code in important_targets:
-                            tasks.append(self._search_by_target(session, search_query, target_code, 30))
-
-                        kw_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                        for idx, target_code in enumerate(important_targets):
-                            if not isinstance(kw_results[idx], Exception) and kw_results[idx]:
-                                # 중복 제거하며 추가
-                                existing_ids = {item.get('판례일련번호', item.get('안건번호', item.get('사건번호', '')))
-                                              for item in all_results[target_code]}
-                                for item in kw_results[idx]:
-                                    item_id = item.get('판례일련번호', item.get('안건번호', item.get('사건번호', '')))
-                                    if item_id and item_id not in existing_ids:
-                                        all_results[target_code].append(item)
-                                        existing_ids.add(item_id)
+                    for target_code in important_targets:
+                        pair = (search_query, target_code)
+                        distinct_pairs[pair] = max(distinct_pairs.get(pair, 0), 30)
+        pairs = list(distinct_pairs.items())
+
+        # 모든 요청을 단일 gather로 병렬 실행 (검색어별 순차 대기 제거)
+        session = await self._get_session()
+        results = await asyncio.gather(
+            *[self._search_by_target(session, q, t, d) for (q, t), d in pairs],
+            return_exceptions=True
+        )
+
+        # target별 수집 ID 집합 (키워드별로 기존 결과를 다시 훑지 않도록 증분 갱신)
+        existing_ids = {target: set() for target in all_results}
+        for ((search_query, target_code), _), result in zip(pairs, results):
+            if isinstance(result, Exception) or not result:
+                continue
+            target_ids = existing_ids[target_code]
+            if search_query == query:
+                all_results[target_code].extend(result)
+                target_ids.update(map(self._item_id, result))
+                continue
+            # 중복 제거하며 추가
+            for item in result:
+                item_id = self._item_id(item)
+                if item_id and item_id not in target_ids:
+                    all_results[target_code].append(item)
+                    target_ids.add(item_id)
 
         return all_results
 
+    # 항목 ID 키 우선순위 (앞의 키부터 확인)
+    ITEM_ID_KEYS = ('판례일련번호', '안건번호', '사건번호')
+    SERIAL_ID_KEYS = ('판례일련번호', '법령해석례일련번호', '행정심판례일련번호', '일련번호')
+    CASE_NUMBER_SERIAL_ID_KEYS = ('판례일련번호', '법령해석례일련번호', '행정심판재결례일련번호')
+
+    @staticmethod
+    def _first_present(item: Dict, keys: tuple, default=''):
+        """keys 중 item에 먼저 있는 키의 값 반환 (중첩 get과 달리 뒤쪽 키는 조회하지 않음)"""
+        for key in keys:
+            if key in item:
+                return item[key]
+        return default
+
+    @classmethod
+    def _item_id(cls, item: Dict) -> str:
+        """중복 제거용 항목 ID (판례일련번호 → 안건번호 → 사건번호, 값이 비어 있으면 다음 키)"""
+        for key in cls.ITEM_ID_KEYS:
+            value = item.get(key)
+            if value:
+                return value
+        return ''
+
+    @classmethod
+    def _serial_id(cls, item: Dict):
+        """일련번호 (판례 → 법령해석례 → 행정심판례 → 일련번호, 먼저 있는 키 기준)"""
+        return cls._first_present(item, cls.SERIAL_ID_KEYS)
+
     async def search_committee_decisions(self, query: str,
                                         selected_committees: List[str] = None) -> Dict:
         """위원회 결정문 검색"""
         if selected_committees is None:
-            selected_committees = list(self.committee_targets.keys())
+            selected_committees = self._committee_target_codes
 
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for committee in selected_committees:
-                if committee in self.committee_targets:
-                    tasks.append(self._search_by_target(session, query, committee, 10))
+        session = await self._get_session()
+        valid_committees = [c for c in selected_committees if c in self.committee_targets]
+        tasks = [self._search_by_target(session, query, c, 10) for c in valid_committees]
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            valid_committees = [c for c in selected_committees if c in self.committee_targets]
-            return {
-                valid_committees[idx]: results[idx] if not isinstance(results[idx], Exception) else []
-                for idx in range(len(valid_committees))
-            }
+        return {
+            committee: result if not isinstance(result, Exception) else []
+            for committee, result in zip(valid_committees, results)
+        }
 
     async def search_ministry_interpretations(self, query: str,
                                              selected_ministries: List[str] = None) -> Dict:
@@ -1252,33 +1794,30 @@ class LegalAIEngine:
                 'mohwCgmExpc', 'molegCgmExpc'
             ]
 
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for ministry in selected_ministries:
-                if ministry in self.ministry_targets:
-                    tasks.append(self._search_by_target(session, query, ministry, 10))
+        session = await self._get_session()
+        valid_ministries = [m for m in selected_ministries if m in self.ministry_targets]
+        tasks = [self._search_by_target(session, query, m, 10) for m in valid_ministries]
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            valid_ministries = [m for m in selected_ministries if m in self.ministry_targets]
-            return {
-                valid_ministries[idx]: results[idx] if not isinstance(results[idx], Exception) else []
-                for idx in range(len(valid_ministries))
-            }
+        return {
+            ministry: result if not isinstance(result, Exception) else []
+            for ministry, result in zip(valid_ministries, results)
+        }
 
     async def search_special_tribunals(self, query: str) -> Dict:
         """특별행정심판례 검색"""
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for target_code in self.special_tribunal_targets.keys():
-                tasks.append(self._search_by_target(session, query, target_code, 10))
+        session = await self._get_session()
+        tasks = []
+        for target_code in self._special_tribunal_codes:
+            tasks.append(self._search_by_target(session, query, target_code, 10))
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            return {
-                target_code: results[idx] if not isinstance(results[idx], Exception) else []
-                for idx, target_code in enumerate(self.special_tribunal_targets.keys())
-            }
+        return {
+            target_code: result if not isinstance(result, Exception) else []
+            for target_code, result in zip(self._special_tribunal_codes, results)
+        }
 
     async def comprehensive_search(self, query: str,
                                   search_options: Dict = None) -> Dict:
@@ -1297,16 +1836,60 @@ class LegalAIEngine:
                 'search_mode': 'case_search'  # 기본값
             }
 
+        # 동일 질의/옵션 재검색 시 캐시 사용 (엔진 코루틴은 모두 공유 루프 스레드에서 실행되므로 잠금 불필요)
+        cache = self._search_cache
+        cache_key = self._search_cache_key(query, search_options)
+        entry = cache.get(cache_key)
+        if entry is not None:
+            stored_at, cached_results = entry
+            if time.monotonic() - stored_at <= SEARCH_CACHE_TTL:
+                cache.move_to_end(cache_key)
+                logger.info(f"검색 캐시 사용: {query}")
+                return cached_results
+            del cache[cache_key]
+
         # 검색 모드 확인
         search_mode = search_options.get('search_mode', 'case_search')
         logger.info(f"=== 검색 모드: {search_mode} ===")
 
         # 사건번호 검색 모드: 사건번호로만 검색
         if search_mode == 'case_number':
-            return await self._search_by_case_number_mode(query, search_options)
+            results = await self._search_by_case_number_mode(query, search_options)
+        else:
+            # 사건 검색 모드: AI 의도 분석 → 여러 방면으로 대량 수집 → AI 필터링
+            results = await self._search_by_case_search_mode(query, search_options)
 
-        # 사건 검색 모드: AI 의도 분석 → 여러 방면으로 대량 수집 → AI 필터링
-        return await self._search_by_case_search_mode(query, search_options)
+        # 결과가 있고 AI 분석/필터링이 오류 대체 경로를 타지 않았을 때만 캐시
+        # (API 키 누락/일시 오류로 인한 빈 결과나 미필터링 결과는 재시도 가능하도록)
+        if self._has_any_results(results) and not self._used_error_fallback(results):
+            cache[cache_key] = (time.monotonic(), results)
+            if len(cache) > SEARCH_CACHE_MAX_SIZE:
+                cache.popitem(last=False)
+
+        return results
+
+    @staticmethod
+    def _search_cache_key(query: str, search_options: Dict) -> tuple:
+        """검색 캐시 키 생성 (질의 + 검색 옵션 + AI 사용 가능 여부)"""
+        options = tuple(sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in search_options.items()
+        ))
+        return (query, options, bool(get_openai_api_key()))
+
+    @staticmethod
+    def _has_any_results(results: Dict) -> bool:
+        """검색 결과가 1건 이상 있는지 확인"""
+        for group in ('basic', 'committees', 'ministries', 'special_tribunals'):
+            if any((results.get(group) or {}).values()):
+                return True
+        return False
+
+    @staticmethod
+    def _used_error_fallback(results: Dict) -> bool:
+        """AI 의도 분석 또는 AI 필터링이 일시 오류로 기본값/원본 결과를 사용했는지 확인"""
+        return bool((results.get('ai_analysis') or {}).get('is_fallback')
+                    or (results.get('filter_result') or {}).get('is_fallback'))
 
     async def _search_by_case_number_mode(self, query: str, search_options: Dict) -> Dict:
         """사건번호 검색 모드: 사건번호/안건번호로 직접 검색"""
@@ -1356,6 +1939,36 @@ class LegalAIEngine:
 
         return results
 
+    async def _run_search_tasks(self, tasks: List, results: Dict):
+        """(결과 키, 코루틴) 목록을 병렬 실행하여 results에 저장 (실패 시 빈 dict)"""
+        if not tasks:
+            return
+        keys, coros = zip(*tasks)
+        gathered = await asyncio.gather(*coros, return_exceptions=True)
+        for key, result in zip(keys, gathered):
+            if isinstance(result, Exception):
+                logger.error(f"검색 오류 ({key}): {result}")
+                results[key] = {}
+            else:
+                results[key] = result
+
+    async def _search_basic_for_queries(self, queries: List[str]) -> List[Dict]:
+        """검색어별 기본 법률 데이터 검색 결과 목록 (실패한 검색어는 제외)
+
+        모든 검색어를 한 번에 병렬 실행 (검색어별 순차 대기 제거, 동시 요청 수는 세마포어로 제한)
+        """
+        gathered = await asyncio.gather(
+            *[self.search_basic_legal_data(search_query, []) for search_query in queries],
+            return_exceptions=True
+        )
+        basic_results_list = []
+        for result in gathered:
+            if isinstance(result, Exception):
+                logger.error(f"기본 검색 오류: {result}")
+            else:
+                basic_results_list.append(result)
+        return basic_results_list
+
     async def _search_by_keyword_mode(self, query: str, search_options: Dict) -> Dict:
         """검색어 검색 모드: AI 분석 없이 단순 키워드 검색"""
         logger.info("=== 검색어 검색 모드 ===")
@@ -1406,12 +2019,7 @@ class LegalAIEngine:
             tasks.append(('special_tribunals', self.search_special_tribunals(query)))
 
         # 병렬 실행
-        for key, task in tasks:
-            try:
-                results[key] = await task
-            except Exception as e:
-                logger.error(f"검색 오류 ({key}): {e}")
-                results[key] = {}
+        await self._run_search_tasks(tasks, results)
 
         return results
 
@@ -1424,22 +2032,27 @@ class LegalAIEngine:
         case_number_results = {}
         case_number_serial_ids = set()  # 사건번호로 직접 검색된 결과 ID 저장 (필터링 제외용)
 
+        # 1. AI 질의 분석(동기 OpenAI 호출)은 스레드에서 실행해 사건번호 직접 검색과 겹치게 함
+        analysis_task = asyncio.to_thread(self.analyze_query_with_ai, query)
+
         if case_info.get('type'):
             logger.info(f"=== 사건번호 감지됨: {case_info['case_numbers']} ===")
-            case_number_results = await self.search_by_case_number(case_info)
+            case_number_results, ai_analysis = await asyncio.gather(
+                self.search_by_case_number(case_info), analysis_task
+            )
             case_count = sum(len(v) for v in case_number_results.values())
             logger.info(f"사건번호 직접 검색 결과: {case_count}건")
 
             # 사건번호로 검색된 결과의 ID 저장 (AI 필터링에서 제외하기 위해)
             for case_type, items in case_number_results.items():
                 for item in items:
-                    serial_id = item.get('판례일련번호', item.get('법령해석례일련번호',
-                                item.get('행정심판례일련번호', item.get('일련번호', ''))))
+                    serial_id = self._serial_id(item)
                     if serial_id:
                         case_number_serial_ids.add(str(serial_id))
+        else:
+            ai_analysis = await analysis_task
 
-        # 1. AI를 사용하여 질의 의도 분석 및 검색 키워드 생성
-        ai_analysis = self.analyze_query_with_ai(query)
+        # AI 분석 결과에서 검색 키워드 추출
         keywords = ai_analysis.get('keywords', [])
         search_queries = ai_analysis.get('search_queries', [query])
         law_names = ai_analysis.get('law_names', [])
@@ -1484,56 +2097,46 @@ class LegalAIEngine:
         all_queries = [query] + [q for q in search_queries if q != query][:5]
         logger.info(f"확장 검색어: {all_queries}")
 
-        # 기본 법률 데이터 대량 검색
+        # 기본 법률 데이터 대량 검색 + 위원회/부처/특별행정심판 검색을 동시에 실행
+        tasks = []
         if search_options.get('basic', True):
-            for search_query in all_queries:
-                try:
-                    basic_results = await self.search_basic_legal_data(search_query, [])
-                    # 결과 병합 (중복 제거)
-                    for key, items in basic_results.items():
-                        if items:
-                            if key not in results['basic']:
-                                results['basic'][key] = []
-                            existing_ids = set()
-                            for existing in results['basic'][key]:
-                                item_id = existing.get('판례일련번호', existing.get('법령해석례일련번호',
-                                            existing.get('행정심판례일련번호', existing.get('일련번호', ''))))
-                                if item_id:
-                                    existing_ids.add(str(item_id))
-                            for item in items:
-                                item_id = item.get('판례일련번호', item.get('법령해석례일련번호',
-                                            item.get('행정심판례일련번호', item.get('일련번호', ''))))
-                                if str(item_id) not in existing_ids:
-                                    results['basic'][key].append(item)
-                                    if item_id:
-                                        existing_ids.add(str(item_id))
-                except Exception as e:
-                    logger.error(f"기본 검색 오류: {e}")
+            tasks.append(('basic', self._search_basic_for_queries(all_queries)))
 
         # 위원회 결정문 검색
         committees = search_options.get('committees', [])
         if committees:
-            try:
-                committee_results = await self.search_committee_decisions(query, committees)
-                results['committees'] = committee_results
-            except Exception as e:
-                logger.error(f"위원회 검색 오류: {e}")
+            tasks.append(('committees', self.search_committee_decisions(query, committees)))
 
         # 부처별 법령해석 검색
         ministries = search_options.get('ministries', [])
         if ministries:
-            try:
-                ministry_results = await self.search_ministry_interpretations(query, ministries)
-                results['ministries'] = ministry_results
-            except Exception as e:
-                logger.error(f"부처 검색 오류: {e}")
+            tasks.append(('ministries', self.search_ministry_interpretations(query, ministries)))
 
         # 특별행정심판례 검색
         if search_options.get('special_tribunals', False):
-            try:
-                results['special_tribunals'] = await self.search_special_tribunals(query)
-            except Exception as e:
-                logger.error(f"특별심판 검색 오류: {e}")
+            tasks.append(('special_tribunals', self.search_special_tribunals(query)))
+
+        category_results = {}
+        await self._run_search_tasks(tasks, category_results)
+
+        # 기본 법률 데이터: 검색어별 결과 병합 (중복 제거)
+        # target별 ID 집합은 처음 한 번만 만들고 이후 추가 항목으로 증분 갱신
+        seen_ids_by_key = {}
+        for basic_results in category_results.pop('basic', None) or []:
+            for key, items in basic_results.items():
+                if items:
+                    merged = results['basic'].setdefault(key, [])
+                    existing_ids = seen_ids_by_key.get(key)
+                    if existing_ids is None:
+                        existing_ids = {str(item_id) for item_id in map(self._serial_id, merged) if item_id}
+                        seen_ids_by_key[key] = existing_ids
+                    for item in items:
+                        item_id = self._serial_id(item)
+                        if str(item_id) not in existing_ids:
+                            merged.append(item)
+                            if item_id:
+                                existing_ids.add(str(item_id))
+        results.update(category_results)
 
         # 3. 수집된 결과 통계
         total_count = 0
@@ -1548,7 +2151,10 @@ class LegalAIEngine:
         # 4. 검색 결과가 없는 경우 AI가 원인 분석
         if total_count == 0:
             logger.info("검색 결과 없음 - AI 원인 분석 시작...")
-            no_result_analysis = self._analyze_no_results(query, ai_analysis, all_queries, search_options)
+            # 동기 OpenAI 호출은 스레드에서 실행 (공유 루프에서 다른 세션의 API 요청이 멈추지 않도록)
+            no_result_analysis = await asyncio.to_thread(
+                self._analyze_no_results, query, ai_analysis, all_queries, search_options
+            )
             results['no_result_analysis'] = no_result_analysis
             logger.info(f"검색 실패 원인 분석 완료")
             return results
@@ -1556,7 +2162,7 @@ class LegalAIEngine:
         # 5. AI 필터링 적용 (2단계: 관련성 낮은 자료 배제)
         if total_count > 0:
             logger.info("AI 필터링 시작 (2단계: 관련성 없는 자료만 배제)...")
-            results = self.filter_results_with_ai(query, results, max_results=30)
+            results = await asyncio.to_thread(self.filter_results_with_ai, query, results, max_results=30)
             logger.info(f"필터링 후 결과: {results.get('filtered_count', total_count)}건")
             results['search_phase_stats'] = {
                 'phase1_collected': total_count,
@@ -1682,12 +2288,7 @@ class LegalAIEngine:
                 tasks.append(('special_tribunals', self.search_special_tribunals(primary_query)))
 
             # 병렬 실행
-            for key, task in tasks:
-                try:
-                    results[key] = await task
-                except Exception as e:
-                    logger.error(f"검색 오류 ({key}): {e}")
-                    results[key] = {}
+            await self._run_search_tasks(tasks, results)
         else:
             logger.info("사건번호 전용 검색: 일반 키워드 검색 건너뜀")
 
@@ -1700,14 +2301,12 @@ class LegalAIEngine:
                     # 기존 결과와 병합 (사건번호 검색 결과 우선)
                     existing_ids = set()
                     for item in results['basic'][case_type]:
-                        item_id = item.get('판례일련번호', item.get('법령해석례일련번호',
-                                  item.get('행정심판재결례일련번호', '')))
+                        item_id = self._first_present(item, self.CASE_NUMBER_SERIAL_ID_KEYS)
                         if item_id:
                             existing_ids.add(str(item_id))
 
                     for item in items:
-                        item_id = item.get('판례일련번호', item.get('법령해석례일련번호',
-                                  item.get('행정심판재결례일련번호', '')))
+                        item_id = self._first_present(item, self.CASE_NUMBER_SERIAL_ID_KEYS)
                         if not item_id or str(item_id) not in existing_ids:
                             results['basic'][case_type].insert(0, item)  # 앞에 추가
                             if item_id:
@@ -1759,7 +2358,13 @@ class LegalAIEngine:
         return results
 
     async def get_detail(self, target: str, item_id: str) -> Dict:
-        """상세 정보 조회"""
+        """상세 정보 조회 (동일 문서는 캐시 재사용 - 문서 내용은 ID별로 불변)"""
+        cache_key = (target, item_id)
+        cached = self._detail_cache.get(cache_key)
+        if cached is not None:
+            self._detail_cache.move_to_end(cache_key)
+            return cached
+
         params = {
             'OC': self.law_api_key,
             'target': target,
@@ -1768,14 +2373,20 @@ class LegalAIEngine:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            session = await self._get_session()
+            async with self._request_semaphore:
                 async with session.get(
                     self.api_endpoints['service'],
                     params=params,
                     timeout=aiohttp.ClientTimeout(total=15)
                 ) as response:
                     if response.status == 200:
-                        return await response.json()
+                        detail = json_loads(await response.read())
+                        if detail:
+                            self._detail_cache[cache_key] = detail
+                            if len(self._detail_cache) > DETAIL_CACHE_MAX_SIZE:
+                                self._detail_cache.popitem(last=False)
+                        return detail
         except Exception as e:
             logger.error(f"상세 조회 오류: {e}")
         return {}
@@ -1804,50 +2415,42 @@ class LegalAIEngine:
             case_type = self._get_value(data, '사건종류명', 'caseTypeName')
             verdict_type = self._get_value(data, '판결유형', 'verdictType')
 
-            md_content.append(f"# {title or '판례'}")
-            md_content.append("")
-            md_content.append("## 기본 정보")
-            md_content.append(f"- **사건번호**: {case_no or '-'}")
-            md_content.append(f"- **법원**: {court or '-'}")
-            md_content.append(f"- **선고일자**: {date or '-'}")
-            md_content.append(f"- **사건종류**: {case_type or '-'}")
-            md_content.append(f"- **판결유형**: {verdict_type or '-'}")
-            md_content.append("")
+            md_content.extend((
+                f"# {title or '판례'}",
+                "",
+                "## 기본 정보",
+                f"- **사건번호**: {case_no or '-'}",
+                f"- **법원**: {court or '-'}",
+                f"- **선고일자**: {date or '-'}",
+                f"- **사건종류**: {case_type or '-'}",
+                f"- **판결유형**: {verdict_type or '-'}",
+                "",
+            ))
 
             # 판시사항
             summary = self._get_value(data, '판시사항', 'judgmentSummary')
             if summary:
-                md_content.append("## 판시사항")
-                md_content.append(self._clean_html(summary))
-                md_content.append("")
+                md_content.extend(("## 판시사항", self._clean_html(summary), ""))
 
             # 판결요지
             gist = self._get_value(data, '판결요지', 'judgmentGist')
             if gist:
-                md_content.append("## 판결요지")
-                md_content.append(self._clean_html(gist))
-                md_content.append("")
+                md_content.extend(("## 판결요지", self._clean_html(gist), ""))
 
             # 참조조문
             ref_law = self._get_value(data, '참조조문', 'referenceLaw')
             if ref_law:
-                md_content.append("## 참조조문")
-                md_content.append(self._clean_html(ref_law))
-                md_content.append("")
+                md_content.extend(("## 참조조문", self._clean_html(ref_law), ""))
 
             # 참조판례
             ref_prec = self._get_value(data, '참조판례', 'referencePrec')
             if ref_prec:
-                md_content.append("## 참조판례")
-                md_content.append(self._clean_html(ref_prec))
-                md_content.append("")
+                md_content.extend(("## 참조판례", self._clean_html(ref_prec), ""))
 
             # 판례내용 (본문)
             content = self._get_value(data, '판례내용', 'judgmentContent', 'content')
             if content:
-                md_content.append("## 판례 본문")
-                md_content.append(self._clean_html(content))
-                md_content.append("")
+                md_content.extend(("## 판례 본문", self._clean_html(content), ""))
 
         elif target == 'expc':  # 법령해석례
             title = self._get_value(data, '안건명', 'title', '제목')
@@ -1856,35 +2459,31 @@ class LegalAIEngine:
             date = self._get_value(data, '해석일자', '회신일자', 'replyDate')
             query_org = self._get_value(data, '질의기관명', 'queryOrg')
 
-            md_content.append(f"# {title or '법령해석례'}")
-            md_content.append("")
-            md_content.append("## 기본 정보")
-            md_content.append(f"- **안건번호**: {case_no or '-'}")
-            md_content.append(f"- **해석기관**: {org or '-'}")
-            md_content.append(f"- **질의기관**: {query_org or '-'}")
-            md_content.append(f"- **해석일자**: {date or '-'}")
-            md_content.append("")
+            md_content.extend((
+                f"# {title or '법령해석례'}",
+                "",
+                "## 기본 정보",
+                f"- **안건번호**: {case_no or '-'}",
+                f"- **해석기관**: {org or '-'}",
+                f"- **질의기관**: {query_org or '-'}",
+                f"- **해석일자**: {date or '-'}",
+                "",
+            ))
 
             # 질의요지
             query = self._get_value(data, '질의요지', 'queryGist')
             if query:
-                md_content.append("## 질의요지")
-                md_content.append(self._clean_html(query))
-                md_content.append("")
+                md_content.extend(("## 질의요지", self._clean_html(query), ""))
 
             # 회답
             answer = self._get_value(data, '회답', 'answer')
             if answer:
-                md_content.append("## 회답")
-                md_content.append(self._clean_html(answer))
-                md_content.append("")
+                md_content.extend(("## 회답", self._clean_html(answer), ""))
 
             # 이유
             reason = self._get_value(data, '이유', 'reason')
             if reason:
-                md_content.append("## 이유")
-                md_content.append(self._clean_html(reason))
-                md_content.append("")
+                md_content.extend(("## 이유", self._clean_html(reason), ""))
 
         elif target == 'decc':  # 행정심판례
             title = self._get_value(data, '사건명', 'caseName', '제목')
@@ -1895,44 +2494,38 @@ class LegalAIEngine:
             disp_org = self._get_value(data, '처분청', 'dispositionOrg')
             ruling_org = self._get_value(data, '재결청', 'rulingOrg')
 
-            md_content.append(f"# {title or '행정심판례'}")
-            md_content.append("")
-            md_content.append("## 기본 정보")
-            md_content.append(f"- **사건번호**: {case_no or '-'}")
-            md_content.append(f"- **재결유형**: {ruling_type or '-'}")
-            md_content.append(f"- **의결일자**: {ruling_date or '-'}")
-            md_content.append(f"- **처분일자**: {disp_date or '-'}")
-            md_content.append(f"- **처분청**: {disp_org or '-'}")
-            md_content.append(f"- **재결청**: {ruling_org or '-'}")
-            md_content.append("")
+            md_content.extend((
+                f"# {title or '행정심판례'}",
+                "",
+                "## 기본 정보",
+                f"- **사건번호**: {case_no or '-'}",
+                f"- **재결유형**: {ruling_type or '-'}",
+                f"- **의결일자**: {ruling_date or '-'}",
+                f"- **처분일자**: {disp_date or '-'}",
+                f"- **처분청**: {disp_org or '-'}",
+                f"- **재결청**: {ruling_org or '-'}",
+                "",
+            ))
 
             # 주문
             order = self._get_value(data, '주문', 'mainText')
             if order:
-                md_content.append("## 주문")
-                md_content.append(self._clean_html(order))
-                md_content.append("")
+                md_content.extend(("## 주문", self._clean_html(order), ""))
 
             # 청구취지
             purpose = self._get_value(data, '청구취지', 'claimPurpose')
             if purpose:
-                md_content.append("## 청구취지")
-                md_content.append(self._clean_html(purpose))
-                md_content.append("")
+                md_content.extend(("## 청구취지", self._clean_html(purpose), ""))
 
             # 이유
             reason = self._get_value(data, '이유', 'reason')
             if reason:
-                md_content.append("## 이유")
-                md_content.append(self._clean_html(reason))
-                md_content.append("")
+                md_content.extend(("## 이유", self._clean_html(reason), ""))
 
             # 재결요지
             gist = self._get_value(data, '재결요지', 'rulingGist')
             if gist:
-                md_content.append("## 재결요지")
-                md_content.append(self._clean_html(gist))
-                md_content.append("")
+                md_content.extend(("## 재결요지", self._clean_html(gist), ""))
 
         elif target == 'detc':  # 헌재결정례
             title = self._get_value(data, '사건명', 'caseName', '결정명', '제목')
@@ -1940,46 +2533,39 @@ class LegalAIEngine:
             date = self._get_value(data, '종국일자', '선고일자', 'decisionDate')
             result = self._get_value(data, '결정유형', '종국결과', 'decisionType')
 
-            md_content.append(f"# {title or '헌재결정례'}")
-            md_content.append("")
-            md_content.append("## 기본 정보")
-            md_content.append(f"- **사건번호**: {case_no or '-'}")
-            md_content.append(f"- **종국일자**: {date or '-'}")
-            md_content.append(f"- **결정유형**: {result or '-'}")
-            md_content.append("")
+            md_content.extend((
+                f"# {title or '헌재결정례'}",
+                "",
+                "## 기본 정보",
+                f"- **사건번호**: {case_no or '-'}",
+                f"- **종국일자**: {date or '-'}",
+                f"- **결정유형**: {result or '-'}",
+                "",
+            ))
 
             # 판시사항
             summary = self._get_value(data, '판시사항', 'judgmentSummary')
             if summary:
-                md_content.append("## 판시사항")
-                md_content.append(self._clean_html(summary))
-                md_content.append("")
+                md_content.extend(("## 판시사항", self._clean_html(summary), ""))
 
             # 결정요지
             gist = self._get_value(data, '결정요지', 'decisionGist')
             if gist:
-                md_content.append("## 결정요지")
-                md_content.append(self._clean_html(gist))
-                md_content.append("")
+                md_content.extend(("## 결정요지", self._clean_html(gist), ""))
 
             # 본문
             content = self._get_value(data, '결정내용', '본문', 'content')
             if content:
-                md_content.append("## 결정 본문")
-                md_content.append(self._clean_html(content))
-                md_content.append("")
+                md_content.extend(("## 결정 본문", self._clean_html(content), ""))
         else:
             # 기타 문서 유형 (위원회 결정문 등)
             title = self._get_value(data, '사건명', '안건명', 'caseName', 'title', '제목')
-            md_content.append(f"# {title or '법률 문서'}")
-            md_content.append("")
+            md_content.extend((f"# {title or '법률 문서'}", ""))
 
             # 모든 필드를 순회하며 출력
             for key, value in data.items():
                 if value and isinstance(value, str) and len(value) > 0:
-                    md_content.append(f"## {key}")
-                    md_content.append(self._clean_html(str(value)))
-                    md_content.append("")
+                    md_content.extend((f"## {key}", self._clean_html(str(value)), ""))
 
         return "\n".join(md_content)
 
@@ -1988,11 +2574,8 @@ class LegalAIEngine:
         if not text:
             return ""
         # HTML 태그 제거
-        import re
-        text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'<p\s*/?>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</p>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'<[^>]+>', '', text)
+        text = HTML_LINE_BREAK_PATTERN.sub('\n', text)
+        text = HTML_TAG_PATTERN.sub('', text)
         # HTML 엔티티 변환
         text = text.replace('&nbsp;', ' ')
         text = text.replace('&lt;', '<')
@@ -2000,8 +2583,8 @@ class LegalAIEngine:
         text = text.replace('&amp;', '&')
         text = text.replace('&quot;', '"')
         # 연속된 공백/줄바꿈 정리
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
+        text = BLANK_LINES_PATTERN.sub('\n\n', text)
+        text = MULTI_SPACE_PATTERN.sub(' ', text)
         return text.strip()
 
     def generate_pdf_content(self, markdown_content: str, title: str = "법률 문서") -> bytes:
@@ -2147,21 +2730,32 @@ class LegalAIEngine:
 
     def merge_documents_as_markdown(self, documents: List[Dict]) -> str:
         """여러 문서를 하나의 마크다운으로 병합"""
-        merged = []
-        merged.append("# 법률 문서 모음")
-        merged.append(f"\n생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        merged.append(f"\n문서 수: {len(documents)}건")
-        merged.append("\n---\n")
+        merged = [
+            "# 법률 문서 모음",
+            f"\n생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"\n문서 수: {len(documents)}건",
+            "\n---\n",
+        ]
 
         for idx, doc in enumerate(documents, 1):
-            merged.append(f"\n## 문서 {idx}: {doc.get('title', '제목 없음')}")
-            merged.append(f"사건번호: {doc.get('case_no', '-')}")
-            merged.append("\n---\n")
-            merged.append(doc.get('markdown', ''))
-            merged.append("\n\n---\n")
+            merged.extend((
+                f"\n## 문서 {idx}: {doc.get('title', '제목 없음')}",
+                f"사건번호: {doc.get('case_no', '-')}",
+                "\n---\n",
+                doc.get('markdown', ''),
+                "\n\n---\n",
+            ))
 
         return "\n".join(merged)
 
+    # 사실관계 정리표 통계 섹션 (legal_data 키, 통계 키 접두사)
+    FACT_SHEET_STAT_SECTIONS = (
+        ('basic', ''),
+        ('committees', 'committee_'),
+        ('ministries', 'ministry_'),
+        ('special_tribunals', 'tribunal_'),
+    )
+
     def create_fact_sheet(self, user_input: str, legal_data: Dict) -> Dict:
         """사실관계 정리"""
         fact_sheet = {
@@ -2172,66 +2766,43 @@ class LegalAIEngine:
             'timeline': self._extract_timeline(user_input)
         }
 
-        # 기본 데이터 통계
-        if legal_data.get('basic'):
-            for key, items in legal_data['basic'].items():
-                if items:
-                    fact_sheet['statistics'][key] = len(items)
-
-        # 위원회 데이터 통계
-        if legal_data.get('committees'):
-            for key, items in legal_data['committees'].items():
-                if items:
-                    fact_sheet['statistics'][f'committee_{key}'] = len(items)
-
-        # 부처 데이터 통계
-        if legal_data.get('ministries'):
-            for key, items in legal_data['ministries'].items():
-                if items:
-                    fact_sheet['statistics'][f'ministry_{key}'] = len(items)
-
-        # 특별행정심판 통계
-        if legal_data.get('special_tribunals'):
-            for key, items in legal_data['special_tribunals'].items():
+        # 기본/위원회/부처/특별행정심판 데이터 통계 - 비어 있는 섹션은 한 번의 진리값 검사로 건너뜀
+        statistics = fact_sheet['statistics']
+        for section, prefix in self.FACT_SHEET_STAT_SECTIONS:
+            section_data = legal_data.get(section)
+            if not section_data:
+                continue
+            for key, items in section_data.items():
                 if items:
-                    fact_sheet['statistics'][f'tribunal_{key}'] = len(items)
+                    statistics[prefix + key] = len(items)
 
         return fact_sheet
 
     def _extract_key_facts(self, text: str) -> List[str]:
         """핵심 사실 추출"""
-        facts = []
-
-        # 날짜 패턴
-        date_pattern = r'\d{4}[년\.\-]\d{1,2}[월\.\-]\d{1,2}[일]?'
-        dates = re.findall(date_pattern, text)
-        for date in dates:
-            facts.append(f"관련 일자: {date}")
-
-        # 금액 패턴
-        money_pattern = r'\d+[만천백]?\s?원'
-        amounts = re.findall(money_pattern, text)
-        for amount in amounts:
-            facts.append(f"관련 금액: {amount}")
-
+        # 날짜/금액은 서로 겹칠 수 있으므로 (예: '2023.1.15원') 패턴별로 따로 스캔
+        facts = [f"관련 일자: {date}" for date in DATE_PATTERN.findall(text)]
+        facts.extend(f"관련 금액: {amount}" for amount in MONEY_PATTERN.findall(text))
         return facts
 
     def _extract_timeline(self, text: str) -> List[Dict]:
         """타임라인 추출"""
         timeline = []
-        date_pattern = r'(\d{4}[년\.\-]\d{1,2}[월\.\-]\d{1,2}[일]?)'
-
-        sentences = text.split('.')
-        for sentence in sentences:
-            dates = re.findall(date_pattern, sentence)
-            if dates:
-                for date in dates:
-                    timeline.append({
-                        'date': date,
-                        'event': sentence.strip()
-                    })
 
-        return sorted(timeline, key=lambda x: x['date'])
+        # 마침표로 문장을 나눈 뒤 문장별로 날짜 검색 (점 구분 날짜는 문장 분리로 끊기므로 추출되지 않음)
+        # 정렬 키는 추출 시점에 (연, 월, 일) 정수 튜플로 계산 ('년'/'-' 구분자가 섞여도 날짜순 정렬)
+        for sentence in text.split('.'):
+            event = None
+            for match in DATE_PARTS_PATTERN.finditer(sentence):
+                if event is None:
+                    event = sentence.strip()
+                timeline.append((tuple(map(int, match.groups())), {
+                    'date': match.group(0),
+                    'event': event
+                }))
+
+        timeline.sort(key=itemgetter(0))
+        return [entry for _, entry in timeline]
 
     # API 필드명 매핑 (camelCase -> 한글)
     FIELD_MAPPING = {
@@ -2252,14 +2823,14 @@ class LegalAIEngine:
         'lawName': '법령명',
     }
 
-    # 제외할 값들 (메타데이터, 상태값, 필드명 등)
-    SKIP_VALUES = {
+    # 제외할 값들 (메타데이터, 상태값, 필드명 등) - 소문자로 변환한 값과 비교하므로 모두 소문자로 작성
+    SKIP_VALUES = frozenset({
         # 상태값
         'success', 'true', 'false', 'null', 'none', 'error', 'ok',
         # 숫자
         '00', '0', '1', '2', '3', '4', '5',
         # camelCase 필드명들
-        'evtnm', 'itmnm', 'casenm', 'caseno', 'courtnm', 'lawNm', 'lawnm',
+        'evtnm', 'itmnm', 'casenm', 'caseno', 'courtnm', 'lawnm',
         'casename', 'casenumber', 'courtname', 'judgmentdate', 'decisiondate',
         'replydate', 'replyorg', 'lawname', 'enforcementdate', 'promulgationdate',
         # API 메타데이터 키
@@ -2267,7 +2838,7 @@ class LegalAIEngine:
         'query', 'search', 'keyword', 'q',
         # 기타
         'prec', 'expc', 'decc', 'detc', 'law', 'eflaw', 'admrul', 'ordin', 'trty'
-    }
+    })
 
     def _is_valid_value(self, value, query: str = '', exclude_urls: bool = True) -> bool:
         """유효한 데이터 값인지 확인
@@ -2280,10 +2851,12 @@ class LegalAIEngine:
         if not value:
             return False
 
-        val_str = str(value).strip()
+        # API 필드 값은 대부분 문자열이므로 str() 변환 호출 생략
+        val_str = (value if isinstance(value, str) else str(value)).strip()
+        n = len(val_str)
 
-        # 빈 값 체크
-        if not val_str:
+        # 빈 값 / 너무 짧은 값(1-2자 숫자) 제외 - 가장 싸고 거르는 비율이 높은 검사 먼저
+        if n == 0 or (n <= 2 and val_str.isdigit()):
             return False
 
         val_lower = val_str.lower()
@@ -2292,74 +2865,145 @@ class LegalAIEngine:
         if val_lower in self.SKIP_VALUES:
             return False
 
+        # 문자로만 된 값: 짧은 소문자 필드명 또는 camelCase 필드명(소문자+대문자 연속) 제외
+        # (공백/숫자가 섞인 일반 값은 isalpha에서, 한글 값은 isascii에서 걸러져 정규식을 실행하지 않음)
+        if val_str.isalpha():
+            if n <= 10 and val_str.islower():
+                return False
+            if val_str.isascii() and CAMEL_CASE_PATTERN.match(val_str):
+                return False
+
         # URL 형식 값 제외 (상세링크 등)
         if exclude_urls:
             # 법제처 API 상세링크 패턴: /DRF/lawService.do?... 형식
-            if val_str.startswith('/DRF/') or val_str.startswith('http'):
+            if val_str.startswith(('/DRF/', 'http')):
                 return False
             # lawService.do, lawSearch.do 등 API 엔드포인트 패턴
             if 'lawService.do' in val_str or 'lawSearch.do' in val_str:
                 return False
             # URL 파라미터 패턴: OC=, target=, ID= 등이 포함된 경우
-            if re.search(r'[?&](OC|target|ID|type)=', val_str):
+            if URL_PARAM_PATTERN.search(val_str):
                 return False
 
         # 검색어와 동일한 값은 제외 (에코된 검색어)
         if query:
-            query_lower = query.strip().lower()
+            query_lower = _normalize_query(query)
             if val_lower == query_lower:
                 return False
             # 검색어가 값에 포함된 경우도 제외 (부분 일치)
-            if len(query_lower) > 5 and query_lower in val_lower and len(val_str) < len(query) + 10:
+            if len(query_lower) > 5 and query_lower in val_lower and n < len(query) + 10:
                 return False
 
-        # camelCase 패턴 감지 (소문자+대문자 연속)
-        if re.match(r'^[a-z]+[A-Z][a-z]+$', val_str):
-            return False
-
-        # 너무 짧은 값 제외 (1-2자 숫자)
-        if len(val_str) <= 2 and val_str.isdigit():
-            return False
-
-        # 영문 소문자로만 된 짧은 값 제외 (필드명일 가능성)
-        if len(val_str) <= 10 and val_str.isalpha() and val_str.islower():
-            return False
-
         return True
 
+    def _expand_field_keys(self, keys: tuple) -> tuple:
+        """필드 키 후보에 FIELD_MAPPING 정방향/역방향 매핑 키를 덧붙인 튜플 (키 조합별로 한 번만 계산)"""
+        expanded = self._expanded_field_keys.get(keys)
+        if expanded is None:
+            all_keys = list(keys)
+            for key in keys:
+                if key in self.FIELD_MAPPING:
+                    all_keys.append(self.FIELD_MAPPING[key])
+                # 역매핑도 확인 (역방향 색인으로 한 번에 조회)
+                all_keys.extend(self._field_mapping_rev.get(key, ()))
+            # 같은 키를 두 번 검사해도 결과가 같으므로 순서를 유지한 채 중복 제거
+            expanded = self._expanded_field_keys[keys] = tuple(dict.fromkeys(all_keys))
+        return expanded
+
+    def _display_candidate_keys(self, preferred_keys: tuple) -> tuple:
+        """_get_item_display 키 후보 (우선 키 + 매핑 키 → 명칭 관련 키 순서, 키 조합별로 한 번만 계산)"""
+        candidates = self._display_candidate_keys_cache.get(preferred_keys)
+        if candidates is None:
+            expanded = self._expand_field_keys(preferred_keys)
+            candidates = expanded + tuple(key for key in self.DISPLAY_NAME_KEYS if key not in expanded)
+            self._display_candidate_keys_cache[preferred_keys] = candidates
+        return candidates
+
+    # _get_value 부분 일치 탐색용 키 이름 단어
+    VALUE_KEY_TERMS = ('명', '번호', '일자', 'Nm', 'No', 'Date', 'Name', 'Title')
+
     def _get_value(self, item: Dict, *keys, default='', query: str = '') -> str:
         """여러 가능한 키에서 값을 찾는 헬퍼 함수"""
+        return self._lookup_value(item, self._expand_field_keys(keys), default, query)
+
+    def _lookup_value(self, item: Dict, expanded_keys: tuple, default='', query: str = '') -> str:
+        """_expand_field_keys로 미리 확장한 키 후보에서 값 조회 (_get_value 본체)
+
+        같은 필드 규격을 항목마다 반복 조회하는 루프(_format_section)는 키 확장을 한 번만 하고 이 메서드를 직접 호출
+        """
+        is_valid_value = self._is_valid_value
         if not isinstance(item, dict):
-            if item and self._is_valid_value(item, query):
+            if item and is_valid_value(item, query):
                 return str(item)
             return default
 
         # 1. 지정된 키에서 찾기 (매핑된 키 포함)
-        all_keys = list(keys)
-        for key in keys:
-            if key in self.FIELD_MAPPING:
-                all_keys.append(self.FIELD_MAPPING[key])
-            # 역매핑도 확인
-            for eng, kor in self.FIELD_MAPPING.items():
-                if key == kor:
-                    all_keys.append(eng)
-
-        for key in all_keys:
+        for key in expanded_keys:
             if key in item:
                 val = item[key]
-                if self._is_valid_value(val, query):
+                if is_valid_value(val, query):
                     return str(val)
 
         # 2. 키 이름에 포함된 단어로 찾기 (부분 일치)
-        search_terms = ['명', '번호', '일자', 'Nm', 'No', 'Date', 'Name', 'Title']
-        for key, value in item.items():
-            if self._is_valid_value(value, query):
-                for term in search_terms:
-                    if term in key:
-                        return str(value)
+        value = self._find_value_by_key_terms(item, query)
+        if value is not None:
+            return value
 
         return default
 
+    def _find_value_by_key_terms(self, item: Dict, query: str = '') -> Optional[str]:
+        """키 이름에 VALUE_KEY_TERMS 단어가 들어간 첫 유효 값 (요청 필드와 무관하게 항목별로 같은 결과)
+
+        싼 키 이름 검사를 먼저 하고 값 검증은 일치한 키만
+        """
+        for key, value in item.items():
+            if any(term in key for term in self.VALUE_KEY_TERMS) and self._is_valid_value(value, query):
+                return str(value)
+        return None
+
+    def _get_values(self, item: Dict, *key_groups: tuple, default='', query: str = '') -> tuple:
+        """한 항목에서 여러 필드를 한 번에 조회 - 필드별 _get_value(item, *keys)와 같은 값의 튜플
+
+        지정 키에서 못 찾은 필드의 부분 일치 탐색 결과는 필드와 무관하므로 항목당 한 번만 계산
+        """
+        if not isinstance(item, dict):
+            return tuple(self._get_value(item, *keys, default=default, query=query) for keys in key_groups)
+
+        expand = self._expand_field_keys
+        is_valid_value = self._is_valid_value
+        fallback = None
+        values = []
+        for keys in key_groups:
+            for key in expand(keys):
+                if key in item:
+                    val = item[key]
+                    if is_valid_value(val, query):
+                        values.append(str(val))
+                        break
+            else:
+                if fallback is None:
+                    found = self._find_value_by_key_terms(item, query)
+                    fallback = default if found is None else found
+                values.append(fallback)
+        return tuple(values)
+
+    # _get_item_display 명칭/이름 관련 추가 탐색 키
+    DISPLAY_NAME_KEYS = (
+        '안건명', '사건명', '제목', '판례명', '결정명', '재결례명',
+        '법령명', '법령명한글', '행정규칙명', '자치법규명', '조약명',
+        'caseName', 'title', 'lawName', 'evtNm', 'itmNm', 'caseNm',
+    )
+
+    # _get_item_display 표시 값 수집 시 제외할 키 (소문자 기준)
+    DISPLAY_SKIP_KEYS = frozenset({
+        'target', 'type', 'id', 'page', 'totalcnt', 'section', 'success',
+        # 상세링크 관련 키 제외
+        '판례상세링크', '법령해석례상세링크', '행정심판례상세링크', '헌재결정례상세링크',
+        '상세링크', 'detaillink', 'link', 'url',
+        # API 메타데이터
+        'oc', 'display', 'sort', 'query', 'keyword', '키워드'
+    })
+
     def _get_item_display(self, item: Dict, *preferred_keys, query: str = '') -> str:
         """아이템 표시용 문자열 반환 - 안건명/사건명 우선, URL 제외"""
         if not isinstance(item, dict):
@@ -2367,212 +3011,205 @@ class LegalAIEngine:
                 return str(item)
             return '(정보 없음)'
 
-        # 1. 우선 키에서 찾기 (안건명, 사건명, 제목 등)
-        all_keys = list(preferred_keys)
-        for key in preferred_keys:
-            if key in self.FIELD_MAPPING:
-                all_keys.append(self.FIELD_MAPPING[key])
-            for eng, kor in self.FIELD_MAPPING.items():
-                if key == kor:
-                    all_keys.append(eng)
-
-        for key in all_keys:
+        # 1. 우선 키(안건명, 사건명, 제목 등) → 2. 명칭/이름 관련 키 순서로 한 번에 탐색
+        for key in self._display_candidate_keys(preferred_keys):
             if key in item:
                 val = item[key]
                 if self._is_valid_value(val, query):
                     return str(val)
 
-        # 2. 명칭/이름 관련 키 추가 탐색
-        name_keys = ['안건명', '사건명', '제목', '판례명', '결정명', '재결례명',
-                     '법령명', '법령명한글', '행정규칙명', '자치법규명', '조약명',
-                     'caseName', 'title', 'lawName', 'evtNm', 'itmNm', 'caseNm']
-        for key in name_keys:
-            if key in item and key not in all_keys:
-                val = item[key]
-                if self._is_valid_value(val, query):
-                    return str(val)
-
-        # 3. 유효한 값들 수집 (URL/상세링크 관련 키 제외)
-        skip_keys = {
-            'target', 'type', 'id', 'page', 'totalcnt', 'section', 'success',
-            # 상세링크 관련 키 제외
-            '판례상세링크', '법령해석례상세링크', '행정심판례상세링크', '헌재결정례상세링크',
-            '상세링크', 'detailLink', 'link', 'url',
-            # API 메타데이터
-            'oc', 'display', 'sort', 'query', 'keyword', '키워드'
-        }
+        # 3. 유효한 값들 수집 (URL/상세링크 관련 키 제외, 최대 3개)
+        skip_keys = self.DISPLAY_SKIP_KEYS
         valid_parts = []
         for key, value in item.items():
-            if key.lower() not in skip_keys and self._is_valid_value(value, query):
-                # 상세링크 키인지 추가 확인
-                if '상세링크' in key or '링크' in key or 'link' in key.lower():
-                    continue
+            # 키 기준 제외를 먼저 검사 (소문자 변환은 필드당 한 번만)
+            key_lower = key.lower()
+            if key_lower in skip_keys or '링크' in key or 'link' in key_lower:
+                continue
+            if self._is_valid_value(value, query):
                 valid_parts.append(str(value))
+                if len(valid_parts) == 3:
+                    break
+
+        return " | ".join(valid_parts) if valid_parts else '(정보 없음)'
+
+    # _build_context 기본 자료 섹션별 출력 규격
+    # name: 제목 필드 후보 / fields: (라벨, 필드 후보) - 값이 있는 것만 출력
+    # require: 'name' → 제목 필수, 'any' → 제목 또는 첫 번째 필드 필수, None → 항상 출력
+    CONTEXT_FIELD_SPECS = {
+        'law': {
+            'name': ('법령명한글', '법령명', 'lawNameKorean', 'lawName', '법령명약칭'),
+            'fields': [
+                ('소관부처', ('소관부처명', '소관부처', 'competentDept')),
+                ('시행/공포일', ('시행일자', '공포일자', 'enforcementDate', 'promulgationDate')),
+            ],
+            'require': 'name',
+        },
+        'prec': {
+            'name': ('사건명', '판례명', 'caseName', 'caseNm', '제목'),
+            'fields': [
+                ('사건번호', ('사건번호', 'caseNo', 'caseNumber')),
+                ('법원', ('법원명', '법원', 'courtName', 'court')),
+                ('선고일', ('선고일자', '판결일자', 'judgmentDate', 'decisionDate')),
+            ],
+            'require': 'any',
+            'placeholder': '(사건명 없음)',
+        },
+        'detc': {
+            'name': ('사건명', '결정명', 'caseName', '제목'),
+            'fields': [
+                ('사건번호', ('사건번호', 'caseNo', 'caseNumber')),
+                ('종국일', ('종국일자', '선고일자', '결정일자', 'decisionDate')),
+            ],
+            'require': 'any',
+            'placeholder': '(사건명 없음)',
+        },
+        'expc': {
+            'name': ('안건명', '제목', 'title', 'caseName'),
+            'fields': [
+                ('안건번호', ('안건번호', 'caseNo', 'number')),
+                ('회신기관', ('회신기관명', '회신기관', 'replyOrg')),
+                ('회신일자', ('회신일자', 'replyDate')),
+            ],
+            'require': 'any',
+            'placeholder': '(안건명 없음)',
+        },
+        'decc': {
+            'name': ('사건명', '제목', 'caseName', 'title'),
+            'fields': [
+                ('사건번호', ('사건번호', 'caseNo', 'caseNumber')),
+                ('재결결과', ('재결결과', '재결구분명', 'result')),
+                ('의결일', ('의결일자', '재결일자', 'decisionDate')),
+            ],
+            'require': 'any',
+            'placeholder': '(사건명 없음)',
+        },
+        'admrul': {
+            'name': ('행정규칙명', '제목', 'ruleName', 'title'),
+            'fields': [
+                ('소관부처', ('소관부처명', '소관부처', 'competentDept')),
+            ],
+            'require': 'name',
+        },
+        'ordin': {
+            'name': ('자치법규명', '제목', 'ordinName', 'title'),
+            'fields': [
+                ('지자체', ('지자체기관명', '자치단체명', 'localGovt')),
+            ],
+            'require': None,
+        },
+    }
 
-        return " | ".join(valid_parts[:3]) if valid_parts else '(정보 없음)'
+    # _build_context 기본 자료 섹션 순서
+    # (원본 target 키, 섹션 제목, CONTEXT_FIELD_SPECS 키, 최대 건수, 핵심 자료 여부, 검색 통계 이름)
+    CONTEXT_SECTION_SPECS = (
+        (('law', 'eflaw'), "관련 법령", 'law', 15, False, "법령"),
+        (('prec',), "관련 판례", 'prec', 30, True, "판례"),
+        (('detc',), "헌재결정례", 'detc', 15, False, "헌재결정례"),
+        (('expc',), "법령해석례/유권해석", 'expc', 25, True, "법령해석례"),
+        (('decc',), "행정심판례", 'decc', 25, True, "행정심판례"),
+        (('admrul',), "행정규칙", 'admrul', 10, False, "행정규칙"),
+        (('ordin',), "자치법규", 'ordin', 10, False, "자치법규"),
+    )
+
+    # 조약 제목 필드 (우선, 대체)
+    TREATY_NAME_KEYS = ('조약명', '조약명한글')
+
+    # 위원회/부처/특별행정심판 섹션 규격 (_section_name_maps[1:] 순서)
+    # (제목 형식, 제목 필드 (우선, 대체), 날짜 필드 (우선, 대체))
+    CONTEXT_GROUP_SPECS = (
+        ("{} 결정문", ('사건명', '안건명'), ('의결일자', '결정일자')),
+        ("{}", ('안건명', '제목'), ('회신일자', '등록일자')),
+        ("{}", ('사건명', '안건명'), ('재결일자', '의결일자')),
+    )
+
+    def _format_section(self, title: str, item_lists: List[List[Dict]], spec_key: str,
+                        limit: int, highlight: bool = False):
+        """컨텍스트 섹션 1개를 줄 단위로 생성 (CONTEXT_FIELD_SPECS 기반)
+
+        여러 원본 목록(법령+시행일법령 등)은 이어 붙인 복사본을 만들지 않고 앞에서부터 limit건만 순회
+        """
+        spec = self.CONTEXT_FIELD_SPECS[spec_key]
+        # 항목 루프에서 매번 조회하지 않도록 규격/메서드를 지역 변수로 고정
+        # (필드 키 후보는 FIELD_MAPPING 확장을 섹션당 한 번만 하고 항목마다 바로 조회)
+        require = spec['require']
+        placeholder = spec.get('placeholder', '')
+        expand = self._expand_field_keys
+        name_keys = expand(spec['name'])
+        fields = [(label, expand(keys)) for label, keys in spec['fields']]
+        lookup_value = self._lookup_value
+
+        total = sum(map(len, item_lists))
+        yield f"\n[{title}] (총 {total}건)" + (" ★ 핵심 자료" if highlight else "")
+        for idx, item in enumerate(islice(chain.from_iterable(item_lists), limit), 1):
+            name = lookup_value(item, name_keys)
+            values = [(label, lookup_value(item, keys)) for label, keys in fields]
+            if require == 'name' and not name:
+                continue
+            if require == 'any' and not (name or values[0][1]):
+                continue
+            # 항목 1개(제목 + 값이 있는 필드)를 한 번에 조립하여 한 줄 묶음으로 출력
+            yield "\n".join([f"{idx}. {name or placeholder}",
+                              *[f"   - {label}: {value}" for label, value in values if value]])
 
     def _build_context(self, legal_data: Dict) -> str:
         """검색 결과를 컨텍스트로 구성 - 판례/유권해석 중심 확장"""
-        context_parts = []
+        # 결과가 하나도 없으면 섹션 규격을 순회하지 않고 바로 빈 컨텍스트 반환
+        if not self._has_any_results(legal_data):
+            return ""
+        return "\n".join(self._iter_context_lines(legal_data))
+
+    def _build_context_with_stats(self, legal_data: Dict) -> tuple:
+        """(컨텍스트, 검색 통계 요약) 생성 - 검색 결과를 한 번만 순회"""
+        if not self._has_any_results(legal_data):
+            return "", "검색 결과 없음"
+        stats = []
+        context = "\n".join(self._iter_context_lines(legal_data, stats))
+        return context, "\n".join(stats) if stats else "검색 결과 없음"
 
+    def _iter_context_lines(self, legal_data: Dict, stats: Optional[List[str]] = None):
+        """컨텍스트 문자열을 줄 단위로 생성
+
+        stats 목록이 주어지면 같은 순회에서 섹션별 검색 통계 줄("- 이름: N건")을 함께 채움
+        """
+        first_present = self._first_present
         # 기본 법률 데이터
         if legal_data.get('basic'):
             basic = legal_data['basic']
 
-            # 법령 (상위 15개)
-            if basic.get('law') or basic.get('eflaw'):
-                laws = (basic.get('law', []) or []) + (basic.get('eflaw', []) or [])
-                if laws:
-                    context_parts.append(f"\n[관련 법령] (총 {len(laws)}건)")
-                    for idx, law in enumerate(laws[:15], 1):
-                        name = self._get_value(law, '법령명한글', '법령명', 'lawNameKorean', 'lawName', '법령명약칭')
-                        dept = self._get_value(law, '소관부처명', '소관부처', 'competentDept')
-                        date = self._get_value(law, '시행일자', '공포일자', 'enforcementDate', 'promulgationDate')
-                        if name:
-                            context_parts.append(f"{idx}. {name}")
-                            if dept:
-                                context_parts.append(f"   - 소관부처: {dept}")
-                            if date:
-                                context_parts.append(f"   - 시행/공포일: {date}")
-
-            # 판례 (상위 30개 - 핵심 자료)
-            if basic.get('prec'):
-                precs = basic['prec']
-                context_parts.append(f"\n[관련 판례] (총 {len(precs)}건) ★ 핵심 자료")
-                for idx, prec in enumerate(precs[:30], 1):
-                    name = self._get_value(prec, '사건명', '판례명', 'caseName', 'caseNm', '제목')
-                    date = self._get_value(prec, '선고일자', '판결일자', 'judgmentDate', 'decisionDate')
-                    court = self._get_value(prec, '법원명', '법원', 'courtName', 'court')
-                    case_no = self._get_value(prec, '사건번호', 'caseNo', 'caseNumber')
-                    if name or case_no:
-                        context_parts.append(f"{idx}. {name or '(사건명 없음)'}")
-                        if case_no:
-                            context_parts.append(f"   - 사건번호: {case_no}")
-                        if court:
-                            context_parts.append(f"   - 법원: {court}")
-                        if date:
-                            context_parts.append(f"   - 선고일: {date}")
-
-            # 헌재결정례 (상위 15개)
-            if basic.get('detc'):
-                detcs = basic['detc']
-                context_parts.append(f"\n[헌재결정례] (총 {len(detcs)}건)")
-                for idx, case in enumerate(detcs[:15], 1):
-                    name = self._get_value(case, '사건명', '결정명', 'caseName', '제목')
-                    date = self._get_value(case, '종국일자', '선고일자', '결정일자', 'decisionDate')
-                    case_no = self._get_value(case, '사건번호', 'caseNo', 'caseNumber')
-                    if name or case_no:
-                        context_parts.append(f"{idx}. {name or '(사건명 없음)'}")
-                        if case_no:
-                            context_parts.append(f"   - 사건번호: {case_no}")
-                        if date:
-                            context_parts.append(f"   - 종국일: {date}")
-
-            # 법령해석례 (상위 25개 - 핵심 자료)
-            if basic.get('expc'):
-                expcs = basic['expc']
-                context_parts.append(f"\n[법령해석례/유권해석] (총 {len(expcs)}건) ★ 핵심 자료")
-                for idx, interp in enumerate(expcs[:25], 1):
-                    name = self._get_value(interp, '안건명', '제목', 'title', 'caseName')
-                    no = self._get_value(interp, '안건번호', 'caseNo', 'number')
-                    org = self._get_value(interp, '회신기관명', '회신기관', 'replyOrg')
-                    date = self._get_value(interp, '회신일자', 'replyDate')
-                    if name or no:
-                        context_parts.append(f"{idx}. {name or '(안건명 없음)'}")
-                        if no:
-                            context_parts.append(f"   - 안건번호: {no}")
-                        if org:
-                            context_parts.append(f"   - 회신기관: {org}")
-                        if date:
-                            context_parts.append(f"   - 회신일자: {date}")
-
-            # 행정심판례 (상위 25개 - 핵심 자료)
-            if basic.get('decc'):
-                deccs = basic['decc']
-                context_parts.append(f"\n[행정심판례] (총 {len(deccs)}건) ★ 핵심 자료")
-                for idx, ruling in enumerate(deccs[:25], 1):
-                    name = self._get_value(ruling, '사건명', '제목', 'caseName', 'title')
-                    date = self._get_value(ruling, '의결일자', '재결일자', 'decisionDate')
-                    case_no = self._get_value(ruling, '사건번호', 'caseNo', 'caseNumber')
-                    result = self._get_value(ruling, '재결결과', '재결구분명', 'result')
-                    if name or case_no:
-                        context_parts.append(f"{idx}. {name or '(사건명 없음)'}")
-                        if case_no:
-                            context_parts.append(f"   - 사건번호: {case_no}")
-                        if result:
-                            context_parts.append(f"   - 재결결과: {result}")
-                        if date:
-                            context_parts.append(f"   - 의결일: {date}")
-
-            # 행정규칙 (상위 10개)
-            if basic.get('admrul'):
-                admruls = basic['admrul']
-                context_parts.append(f"\n[행정규칙] (총 {len(admruls)}건)")
-                for idx, rule in enumerate(admruls[:10], 1):
-                    name = self._get_value(rule, '행정규칙명', '제목', 'ruleName', 'title')
-                    dept = self._get_value(rule, '소관부처명', '소관부처', 'competentDept')
-                    if name:
-                        context_parts.append(f"{idx}. {name}")
-                        if dept:
-                            context_parts.append(f"   - 소관부처: {dept}")
-
-            # 자치법규 (상위 10개)
-            if basic.get('ordin'):
-                ordins = basic['ordin']
-                context_parts.append(f"\n[자치법규] (총 {len(ordins)}건)")
-                for idx, ordin in enumerate(ordins[:10], 1):
-                    name = self._get_value(ordin, '자치법규명', '제목', 'ordinName', 'title')
-                    local = self._get_value(ordin, '지자체기관명', '자치단체명', 'localGovt')
-                    context_parts.append(f"{idx}. {name}")
-                    if local:
-                        context_parts.append(f"   - 지자체: {local}")
+            # 법령/판례/해석례 등 - 값이 있는 섹션만 한 번씩 출력
+            for source_keys, title, spec_key, limit, highlight, stats_name in self.CONTEXT_SECTION_SPECS:
+                item_lists = [items for items in map(basic.get, source_keys) if items]
+                if item_lists:
+                    if stats is not None:
+                        stats.append(f"- {stats_name}: {sum(map(len, item_lists))}건"
+                                     + (" ★" if highlight else ""))
+                    yield from self._format_section(title, item_lists, spec_key, limit, highlight)
 
             # 조약 (상위 5개)
             if basic.get('trty'):
                 trtys = basic['trty']
                 if trtys:
-                    context_parts.append(f"\n[조약] (총 {len(trtys)}건)")
+                    yield f"\n[조약] (총 {len(trtys)}건)"
                     for idx, treaty in enumerate(trtys[:5], 1):
-                        name = treaty.get('조약명', treaty.get('조약명한글', ''))
+                        name = first_present(treaty, self.TREATY_NAME_KEYS)
                         date = treaty.get('체결일자', '')
-                        context_parts.append(f"{idx}. {name}")
-                        if date:
-                            context_parts.append(f"   - 체결일자: {date}")
-
-        # 위원회 결정문
-        if legal_data.get('committees'):
-            for comm_key, items in legal_data['committees'].items():
-                if items:
-                    comm_name = self.committee_targets.get(comm_key, {}).get('name', comm_key)
-                    context_parts.append(f"\n[{comm_name} 결정문]")
-                    for idx, item in enumerate(items[:5], 1):
-                        name = item.get('사건명', item.get('안건명', ''))
-                        date = item.get('의결일자', item.get('결정일자', ''))
-                        context_parts.append(f"{idx}. {name} ({date})")
-
-        # 부처별 법령해석
-        if legal_data.get('ministries'):
-            for min_key, items in legal_data['ministries'].items():
-                if items:
-                    min_name = self.ministry_targets.get(min_key, {}).get('name', min_key)
-                    context_parts.append(f"\n[{min_name}]")
-                    for idx, item in enumerate(items[:5], 1):
-                        name = item.get('안건명', item.get('제목', ''))
-                        date = item.get('회신일자', item.get('등록일자', ''))
-                        context_parts.append(f"{idx}. {name} ({date})")
+                        # 제목과 체결일자를 한 줄 묶음으로 출력
+                        yield f"{idx}. {name}\n   - 체결일자: {date}" if date else f"{idx}. {name}"
 
-        # 특별행정심판례
-        if legal_data.get('special_tribunals'):
-            for trib_key, items in legal_data['special_tribunals'].items():
+        # 위원회 결정문 / 부처별 법령해석 / 특별행정심판례 (상위 5개씩)
+        for (section, names), (title_format, name_keys, date_keys) in zip(
+                self._section_name_maps[1:], self.CONTEXT_GROUP_SPECS):
+            for key, items in (legal_data.get(section) or {}).items():
                 if items:
-                    trib_name = self.special_tribunal_targets.get(trib_key, {}).get('name', trib_key)
-                    context_parts.append(f"\n[{trib_name}]")
+                    display_name = names.get(key, key)
+                    if stats is not None:
+                        stats.append(f"- {display_name}: {len(items)}건")
+                    yield f"\n[{title_format.format(display_name)}]"
                     for idx, item in enumerate(items[:5], 1):
-                        name = item.get('사건명', item.get('안건명', ''))
-                        date = item.get('재결일자', item.get('의결일자', ''))
-                        context_parts.append(f"{idx}. {name} ({date})")
-
-        return "\n".join(context_parts)
+                        name = first_present(item, name_keys)
+                        date = first_present(item, date_keys)
+                        yield f"{idx}. {name} ({date})"
 
     def filter_results_with_ai(self, query: str, legal_data: Dict, max_results: int = 30) -> Dict:
         """AI를 사용하여 수집된 결과 중 관련성 높은 자료만 필터링
@@ -2600,7 +3237,7 @@ class LegalAIEngine:
         if legal_data.get('basic'):
             for target_key, items in legal_data['basic'].items():
                 if items:
-                    target_name = self.basic_targets.get(target_key, {}).get('name', target_key)
+                    target_name = self.basic_names.get(target_key, target_key)
                     for idx, item in enumerate(items):
                         title = self._get_item_display(item, '사건명', '안건명', '제목', 'caseName', 'title')
                         case_no = self._get_value(item, '사건번호', '안건번호', 'caseNo')
@@ -2608,8 +3245,7 @@ class LegalAIEngine:
                         summary = self._get_value(item, '판시사항', '질의요지', '재결요지', 'summary')
 
                         # 일련번호 추출
-                        serial_id = item.get('판례일련번호', item.get('법령해석례일련번호',
-                                    item.get('행정심판례일련번호', item.get('일련번호', ''))))
+                        serial_id = self._serial_id(item)
 
                         item_info = {
                             'source': 'basic',
@@ -2635,7 +3271,7 @@ class LegalAIEngine:
         if legal_data.get('committees'):
             for target_key, items in legal_data['committees'].items():
                 if items:
-                    target_name = self.committee_targets.get(target_key, {}).get('name', target_key)
+                    target_name = self.committee_names.get(target_key, target_key)
                     for idx, item in enumerate(items):
                         title = self._get_item_display(item, '사건명', '제목', 'caseName', 'title')
                         case_no = self._get_value(item, '사건번호', 'caseNo')
@@ -2658,7 +3294,7 @@ class LegalAIEngine:
         if legal_data.get('ministries'):
             for target_key, items in legal_data['ministries'].items():
                 if items:
-                    target_name = self.ministry_targets.get(target_key, {}).get('name', target_key)
+                    target_name = self.ministry_names.get(target_key, target_key)
                     for idx, item in enumerate(items):
                         title = self._get_item_display(item, '안건명', '제목', 'title')
                         case_no = self._get_value(item, '안건번호', 'caseNo')
@@ -2874,41 +3510,21 @@ JSON 형식으로만 응답하세요."""
             legal_data['filter_result'] = {
                 'summary': 'AI 필터링 과정에서 오류가 발생하여 원본 결과를 그대로 사용합니다.',
                 'selected_indices': [],
+                'is_fallback': True,
             }
             legal_data['original_count'] = total_candidates
             legal_data['filtered_count'] = total_candidates
             legal_data['case_number_results_count'] = len(case_number_items)
             return legal_data
 
-    def _generate_fallback_response(self, query: str, legal_data: Dict) -> str:
-        """API 키 없을 때 검색 결과 기반 기본 응답"""
-        context = self._build_context(legal_data)
+    def _generate_fallback_response(self, query: str, legal_data: Dict, context: Optional[str] = None) -> str:
+        """API 키 없을 때 검색 결과 기반 기본 응답 (이미 만든 context가 있으면 재사용)"""
+        if context is None:
+            context = self._build_context(legal_data)
 
         # 통계 계산
-        stats = []
-        if legal_data.get('basic'):
-            for key, items in legal_data['basic'].items():
-                if items:
-                    name = self.basic_targets.get(key, {}).get('name', key)
-                    stats.append(f"{name} {len(items)}건")
-
-        if legal_data.get('committees'):
-            for key, items in legal_data['committees'].items():
-                if items:
-                    name = self.committee_targets.get(key, {}).get('name', key)
-                    stats.append(f"{name} {len(items)}건")
-
-        if legal_data.get('ministries'):
-            for key, items in legal_data['ministries'].items():
-                if items:
-                    name = self.ministry_targets.get(key, {}).get('name', key)
-                    stats.append(f"{name} {len(items)}건")
-
-        if legal_data.get('special_tribunals'):
-            for key, items in legal_data['special_tribunals'].items():
-                if items:
-                    name = self.special_tribunal_targets.get(key, {}).get('name', key)
-                    stats.append(f"{name} {len(items)}건")
+        stats = [f"{name} {count}건"
+                 for name, count in self._iter_section_counts(legal_data, self._section_name_maps)]
 
         stats_text = ", ".join(stats) if stats else "검색 결과 없음"
 
@@ -2946,132 +3562,79 @@ AI 분석을 이용하시려면 사이드바에서 OpenAI API 키를 입력해
             logger.error(f"AI 응답 생성 오류: {e}")
             return "AI 응답을 생성할 수 없습니다. API 키를 확인해주세요."
 
-    async def generate_legal_advice(self, query: str, legal_data: Dict, fact_sheet: Dict) -> str:
-        """AI 법률 조언 생성 - 실제 검색 결과 기반"""
-        # API 키 확인
-        if not get_openai_api_key():
-            return self._generate_fallback_response(query, legal_data)
-
-        context = self._build_context(legal_data)
-        timeline = "\n".join([f"- {item['date']}: {item['event']}"
-                             for item in fact_sheet.get('timeline', [])])
-
-        # 검색 통계 요약
-        stats_summary = self._get_search_stats_summary(legal_data)
-
-        # 추출된 키워드
-        keywords = legal_data.get('keywords', [])
-        keywords_str = ', '.join(keywords) if keywords else '없음'
+    # 세션별 AI 조언 캐시 최대 항목 수 (오래된 항목부터 제거)
+    ADVICE_CACHE_MAX_SIZE = 16
 
-        # 검색 결과가 있는지 확인
-        has_results = bool(context and context.strip())
+    @staticmethod
+    def _advice_cache_key(prompt: str, max_tokens: int) -> str:
+        """AI 조언 캐시 키 - 질문/키워드/검색 결과가 모두 들어간 프롬프트의 해시"""
+        return hashlib.blake2b(f"{max_tokens}\n{prompt}".encode(), digest_size=16).hexdigest()
 
-        if has_results:
-            prompt = f"""당신은 한국 법률 전문가입니다. 아래에 법제처 Open API에서 검색된 **실제 법률 자료**가 제공됩니다.
-반드시 이 검색 결과를 기반으로 답변해야 합니다.
+    def stream_legal_advice(self, query: str, legal_data: Dict, max_tokens: int = 2500,
+                            cache: Optional[Dict[str, str]] = None):
+        """AI 법률 조언을 토큰 단위로 생성 (스크립트 스레드에서 st.write_stream으로 소비)
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-## 의뢰인 질문/상황:
-{query}
-
-## 추출된 검색 키워드:
-{keywords_str}
-
-## 검색 통계:
-{stats_summary}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-## 🔍 법제처에서 검색된 실제 법률 자료:
-{context}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-## ⚠️ 필수 지침 (반드시 준수):
-1. **위에 제공된 검색 결과만 사용하세요.** 일반적인 법률 지식으로 답변하지 마세요.
-2. **판례를 인용할 때는 반드시 위 목록에서 사건번호를 정확히 복사하세요.**
-   예: "대법원 2020다12345 판결에서..."
-3. **법령해석례를 인용할 때는 안건번호를 명시하세요.**
-   예: "법제처 안건번호 22-0123에 따르면..."
-4. **행정심판례를 인용할 때는 사건번호를 명시하세요.**
-   예: "중앙행정심판위원회 2023-12345 재결에서..."
-5. 위 검색 결과에 없는 내용은 "검색 결과에 포함되지 않음"이라고 명시하세요.
-
-## 답변 형식:
-
-### 📋 핵심 요약
-[의뢰인 상황에 대한 2-3문장 핵심 결론]
-
-### 📚 관련 판례 (위 검색 결과에서 인용)
-[검색된 판례 목록에서 관련 판례를 선택하여 사건번호와 함께 상세 설명]
-- **사건번호**: [위에서 복사]
-- **법원/선고일**: [위에서 복사]
-- **판시사항**: [내용 설명]
-- **의뢰인 사안 적용**: [분석]
-
-### 📋 관련 법령해석례/행정심판례 (위 검색 결과에서 인용)
-[검색된 해석례/심판례에서 관련 건을 선택하여 안건번호와 함께 설명]
-
-### 📖 관련 법령
-[검색된 법령 중 관련 법령 인용]
-
-### 💡 종합 의견 및 조언
-[위 자료들을 종합한 분석]
-
----
-⚖️ 본 내용은 AI가 작성한 참고자료이며, 법률자문이 아닙니다.
-구체적인 사안에 대해서는 반드시 변호사 등 전문가의 검토가 필요합니다.
-"""
-        else:
-            prompt = f"""당신은 한국 법률 전문가입니다.
-
-## 의뢰인 질문/상황:
-{query}
-
-## 추출된 검색 키워드:
-{keywords_str}
+        전체 응답을 기다리지 않고 첫 토큰부터 화면에 표시하여 체감 대기 시간 단축
+        cache(세션 상태의 dict)가 주어지면 같은 프롬프트의 완료된 응답은 API 호출 없이 재사용
+        """
+        # API 키 확인
+        if not get_openai_api_key():
+            yield self._generate_fallback_response(query, legal_data)
+            return
 
-## ⚠️ 검색 결과:
-법제처 Open API 검색 결과가 없습니다.
+        context, prompt = self._build_advice_prompt(query, legal_data)
 
-## 지침:
-1. 검색 결과가 없음을 먼저 안내하세요.
-2. 일반적인 법률 정보를 제공하되, "법제처 검색 결과 없음"을 명시하세요.
-3. 다른 검색어 제안을 포함하세요.
+        cache_key = None
+        if cache is not None:
+            cache_key = self._advice_cache_key(prompt, max_tokens)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info("AI 조언 캐시 사용 (API 호출 생략)")
+                yield cached
+                return
 
----
-⚖️ 본 내용은 AI가 작성한 참고자료이며, 법률자문이 아닙니다.
-구체적인 사안에 대해서는 반드시 변호사 등 전문가의 검토가 필요합니다.
-"""
+        client = get_openai_client()
+        if not client:
+            yield self._generate_fallback_response(query, legal_data, context)
+            return
 
+        emitted = False
+        parts = []
         try:
-            client = get_openai_client()
-            if not client:
-                return self._generate_fallback_response(query, legal_data)
-            response = client.chat.completions.create(
+            stream = client.chat.completions.create(
                 model=OPENAI_MODEL_NAME,
                 messages=[
                     {"role": "system", "content": AI_LAWYER_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                max_completion_tokens=2500
+                max_completion_tokens=max_tokens,
+                stream=True
             )
-            return response.choices[0].message.content
+            for chunk in stream:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        emitted = True
+                        parts.append(delta)
+                        yield delta
         except Exception as e:
-            logger.error(f"AI 응답 생성 오류: {e}")
-            return self._generate_fallback_response(query, legal_data)
-
-    async def _generate_contract_review(self, query: str, legal_data: Dict, fact_sheet: Dict) -> str:
-        """계약서 검토 응답 생성"""
-        # API 키 확인
-        if not get_openai_api_key():
-            return self._generate_fallback_response(query, legal_data)
+            logger.error(f"AI 응답 스트리밍 오류: {e}")
+            if emitted:
+                yield "\n\n⚠️ AI 응답 생성 중 오류가 발생하여 답변이 중간에 끊겼습니다."
+            else:
+                yield self._generate_fallback_response(query, legal_data, context)
+            return
 
-        context = self._build_context(legal_data)
-        timeline = "\n".join([f"- {item['date']}: {item['event']}"
-                             for item in fact_sheet.get('timeline', [])])
+        # 끝까지 정상 수신한 응답만 캐시 (오류/대체 응답은 다음 요청에서 다시 시도)
+        if cache_key is not None and parts:
+            if len(cache) >= self.ADVICE_CACHE_MAX_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[cache_key] = "".join(parts)
 
-        # 검색 통계 요약
-        stats_summary = self._get_search_stats_summary(legal_data)
+    def _build_advice_prompt(self, query: str, legal_data: Dict) -> tuple:
+        """(컨텍스트, AI 프롬프트) 생성 - 검색 결과 유무에 따라 템플릿 선택"""
+        # 컨텍스트와 검색 통계 요약을 한 번의 순회로 생성
+        context, stats_summary = self._build_context_with_stats(legal_data)
 
         # 추출된 키워드
         keywords = legal_data.get('keywords', [])
@@ -3079,154 +3642,118 @@ AI 분석을 이용하시려면 사이드바에서 OpenAI API 키를 입력해
 
         # 검색 결과가 있는지 확인
         has_results = bool(context and context.strip())
+        prompt_fields = {
+            'query': query,
+            'keywords_str': keywords_str,
+            'stats_summary': stats_summary,
+            'context': context,
+        }
 
         if has_results:
-            prompt = f"""당신은 한국 법률 전문가입니다. 아래에 법제처 Open API에서 검색된 **실제 법률 자료**가 제공됩니다.
-반드시 이 검색 결과를 기반으로 답변해야 합니다.
+            prompt = LEGAL_ADVICE_PROMPT_TEMPLATE.format_map(prompt_fields)
+        else:
+            prompt = NO_RESULT_ADVICE_PROMPT_TEMPLATE.format_map(prompt_fields)
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-## 의뢰인 질문/상황:
-{query}
+        return context, prompt
 
-## 추출된 검색 키워드:
-{keywords_str}
+    @staticmethod
+    def _iter_section_counts(legal_data: Dict, section_name_maps):
+        """(섹션 키, 이름 맵) 순서대로 결과가 있는 target의 (이름, 건수) 생성"""
+        for section, names in section_name_maps:
+            for key, items in (legal_data.get(section) or {}).items():
+                if items:
+                    yield names.get(key, key), len(items)
 
-## 검색 통계:
-{stats_summary}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+@st.cache_resource
+def get_engine() -> LegalAIEngine:
+    """앱 전체 공용 LegalAIEngine 반환 (rerun/세션마다 재생성하지 않고 캐시/학습 경로 재사용)
 
-## 🔍 법제처에서 검색된 실제 법률 자료:
-{context}
+    API 키는 엔진에 저장하지 않고 요청 시점에 run_async가 설정한 컨텍스트에서 읽음
+    """
+    return LegalAIEngine()
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """앱 전체가 공유하는 백그라운드 이벤트 루프
 
-## ⚠️ 필수 지침 (반드시 준수):
-1. **위에 제공된 검색 결과만 사용하세요.** 일반적인 법률 지식으로 답변하지 마세요.
-2. **판례를 인용할 때는 반드시 위 목록에서 사건번호를 정확히 복사하세요.**
-   예: "대법원 2020다12345 판결에서..."
-3. **법령해석례를 인용할 때는 안건번호를 명시하세요.**
-   예: "법제처 안건번호 22-0123에 따르면..."
-4. **행정심판례를 인용할 때는 사건번호를 명시하세요.**
-   예: "중앙행정심판위원회 2023-12345 재결에서..."
-5. 위 검색 결과에 없는 내용은 "검색 결과에 포함되지 않음"이라고 명시하세요.
+    검색마다 asyncio.run으로 루프를 새로 만들면 HTTP 세션이 루프와 함께 버려져
+    법제처 API와의 keep-alive/TLS 세션을 재사용할 수 없음
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="legal-api-loop", daemon=True).start()
+    return loop
 
-## 답변 형식:
+def run_async(coro):
+    """코루틴을 백그라운드 이벤트 루프에서 실행하고 결과 반환 (스크립트 스레드에서 호출)"""
+    api_keys = {'law': get_law_api_key(), 'openai': get_openai_api_key()}
 
-### 📋 핵심 요약
-[의뢰인 상황에 대한 2-3문장 핵심 결론]
+    async def _run_with_keys():
+        # 태스크별 컨텍스트에 설정되므로 동시에 실행 중인 다른 세션의 키와 섞이지 않음
+        _request_api_keys.set(api_keys)
+        return await coro
 
-### 📚 관련 판례 (위 검색 결과에서 인용)
-[검색된 판례 목록에서 관련 판례를 선택하여 사건번호와 함께 상세 설명]
-- **사건번호**: [위에서 복사]
-- **법원/선고일**: [위에서 복사]
-- **판시사항**: [내용 설명]
-- **의뢰인 사안 적용**: [분석]
+    return asyncio.run_coroutine_threadsafe(_run_with_keys(), get_event_loop()).result()
 
-### 📋 관련 법령해석례/행정심판례 (위 검색 결과에서 인용)
-[검색된 해석례/심판례에서 관련 건을 선택하여 안건번호와 함께 설명]
-
-### 📖 관련 법령
-[검색된 법령 중 관련 법령 인용]
-
-### 💡 종합 의견 및 조언
-[위 자료들을 종합한 분석]
-
----
-⚖️ 본 내용은 AI가 작성한 참고자료이며, 법률자문이 아닙니다.
-구체적인 사안에 대해서는 반드시 변호사 등 전문가의 검토가 필요합니다.
-"""
-        else:
-            prompt = f"""당신은 한국 법률 전문가입니다.
-
-## 의뢰인 질문/상황:
-{query}
+@st.cache_resource
+def get_http_session() -> aiohttp.ClientSession:
+    """공유 백그라운드 루프에 묶인 앱 전체 공용 HTTP 세션
 
-## 추출된 검색 키워드:
-{keywords_str}
+    모든 세션/검색이 하나의 커넥션 풀을 공유하므로 재검색 시 TCP/TLS 연결을 재사용
+    """
+    async def _create():
+        return create_http_session()
 
-## ⚠️ 검색 결과:
-법제처 Open API 검색 결과가 없습니다.
+    return asyncio.run_coroutine_threadsafe(_create(), get_event_loop()).result()
 
-## 지침:
-1. 검색 결과가 없음을 먼저 안내하세요.
-2. 일반적인 법률 정보를 제공하되, "법제처 검색 결과 없음"을 명시하세요.
-3. 다른 검색어 제안을 포함하세요.
+# ===== UI 함수들 =====
 
----
-⚖️ 본 내용은 AI가 작성한 참고자료이며, 법률자문이 아닙니다.
-구체적인 사안에 대해서는 반드시 변호사 등 전문가의 검토가 필요합니다.
-"""
+# 대화 시작 전 안내 메시지 (정적 HTML)
+WELCOME_MESSAGE_HTML = """
+            <div class="chat-message assistant-message">
+                <strong>⚖️ AI 변호사 (GPT-5.2):</strong><br>
+                안녕하세요, AI 변호사입니다.<br><br>
 
-        try:
-            client = get_openai_client()
-            if not client:
-                return self._generate_fallback_response(query, legal_data)
-            response = client.chat.completions.create(
-                model=OPENAI_MODEL_NAME,
-                messages=[
-                    {"role": "system", "content": AI_LAWYER_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt}
-                ],
-                max_completion_tokens=2500
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            logger.error(f"AI 응답 생성 오류: {e}")
-            return self._generate_fallback_response(query, legal_data)
+                <b>🔍 2가지 검색 모드를 제공합니다:</b><br><br>
 
-    def _get_search_stats_summary(self, legal_data: Dict) -> str:
-        """검색 통계 요약 생성"""
-        stats = []
+                <b>📋 사건번호 검색</b><br>
+                법원 사건번호나 안건번호를 알고 있을 때 직접 검색합니다.<br>
+                • 판례: 2020다12345, 2021구합54321<br>
+                • 법령해석례: 18-0701, 22-0123<br>
+                • 행정심판례: 2023-12345<br><br>
 
-        if legal_data.get('basic'):
-            basic = legal_data['basic']
-            if basic.get('law') or basic.get('eflaw'):
-                laws = (basic.get('law', []) or []) + (basic.get('eflaw', []) or [])
-                if laws:
-                    stats.append(f"- 법령: {len(laws)}건")
-            if basic.get('prec'):
-                stats.append(f"- 판례: {len(basic['prec'])}건 ★")
-            if basic.get('detc'):
-                stats.append(f"- 헌재결정례: {len(basic['detc'])}건")
-            if basic.get('expc'):
-                stats.append(f"- 법령해석례: {len(basic['expc'])}건 ★")
-            if basic.get('decc'):
-                stats.append(f"- 행정심판례: {len(basic['decc'])}건 ★")
-            if basic.get('admrul'):
-                stats.append(f"- 행정규칙: {len(basic['admrul'])}건")
-            if basic.get('ordin'):
-                stats.append(f"- 자치법규: {len(basic['ordin'])}건")
+                <b>🤖 사건 검색</b><br>
+                법률 질문이나 키워드를 입력하면 AI가 의도를 분석하고,<br>
+                여러 방면으로 관련 자료를 최대한 수집한 후 의미있는 자료만 필터링합니다.<br>
+                예: "부당해고를 당했는데 어떻게 해야 하나요?" 또는 "부당해고"<br><br>
 
-        if legal_data.get('committees'):
-            for key, items in legal_data['committees'].items():
-                if items:
-                    name = self.committee_targets.get(key, {}).get('name', key)
-                    stats.append(f"- {name}: {len(items)}건")
+                <b>📚 검색 가능한 데이터:</b><br>
+                법령, 판례, 법령해석례, 행정심판례, 헌재결정례, 위원회 결정문 등<br><br>
 
-        if legal_data.get('ministries'):
-            for key, items in legal_data['ministries'].items():
-                if items:
-                    name = self.ministry_targets.get(key, {}).get('name', key)
-                    stats.append(f"- {name}: {len(items)}건")
+                아래에서 검색 모드를 선택하고 검색을 시작하세요!
+            </div>
+            """
 
-        if legal_data.get('special_tribunals'):
-            for key, items in legal_data['special_tribunals'].items():
-                if items:
-                    name = self.special_tribunal_targets.get(key, {}).get('name', key)
-                    stats.append(f"- {name}: {len(items)}건")
+# 사용자 메시지 말풍선 (들여쓰기 없는 한 줄 템플릿 - 히스토리 재렌더링 시 전송량 감소)
+USER_MESSAGE_HTML = '<div class="chat-message user-message"><strong>👤 의뢰인:</strong><br>{}</div>'
 
-        return "\n".join(stats) if stats else "검색 결과 없음"
+# 검색 모드별 예시 검색어 (버튼 라벨, 입력될 검색어)
+CASE_NUMBER_EXAMPLES = (
+    ("2020다12345", "2020다12345"),
+    ("2021구합54321", "2021구합54321"),
+    ("18-0701", "18-0701"),
+    ("22-0123", "22-0123"),
+)
+CASE_SEARCH_EXAMPLES = (
+    ("부당해고 구제", "회사에서 정당한 사유 없이 해고를 당했습니다. 어떻게 구제받을 수 있나요?"),
+    ("임대차 분쟁", "전세 보증금을 돌려받지 못하고 있습니다. 임차인으로서 어떤 권리가 있나요?"),
+    ("개인정보 침해", "개인정보 침해 손해배상"),
+    ("부당해고", "부당해고"),
+)
 
-# ===== UI 함수들 =====
 def display_chat_message(role: str, content: str):
     """채팅 메시지 표시"""
     if role == "user":
-        st.markdown(f'''
-        <div class="chat-message user-message">
-            <strong>👤 의뢰인:</strong><br>
-            {content}
-        </div>
-        ''', unsafe_allow_html=True)
+        st.markdown(USER_MESSAGE_HTML.format(content), unsafe_allow_html=True)
     else:
         st.markdown(content)
 
@@ -3242,162 +3769,160 @@ def display_search_results_detail(legal_data: Dict, engine: LegalAIEngine, query
         with st.expander(f"📚 검색된 판례 ({len(basic['prec'])}건)", expanded=True):
             for idx, prec in enumerate(basic['prec'][:20], 1):
                 display_name = engine._get_item_display(prec, '사건명', '판례명', 'caseName', '제목', query=query)
-                case_no = engine._get_value(prec, '사건번호', 'caseNo', 'caseNumber', query=query)
-                court = engine._get_value(prec, '법원명', '법원', 'courtName', 'court', query=query)
-                date = engine._get_value(prec, '선고일자', '판결일자', 'judgmentDate', 'decisionDate', query=query)
-                detail_link = engine._get_value(prec, '판례상세링크', 'detailLink', query=query)
+                case_no, court, date = engine._get_values(
+                    prec,
+                    ('사건번호', 'caseNo', 'caseNumber'),
+                    ('법원명', '법원', 'courtName', 'court'),
+                    ('선고일자', '판결일자', 'judgmentDate', 'decisionDate'),
+                    query=query)
+                detail_link = engine._first_present(prec, ('판례상세링크', 'detailLink'))
                 if display_name and display_name != '(정보 없음)':
-                    col1, col2 = st.columns([5, 1])
-                    with col1:
-                        st.markdown(f"**{idx}. {display_name}**")
-                        if case_no or court or date:
-                            st.caption(f"사건번호: {case_no or '-'} | 법원: {court or '-'} | 선고일: {date or '-'}")
-                    with col2:
-                        if detail_link:
-                            full_link = f"https://www.law.go.kr{detail_link}" if detail_link.startswith('/') else detail_link
-                            st.markdown(f"[상세보기]({full_link})")
+                    meta = f"사건번호: {case_no or '-'} | 법원: {court or '-'} | 선고일: {date or '-'}" if case_no or court or date else ''
+                    st.markdown(format_result_row(idx, display_name, meta, detail_link), unsafe_allow_html=True)
 
     # 법령해석례 상세
     if basic.get('expc'):
         with st.expander(f"📋 검색된 법령해석례 ({len(basic['expc'])}건)", expanded=True):
             for idx, expc in enumerate(basic['expc'][:20], 1):
                 display_name = engine._get_item_display(expc, '안건명', '제목', 'title', 'caseName', query=query)
-                no = engine._get_value(expc, '안건번호', 'caseNo', 'number', query=query)
-                org = engine._get_value(expc, '회신기관명', '회신기관', 'replyOrg', query=query)
-                date = engine._get_value(expc, '회신일자', 'replyDate', query=query)
-                detail_link = engine._get_value(expc, '법령해석례상세링크', 'detailLink', query=query)
+                no, org, date = engine._get_values(
+                    expc,
+                    ('안건번호', 'caseNo', 'number'),
+                    ('회신기관명', '회신기관', 'replyOrg'),
+                    ('회신일자', 'replyDate'),
+                    query=query)
+                detail_link = engine._first_present(expc, ('법령해석례상세링크', 'detailLink'))
                 if display_name and display_name != '(정보 없음)':
-                    col1, col2 = st.columns([5, 1])
-                    with col1:
-                        st.markdown(f"**{idx}. {display_name}**")
-                        if no or org or date:
-                            st.caption(f"안건번호: {no or '-'} | 회신기관: {org or '-'} | 회신일: {date or '-'}")
-                    with col2:
-                        if detail_link:
-                            full_link = f"https://www.law.go.kr{detail_link}" if detail_link.startswith('/') else detail_link
-                            st.markdown(f"[상세보기]({full_link})")
+                    meta = f"안건번호: {no or '-'} | 회신기관: {org or '-'} | 회신일: {date or '-'}" if no or org or date else ''
+                    st.markdown(format_result_row(idx, display_name, meta, detail_link), unsafe_allow_html=True)
 
     # 행정심판례 상세
     if basic.get('decc'):
         with st.expander(f"⚖️ 검색된 행정심판례 ({len(basic['decc'])}건)", expanded=True):
             for idx, decc in enumerate(basic['decc'][:20], 1):
                 display_name = engine._get_item_display(decc, '사건명', '제목', 'caseName', 'title', query=query)
-                case_no = engine._get_value(decc, '사건번호', 'caseNo', 'caseNumber', query=query)
-                result = engine._get_value(decc, '재결결과', '재결구분명', 'result', query=query)
-                date = engine._get_value(decc, '의결일자', '재결일자', 'decisionDate', query=query)
-                detail_link = engine._get_value(decc, '행정심판례상세링크', 'detailLink', query=query)
+                case_no, result, date = engine._get_values(
+                    decc,
+                    ('사건번호', 'caseNo', 'caseNumber'),
+                    ('재결결과', '재결구분명', 'result'),
+                    ('의결일자', '재결일자', 'decisionDate'),
+                    query=query)
+                detail_link = engine._first_present(decc, ('행정심판례상세링크', 'detailLink'))
                 if display_name and display_name != '(정보 없음)':
-                    col1, col2 = st.columns([5, 1])
-                    with col1:
-                        st.markdown(f"**{idx}. {display_name}**")
-                        if case_no or result or date:
-                            st.caption(f"사건번호: {case_no or '-'} | 재결결과: {result or '-'} | 의결일: {date or '-'}")
-                    with col2:
-                        if detail_link:
-                            full_link = f"https://www.law.go.kr{detail_link}" if detail_link.startswith('/') else detail_link
-                            st.markdown(f"[상세보기]({full_link})")
+                    meta = f"사건번호: {case_no or '-'} | 재결결과: {result or '-'} | 의결일: {date or '-'}" if case_no or result or date else ''
+                    st.markdown(format_result_row(idx, display_name, meta, detail_link), unsafe_allow_html=True)
 
     # 헌재결정례 상세
     if basic.get('detc'):
         with st.expander(f"🏛️ 검색된 헌재결정례 ({len(basic['detc'])}건)", expanded=False):
             for idx, detc in enumerate(basic['detc'][:10], 1):
                 display_name = engine._get_item_display(detc, '사건명', '결정명', 'caseName', '제목', query=query)
-                case_no = engine._get_value(detc, '사건번호', 'caseNo', 'caseNumber', query=query)
-                date = engine._get_value(detc, '종국일자', '선고일자', '결정일자', 'decisionDate', query=query)
-                detail_link = engine._get_value(detc, '헌재결정례상세링크', 'detailLink', query=query)
+                case_no, date = engine._get_values(
+                    detc,
+                    ('사건번호', 'caseNo', 'caseNumber'),
+                    ('종국일자', '선고일자', '결정일자', 'decisionDate'),
+                    query=query)
+                detail_link = engine._first_present(detc, ('헌재결정례상세링크', 'detailLink'))
                 if display_name and display_name != '(정보 없음)':
-                    col1, col2 = st.columns([5, 1])
-                    with col1:
-                        st.markdown(f"**{idx}. {display_name}**")
-                        st.caption(f"사건번호: {case_no or '-'} | 종국일: {date or '-'}")
-                    with col2:
-                        if detail_link:
-                            full_link = f"https://www.law.go.kr{detail_link}" if detail_link.startswith('/') else detail_link
-                            st.markdown(f"[상세보기]({full_link})")
+                    meta = f"사건번호: {case_no or '-'} | 종국일: {date or '-'}"
+                    st.markdown(format_result_row(idx, display_name, meta, detail_link), unsafe_allow_html=True)
 
     # 위원회 결정문 표시
-    committees = legal_data.get('committees', {})
-    if committees:
-        total_committee = sum(len(items) for items in committees.values() if items)
-        if total_committee > 0:
-            with st.expander(f"🏢 위원회 결정문 ({total_committee}건)", expanded=False):
-                for comm_key, items in committees.items():
-                    if items:
-                        comm_name = engine.committee_targets.get(comm_key, {}).get('name', comm_key)
-                        st.markdown(f"**{comm_name}** ({len(items)}건)")
-                        for idx, item in enumerate(items[:10], 1):
-                            display_name = engine._get_item_display(item, '사건명', '제목', 'caseName', 'title', query=query)
-                            case_no = engine._get_value(item, '사건번호', 'caseNo', query=query)
-                            date = engine._get_value(item, '의결일자', '결정일자', 'decisionDate', query=query)
-                            detail_link = engine._get_value(item, '상세링크', 'detailLink', query=query)
-                            if display_name and display_name != '(정보 없음)':
-                                col1, col2 = st.columns([5, 1])
-                                with col1:
-                                    st.markdown(f"{idx}. {display_name}")
-                                    if case_no or date:
-                                        st.caption(f"사건번호: {case_no or '-'} | 일자: {date or '-'}")
-                                with col2:
-                                    if detail_link:
-                                        full_link = f"https://www.law.go.kr{detail_link}" if detail_link.startswith('/') else detail_link
-                                        st.markdown(f"[상세]({full_link})")
-                        st.markdown("---")
+    committees = legal_data.get('committees') or {}
+    # 빈 목록은 건너뛰고 건수만 합산 (결과가 없으면 expander 자체를 만들지 않음)
+    total_committee = sum(map(len, filter(None, committees.values())))
+    if total_committee:
+        with st.expander(f"🏢 위원회 결정문 ({total_committee}건)", expanded=False):
+            for comm_key, items in committees.items():
+                if items:
+                    comm_name = engine.committee_names.get(comm_key, comm_key)
+                    st.markdown(f"**{comm_name}** ({len(items)}건)")
+                    for idx, item in enumerate(items[:10], 1):
+                        display_name = engine._get_item_display(item, '사건명', '제목', 'caseName', 'title', query=query)
+                        case_no, date = engine._get_values(
+                            item,
+                            ('사건번호', 'caseNo'),
+                            ('의결일자', '결정일자', 'decisionDate'),
+                            query=query)
+                        detail_link = engine._first_present(item, ('상세링크', 'detailLink'))
+                        if display_name and display_name != '(정보 없음)':
+                            meta = f"사건번호: {case_no or '-'} | 일자: {date or '-'}" if case_no or date else ''
+                            st.markdown(format_result_row(idx, display_name, meta, detail_link, link_label='상세', bold=False), unsafe_allow_html=True)
+                    st.markdown("---")
 
     # 부처별 법령해석 표시
-    ministries = legal_data.get('ministries', {})
-    if ministries:
-        total_ministry = sum(len(items) for items in ministries.values() if items)
-        if total_ministry > 0:
-            with st.expander(f"🏛️ 부처별 법령해석 ({total_ministry}건)", expanded=False):
-                for min_key, items in ministries.items():
-                    if items:
-                        min_name = engine.ministry_targets.get(min_key, {}).get('name', min_key)
-                        st.markdown(f"**{min_name}** ({len(items)}건)")
-                        for idx, item in enumerate(items[:10], 1):
-                            display_name = engine._get_item_display(item, '안건명', '제목', 'title', query=query)
-                            no = engine._get_value(item, '안건번호', 'caseNo', query=query)
-                            date = engine._get_value(item, '회신일자', 'replyDate', query=query)
-                            detail_link = engine._get_value(item, '법령해석례상세링크', 'detailLink', query=query)
-                            if display_name and display_name != '(정보 없음)':
-                                col1, col2 = st.columns([5, 1])
-                                with col1:
-                                    st.markdown(f"{idx}. {display_name}")
-                                    if no or date:
-                                        st.caption(f"안건번호: {no or '-'} | 회신일: {date or '-'}")
-                                with col2:
-                                    if detail_link:
-                                        full_link = f"https://www.law.go.kr{detail_link}" if detail_link.startswith('/') else detail_link
-                                        st.markdown(f"[상세]({full_link})")
-                        st.markdown("---")
+    ministries = legal_data.get('ministries') or {}
+    # 빈 목록은 건너뛰고 건수만 합산 (결과가 없으면 expander 자체를 만들지 않음)
+    total_ministry = sum(map(len, filter(None, ministries.values())))
+    if total_ministry:
+        with st.expander(f"🏛️ 부처별 법령해석 ({total_ministry}건)", expanded=False):
+            for min_key, items in ministries.items():
+                if items:
+                    min_name = engine.ministry_names.get(min_key, min_key)
+                    st.markdown(f"**{min_name}** ({len(items)}건)")
+                    for idx, item in enumerate(items[:10], 1):
+                        display_name = engine._get_item_display(item, '안건명', '제목', 'title', query=query)
+                        no, date = engine._get_values(
+                            item,
+                            ('안건번호', 'caseNo'),
+                            ('회신일자', 'replyDate'),
+                            query=query)
+                        detail_link = engine._first_present(item, ('법령해석례상세링크', 'detailLink'))
+                        if display_name and display_name != '(정보 없음)':
+                            meta = f"안건번호: {no or '-'} | 회신일: {date or '-'}" if no or date else ''
+                            st.markdown(format_result_row(idx, display_name, meta, detail_link, link_label='상세', bold=False), unsafe_allow_html=True)
+                    st.markdown("---")
 
     # 특별행정심판례 표시
-    special_tribunals = legal_data.get('special_tribunals', {})
-    if special_tribunals:
-        total_tribunal = sum(len(items) for items in special_tribunals.values() if items)
-        if total_tribunal > 0:
-            with st.expander(f"⚖️ 특별행정심판례 ({total_tribunal}건)", expanded=False):
-                for trib_key, items in special_tribunals.items():
-                    if items:
-                        trib_name = engine.special_tribunal_targets.get(trib_key, {}).get('name', trib_key)
-                        st.markdown(f"**{trib_name}** ({len(items)}건)")
-                        for idx, item in enumerate(items[:10], 1):
-                            display_name = engine._get_item_display(item, '사건명', '제목', 'caseName', query=query)
-                            case_no = engine._get_value(item, '사건번호', 'caseNo', query=query)
-                            date = engine._get_value(item, '재결일자', '의결일자', 'decisionDate', query=query)
-                            detail_link = engine._get_value(item, '행정심판례상세링크', 'detailLink', query=query)
-                            if display_name and display_name != '(정보 없음)':
-                                col1, col2 = st.columns([5, 1])
-                                with col1:
-                                    st.markdown(f"{idx}. {display_name}")
-                                    if case_no or date:
-                                        st.caption(f"사건번호: {case_no or '-'} | 재결일: {date or '-'}")
-                                with col2:
-                                    if detail_link:
-                                        full_link = f"https://www.law.go.kr{detail_link}" if detail_link.startswith('/') else detail_link
-                                        st.markdown(f"[상세]({full_link})")
-                        st.markdown("---")
-
+    special_tribunals = legal_data.get('special_tribunals') or {}
+    # 빈 목록은 건너뛰고 건수만 합산 (결과가 없으면 expander 자체를 만들지 않음)
+    total_tribunal = sum(map(len, filter(None, special_tribunals.values())))
+    if total_tribunal:
+        with st.expander(f"⚖️ 특별행정심판례 ({total_tribunal}건)", expanded=False):
+            for trib_key, items in special_tribunals.items():
+                if items:
+                    trib_name = engine.special_tribunal_names.get(trib_key, trib_key)
+                    st.markdown(f"**{trib_name}** ({len(items)}건)")
+                    for idx, item in enumerate(items[:10], 1):
+                        display_name = engine._get_item_display(item, '사건명', '제목', 'caseName', query=query)
+                        case_no, date = engine._get_values(
+                            item,
+                            ('사건번호', 'caseNo'),
+                            ('재결일자', '의결일자', 'decisionDate'),
+                            query=query)
+                        detail_link = engine._first_present(item, ('행정심판례상세링크', 'detailLink'))
+                        if display_name and display_name != '(정보 없음)':
+                            meta = f"사건번호: {case_no or '-'} | 재결일: {date or '-'}" if case_no or date else ''
+                            st.markdown(format_result_row(idx, display_name, meta, detail_link, link_label='상세', bold=False), unsafe_allow_html=True)
+                    st.markdown("---")
+
+@lru_cache(maxsize=4096)
+def absolute_law_link(detail_link: str) -> str:
+    """법제처 상세링크(/DRF/... 상대 경로)를 절대 URL로 변환 (반복 검색에서 같은 링크는 캐시 재사용)"""
+    return LAW_GO_KR_BASE_URL + detail_link if detail_link[:1] == '/' else detail_link
+
+def format_result_row(idx: int, display_name: str, meta: str = '', detail_link: str = '',
+                      link_label: str = '상세보기', bold: bool = True) -> str:
+    """검색 결과 1건(제목/메타 정보/상세 링크)을 한 번의 st.markdown으로 출력할 HTML 생성
+
+    행마다 columns + markdown/caption을 여러 번 호출하지 않고 flex 레이아웃 한 블록으로 전송
+    """
+    title = f"{idx}. {html.escape(display_name)}"
+    if bold:
+        title = f"<strong>{title}</strong>"
+    meta_html = f'<br><span class="result-meta">{html.escape(meta)}</span>' if meta else ''
+    link_html = ''
+    if detail_link:
+        link_html = (f'<a class="result-link" href="{html.escape(absolute_law_link(str(detail_link)))}" '
+                     f'target="_blank">{link_label}</a>')
+    return f'<div class="result-row"><div>{title}{meta_html}</div>{link_html}</div>'
+
+@st.fragment
 def display_download_section(legal_data: Dict, engine: LegalAIEngine):
-    """문서 다운로드 섹션 표시"""
+    """문서 다운로드 섹션 표시
+
+    문서 선택 체크박스/형식 선택 등 위젯 조작 시 이 섹션만 다시 실행 (전체 스크립트 rerun 방지)
+    """
     if not legal_data:
         return
 
@@ -3506,7 +4031,7 @@ def display_download_section(legal_data: Dict, engine: LegalAIEngine):
 
             for idx, doc_info in enumerate(selected_items):
                 try:
-                    detail = asyncio.run(engine.get_detail(doc_info['target'], doc_info['id']))
+                    detail = run_async(engine.get_detail(doc_info['target'], doc_info['id']))
                     if detail:
                         md_content = engine.format_document_as_markdown(detail, doc_info['target'])
                         downloaded_docs.append({
@@ -3558,7 +4083,7 @@ def display_download_section(legal_data: Dict, engine: LegalAIEngine):
                 # 개별 다운로드
                 st.markdown("#### 📁 개별 다운로드")
                 for doc in downloaded_docs:
-                    safe_title = re.sub(r'[<>:"/\\|?*]', '_', doc['title'][:30])
+                    safe_title = UNSAFE_FILENAME_PATTERN.sub('_', doc['title'][:30])
 
                     col1, col2 = st.columns([3, 1])
                     with col1:
@@ -3649,41 +4174,84 @@ def display_search_statistics(fact_sheet: Dict, engine: LegalAIEngine):
 
     st.markdown("### 📊 검색 결과 통계")
 
-    # 기본 데이터
-    basic_stats = {k: v for k, v in stats.items()
-                  if not k.startswith(('committee_', 'ministry_', 'tribunal_'))}
-    if basic_stats:
-        cols = st.columns(4)
-        for idx, (key, count) in enumerate(basic_stats.items()):
-            name = engine.basic_targets.get(key, {}).get('name', key)
-            with cols[idx % 4]:
-                st.metric(name, count)
-
-    # 위원회 결정문
-    committee_stats = {k.replace('committee_', ''): v for k, v in stats.items()
-                      if k.startswith('committee_')}
-    if committee_stats:
-        st.markdown("#### 위원회 결정문")
-        cols = st.columns(4)
-        for idx, (key, count) in enumerate(committee_stats.items()):
-            name = engine.committee_targets.get(key, {}).get('name', key)
-            with cols[idx % 4]:
-                st.metric(name, count)
-
-    # 부처별 법령해석
-    ministry_stats = {k.replace('ministry_', ''): v for k, v in stats.items()
-                     if k.startswith('ministry_')}
-    if ministry_stats:
-        st.markdown("#### 부처별 법령해석")
+    # 접두사별로 한 번에 분류 (중간 dict 재생성/replace 없이 슬라이싱)
+    basic_stats, committee_stats, ministry_stats = [], [], []
+    for key, count in stats.items():
+        if key.startswith('committee_'):
+            committee_stats.append((key[10:], count))
+        elif key.startswith('ministry_'):
+            ministry_stats.append((key[9:], count))
+        elif not key.startswith('tribunal_'):
+            basic_stats.append((key, count))
+
+    # 기본 데이터 / 위원회 결정문 / 부처별 법령해석 - 섹션별 4열 지표
+    for title, section_stats, names in (
+            (None, basic_stats, engine.basic_names),
+            ("위원회 결정문", committee_stats, engine.committee_names),
+            ("부처별 법령해석", ministry_stats, engine.ministry_names)):
+        if not section_stats:
+            continue
+        if title:
+            st.markdown(f"#### {title}")
         cols = st.columns(4)
-        for idx, (key, count) in enumerate(ministry_stats.items()):
-            name = engine.ministry_targets.get(key, {}).get('name', key)
-            with cols[idx % 4]:
-                st.metric(name, count)
+        # with 블록으로 컬럼 컨텍스트를 드나들지 않고 컬럼에 바로 출력
+        for idx, (key, count) in enumerate(section_stats):
+            cols[idx % 4].metric(names.get(key, key), count)
+
+@st.fragment
+def render_target_selection(engine: LegalAIEngine):
+    """사이드바 위원회/부처 선택 체크박스 표시
+
+    개별 선택 체크박스를 누를 때마다 대화 히스토리/검색 결과 전체가 다시 그려지지 않도록 이 영역만 다시 실행
+    모든 위젯은 key로 세션 상태에 저장되며 검색 실행 시 main에서 세션 상태로 수집
+    """
+    # 위원회 결정문 - 전체 선택 바깥에 배치
+    select_all_comm = st.checkbox("🏢 위원회 결정문 (전체)", key="select_all_comm",
+                                  help="공정거래위, 노동위, 금융위 등 12개 위원회")
+    if not select_all_comm:
+        with st.expander("위원회 개별 선택", expanded=False):
+            col1, col2 = st.columns(2)
+            committees_list = list(engine.committee_names.items())
+            half = len(committees_list) // 2
+            with col1:
+                for key, name in committees_list[:half]:
+                    st.checkbox(name, key=f"comm_{key}")
+            with col2:
+                for key, name in committees_list[half:]:
+                    st.checkbox(name, key=f"comm_{key}")
+
+    # 부처별 법령해석 - 전체 선택 바깥에 배치
+    select_all_ministry = st.checkbox("🏛️ 부처별 법령해석 (전체)", key="select_all_ministry",
+                                      help="고용노동부, 국토부, 법제처 등 30개 부처")
+
+    if not select_all_ministry:
+        # 부처별 법령해석 (주요)
+        select_all_major_min = st.checkbox(f"  └ 주요 부처 ({len(MAJOR_MINISTRIES)}개)", key="select_all_major_min")
+        if not select_all_major_min:
+            with st.expander("주요 부처 개별 선택", expanded=False):
+                for key, name in MAJOR_MINISTRIES:
+                    st.checkbox(name, key=f"min_{key}")
+
+        # 부처별 법령해석 (기타)
+        select_all_other_min = st.checkbox("  └ 기타 부처", key="select_all_other_min")
+        if not select_all_other_min:
+            with st.expander("기타 부처 개별 선택", expanded=False):
+                col1, col2 = st.columns(2)
+                for idx, key in enumerate(OTHER_MINISTRY_KEYS):
+                    with col1 if idx % 2 == 0 else col2:
+                        st.checkbox(engine.ministry_names[key], key=f"min_{key}")
+
+# 검색 완료 요약에 표시할 기본 자료 (원본 target 키, 표시 이름)
+SEARCH_SUMMARY_SPECS = (
+    (('prec',), "판례"),
+    (('expc',), "법령해석례"),
+    (('decc',), "행정심판례"),
+    (('law', 'eflaw'), "법령"),
+)
 
-async def process_search(query: str, search_options: Dict):
+def process_search(query: str, search_options: Dict):
     """검색 처리"""
-    engine = LegalAIEngine()
+    engine = get_engine()
 
     # 검색 상태 표시 영역
     status_container = st.container()
@@ -3697,6 +4265,14 @@ async def process_search(query: str, search_options: Dict):
     }
     mode_name = mode_names.get(search_mode, '검색')
 
+    # 사건 검색 모드에서 검색 대상이 하나도 없고 사건번호도 없으면 AI 분석/HTTP 요청 없이 종료
+    has_any_source = (search_options.get('basic') or search_options.get('committees')
+                      or search_options.get('ministries') or search_options.get('special_tribunals'))
+    if search_mode == 'case_search' and not has_any_source and not engine.detect_case_number(query).get('type'):
+        message = "검색할 데이터 소스를 하나 이상 선택하세요."
+        status_container.warning(f"⚠️ {message}")
+        return {}, {}, message, engine
+
     with status_container:
         st.info(f"🔍 {mode_name} 모드로 검색을 시작합니다...")
         progress = st.progress(0)
@@ -3716,22 +4292,16 @@ async def process_search(query: str, search_options: Dict):
         else:
             progress.progress(20, "키워드로 검색 중...")
 
-        # 1. 종합 검색
-        legal_data = await engine.comprehensive_search(query, search_options)
+        # 1. 종합 검색 (HTTP 요청은 공유 백그라운드 루프에서 실행, UI 갱신은 스크립트 스레드에서)
+        legal_data = run_async(engine.comprehensive_search(query, search_options))
 
         # 검색 결과 요약 표시
         basic = legal_data.get('basic', {})
         search_summary = []
-        if basic.get('prec'):
-            search_summary.append(f"판례 {len(basic['prec'])}건")
-        if basic.get('expc'):
-            search_summary.append(f"법령해석례 {len(basic['expc'])}건")
-        if basic.get('decc'):
-            search_summary.append(f"행정심판례 {len(basic['decc'])}건")
-        if basic.get('law') or basic.get('eflaw'):
-            laws = (basic.get('law', []) or []) + (basic.get('eflaw', []) or [])
-            if laws:
-                search_summary.append(f"법령 {len(laws)}건")
+        for source_keys, name in SEARCH_SUMMARY_SPECS:
+            count = sum(len(basic.get(key) or ()) for key in source_keys)
+            if count:
+                search_summary.append(f"{name} {count}건")
 
         if search_summary:
             progress.progress(50, f"검색 완료: {', '.join(search_summary)}")
@@ -3824,10 +4394,12 @@ async def process_search(query: str, search_options: Dict):
 
         # 3. AI 분석
         progress.progress(80, "AI 분석 중...")
-        advice = await engine.generate_legal_advice(query, legal_data, fact_sheet)
+        # 응답은 토큰 단위로 바로 표시 (write_stream이 전체 텍스트를 모아 반환)
+        # 같은 질문/검색 결과의 재요청(새로고침, 재시도)은 세션 캐시의 완료된 응답을 사용
+        advice = st.write_stream(engine.stream_legal_advice(query, legal_data,
+                                                            cache=st.session_state.advice_cache))
 
         progress.progress(100, "완료!")
-        time.sleep(0.5)
         progress.empty()
 
         # 최종 검색 결과 요약
@@ -3839,6 +4411,21 @@ async def process_search(query: str, search_options: Dict):
     return legal_data, fact_sheet, advice, engine
 
 # ===== PDF 번역 UI 함수 =====
+# 번역 언어 선택 표시 이름 (selectbox format_func로 직접 사용)
+PDF_LANGUAGE_LABELS = MappingProxyType({
+    "en": "영어", "ko": "한국어", "ja": "일본어",
+    "zh": "중국어", "de": "독일어", "fr": "프랑스어",
+    "es": "스페인어", "ru": "러시아어",
+})
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def get_pdf_info(pdf_bytes: bytes) -> Dict:
+    """업로드한 PDF의 페이지/텍스트 블록/이미지 수
+
+    번역 언어/옵션 위젯을 바꿀 때마다 탭 전체가 다시 실행되므로 같은 파일은 다시 파싱하지 않고 캐시 사용
+    """
+    return PDFTranslator().get_pdf_info(pdf_bytes)
+
 def render_pdf_translation_tab():
     """PDF 번역 탭 렌더링"""
     st.header("📄 PDF 문서 번역")
@@ -3860,22 +4447,14 @@ def render_pdf_translation_tab():
         source_lang = st.selectbox(
             "원본 언어",
             options=["en", "ko", "ja", "zh", "de", "fr", "es", "ru"],
-            format_func=lambda x: {
-                "en": "영어", "ko": "한국어", "ja": "일본어",
-                "zh": "중국어", "de": "독일어", "fr": "프랑스어",
-                "es": "스페인어", "ru": "러시아어"
-            }.get(x, x),
+            format_func=PDF_LANGUAGE_LABELS.__getitem__,
             index=0
         )
     with col2:
         target_lang = st.selectbox(
             "번역 언어",
             options=["ko", "en", "ja", "zh", "de", "fr", "es", "ru"],
-            format_func=lambda x: {
-                "en": "영어", "ko": "한국어", "ja": "일본어",
-                "zh": "중국어", "de": "독일어", "fr": "프랑스어",
-                "es": "스페인어", "ru": "러시아어"
-            }.get(x, x),
+            format_func=PDF_LANGUAGE_LABELS.__getitem__,
             index=0
         )
 
@@ -3902,17 +4481,13 @@ def render_pdf_translation_tab():
         st.markdown(f"**파일명:** {uploaded_file.name}")
         st.markdown(f"**파일 크기:** {uploaded_file.size / 1024 / 1024:.2f} MB")
 
-        # PDF 정보 미리보기
-        pdf_bytes = uploaded_file.read()
-        uploaded_file.seek(0)  # 파일 포인터 리셋
-
+        # PDF 정보 미리보기 - 같은 업로드(file_id)는 세션 상태의 결과를 재사용하여
+        # rerun마다 파일 전체를 복사/해시하지 않음 (getvalue는 파일 포인터를 옮기지 않으므로 되감기 불필요)
         try:
-            translator = PDFTranslator(get_openai_client()) if PDF_TRANSLATOR_AVAILABLE else None
-            if translator:
-                pdf_info = translator.get_pdf_info(pdf_bytes)
-            else:
-                st.error("PDF 번역기를 초기화할 수 없습니다.")
-                return
+            if st.session_state.get('pdf_info_file_id') != uploaded_file.file_id:
+                st.session_state['pdf_info'] = get_pdf_info(uploaded_file.getvalue())
+                st.session_state['pdf_info_file_id'] = uploaded_file.file_id
+            pdf_info = st.session_state['pdf_info']
 
             col1, col2, col3 = st.columns(3)
             with col1:
@@ -3946,7 +4521,7 @@ def render_pdf_translation_tab():
                 with st.spinner("PDF 번역 중..."):
                     # 번역 실행
                     translated_bytes = translate_pdf_file(
-                        pdf_bytes,
+                        uploaded_file.getvalue(),
                         openai_client=get_openai_client(),
                         source_lang=source_lang,
                         target_lang=target_lang,
@@ -3992,6 +4567,9 @@ def render_pdf_translation_tab():
 
 # ===== 메인 앱 =====
 def main():
+    # 세션 상태 프록시를 지역 변수로 바인딩 (rerun마다 반복되는 전역/속성 조회 감소)
+    ss = st.session_state
+
     # 헤더
     col1, col2 = st.columns([3, 1])
     with col1:
@@ -4009,12 +4587,12 @@ def main():
         st.header("🔑 API 설정")
 
         # API 키 입력 섹션
-        with st.expander("API 키 입력", expanded=not st.session_state.api_keys_set):
+        with st.expander("API 키 입력", expanded=not ss.api_keys_set):
             st.markdown("#### 법제처 Open API")
             st.caption("https://open.law.go.kr 에서 발급")
             law_api_input = st.text_input(
                 "법제처 API 키",
-                value=st.session_state.law_api_key,
+                value=ss.law_api_key,
                 type="password",
                 key="law_api_input",
                 placeholder="법제처 API 키를 입력하세요"
@@ -4024,7 +4602,7 @@ def main():
             st.caption("https://platform.openai.com 에서 발급")
             openai_api_input = st.text_input(
                 "OpenAI API 키",
-                value=st.session_state.openai_api_key,
+                value=ss.openai_api_key,
                 type="password",
                 key="openai_api_input",
                 placeholder="OpenAI API 키를 입력하세요 (선택)"
@@ -4035,9 +4613,9 @@ def main():
                 if openai_api_input and not openai_api_input.startswith('sk-'):
                     st.error("⚠️ OpenAI API 키는 'sk-'로 시작해야 합니다. https://platform.openai.com 에서 올바른 API 키를 복사해주세요.")
                 else:
-                    st.session_state.law_api_key = law_api_input
-                    st.session_state.openai_api_key = openai_api_input
-                    st.session_state.api_keys_set = True
+                    ss.law_api_key = law_api_input
+                    ss.openai_api_key = openai_api_input
+                    ss.api_keys_set = True
                     st.success("API 키가 저장되었습니다!")
                     st.rerun()
 
@@ -4069,71 +4647,14 @@ def main():
         st.header("🔍 검색 옵션")
 
         # 엔진 초기화 (옵션 표시용)
-        engine = LegalAIEngine()
+        engine = get_engine()
 
         # 기본 데이터 검색
         search_basic = st.checkbox("📚 기본 법률 데이터", value=True,
                                    help="법령, 판례, 행정규칙, 자치법규, 헌재결정례, 법령해석례, 행정심판례, 조약")
 
-        # 위원회 결정문 - 전체 선택 바깥에 배치
-        select_all_comm = st.checkbox("🏢 위원회 결정문 (전체)", key="select_all_comm",
-                                      help="공정거래위, 노동위, 금융위 등 12개 위원회")
-        if not select_all_comm:
-            with st.expander("위원회 개별 선택", expanded=False):
-                col1, col2 = st.columns(2)
-                committees_list = list(engine.committee_targets.items())
-                half = len(committees_list) // 2
-                with col1:
-                    for key, info in committees_list[:half]:
-                        st.checkbox(info['name'], key=f"comm_{key}")
-                with col2:
-                    for key, info in committees_list[half:]:
-                        st.checkbox(info['name'], key=f"comm_{key}")
-
-        # 부처별 법령해석 - 전체 선택 바깥에 배치
-        select_all_ministry = st.checkbox("🏛️ 부처별 법령해석 (전체)", key="select_all_ministry",
-                                          help="고용노동부, 국토부, 법제처 등 30개 부처")
-
-        if not select_all_ministry:
-            # 부처별 법령해석 (주요)
-            major_ministries = [
-                ('moelCgmExpc', '고용노동부'),
-                ('molitCgmExpc', '국토교통부'),
-                ('moisCgmExpc', '행정안전부'),
-                ('mohwCgmExpc', '보건복지부'),
-                ('molegCgmExpc', '법제처'),
-                ('mojCgmExpc', '법무부'),
-            ]
-
-            select_all_major_min = st.checkbox("  └ 주요 부처 (6개)", key="select_all_major_min")
-            if not select_all_major_min:
-                with st.expander("주요 부처 개별 선택", expanded=False):
-                    for key, name in major_ministries:
-                        st.checkbox(name, key=f"min_{key}")
-
-            # 부처별 법령해석 (기타)
-            other_ministries = [(k, v['name']) for k, v in engine.ministry_targets.items()
-                               if k not in [m[0] for m in major_ministries]]
-
-            select_all_other_min = st.checkbox("  └ 기타 부처", key="select_all_other_min")
-            if not select_all_other_min:
-                with st.expander("기타 부처 개별 선택", expanded=False):
-                    col1, col2 = st.columns(2)
-                    for idx, (key, name) in enumerate(other_ministries):
-                        with col1 if idx % 2 == 0 else col2:
-                            st.checkbox(name, key=f"min_{key}")
-        else:
-            # 전체 선택 시 major_ministries 변수 정의 필요
-            major_ministries = [
-                ('moelCgmExpc', '고용노동부'),
-                ('molitCgmExpc', '국토교통부'),
-                ('moisCgmExpc', '행정안전부'),
-                ('mohwCgmExpc', '보건복지부'),
-                ('molegCgmExpc', '법제처'),
-                ('mojCgmExpc', '법무부'),
-            ]
-            other_ministries = [(k, v['name']) for k, v in engine.ministry_targets.items()
-                               if k not in [m[0] for m in major_ministries]]
+        # 위원회/부처 개별 선택 - 체크박스 조작 시 이 영역만 다시 실행 (선택 값은 세션 상태 키로 읽음)
+        render_target_selection(engine)
 
         # 특별행정심판례
         search_special_tribunals = st.checkbox(
@@ -4146,9 +4667,9 @@ def main():
 
         # 새 대화 시작 버튼
         if st.button("🔄 새 검색 시작", use_container_width=True):
-            st.session_state.chat_history = []
-            st.session_state.search_results = None
-            st.session_state.fact_sheet = {}
+            ss.chat_history = []
+            ss.search_results = None
+            ss.fact_sheet = {}
             st.rerun()
 
     # ===== 메인 컨텐츠 (탭 기반) =====
@@ -4157,34 +4678,11 @@ def main():
     # ===== 탭 1: 법률 연구 =====
     with tab1:
         # 웰컴 메시지
-        if not st.session_state.chat_history:
-            st.markdown("""
-            <div class="chat-message assistant-message">
-                <strong>⚖️ AI 변호사 (GPT-5.2):</strong><br>
-                안녕하세요, AI 변호사입니다.<br><br>
-
-                <b>🔍 2가지 검색 모드를 제공합니다:</b><br><br>
-
-                <b>📋 사건번호 검색</b><br>
-                법원 사건번호나 안건번호를 알고 있을 때 직접 검색합니다.<br>
-                • 판례: 2020다12345, 2021구합54321<br>
-                • 법령해석례: 18-0701, 22-0123<br>
-                • 행정심판례: 2023-12345<br><br>
-
-                <b>🤖 사건 검색</b><br>
-                법률 질문이나 키워드를 입력하면 AI가 의도를 분석하고,<br>
-                여러 방면으로 관련 자료를 최대한 수집한 후 의미있는 자료만 필터링합니다.<br>
-                예: "부당해고를 당했는데 어떻게 해야 하나요?" 또는 "부당해고"<br><br>
-
-                <b>📚 검색 가능한 데이터:</b><br>
-                법령, 판례, 법령해석례, 행정심판례, 헌재결정례, 위원회 결정문 등<br><br>
-
-                아래에서 검색 모드를 선택하고 검색을 시작하세요!
-            </div>
-            """, unsafe_allow_html=True)
+        if not ss.chat_history:
+            st.markdown(WELCOME_MESSAGE_HTML, unsafe_allow_html=True)
         else:
             # 대화 히스토리 표시
-            for msg in st.session_state.chat_history:
+            for msg in ss.chat_history:
                 display_chat_message(msg["role"], msg["content"])
 
         st.divider()
@@ -4216,52 +4714,35 @@ def main():
 
         # 예시 검색어 (모드별로 다르게 표시)
         st.markdown("### 💡 예시")
-        col1, col2, col3, col4 = st.columns(4)
-
-        if search_mode == 'case_number':
-            examples = {
-                "2020다12345": "2020다12345",
-                "2021구합54321": "2021구합54321",
-                "18-0701": "18-0701",
-                "22-0123": "22-0123"
-            }
-        else:
-            examples = {
-                "부당해고 구제": "회사에서 정당한 사유 없이 해고를 당했습니다. 어떻게 구제받을 수 있나요?",
-                "임대차 분쟁": "전세 보증금을 돌려받지 못하고 있습니다. 임차인으로서 어떤 권리가 있나요?",
-                "개인정보 침해": "개인정보 침해 손해배상",
-                "부당해고": "부당해고"
-            }
+        examples = CASE_NUMBER_EXAMPLES if search_mode == 'case_number' else CASE_SEARCH_EXAMPLES
 
         clicked_example = None
-        for idx, (btn_text, query) in enumerate(examples.items()):
-            with [col1, col2, col3, col4][idx]:
+        for idx, (col, (btn_text, query)) in enumerate(zip(st.columns(len(examples)), examples)):
+            with col:
                 if st.button(btn_text, use_container_width=True, key=f"example_{idx}"):
                     clicked_example = query
 
-        # 사용자 입력
-        user_input = st.text_area(
-            "검색어 입력",
-            value=clicked_example if clicked_example else "",
-            placeholder="예: 부당해고 구제 절차, 임대차 보증금 반환 판례 등",
-            height=100,
-            key="search_input"
-        )
+        # 사용자 입력 - 폼으로 묶어 입력 편집 중에는 rerun(대화 히스토리 전체 재렌더링)이 일어나지 않음
+        with st.form("search_form"):
+            user_input = st.text_area(
+                "검색어 입력",
+                value=clicked_example if clicked_example else "",
+                placeholder="예: 부당해고 구제 절차, 임대차 보증금 반환 판례 등",
+                height=100,
+                key="search_input"
+            )
+            search_button = st.form_submit_button("🔍 법률 자료 검색", type="primary", use_container_width=True)
 
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            search_button = st.button("🔍 법률 자료 검색", type="primary", use_container_width=True)
-        with col2:
-            if st.session_state.chat_history:
-                if st.button("📄 결과 다운로드"):
-                    last_response = st.session_state.chat_history[-1]
-                    if last_response["role"] == "assistant":
-                        st.download_button(
-                            label="💾 다운로드",
-                            data=last_response["content"],
-                            file_name=f"법률연구_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-                            mime="text/plain"
-                        )
+        if ss.chat_history:
+            if st.button("📄 결과 다운로드"):
+                last_response = ss.chat_history[-1]
+                if last_response["role"] == "assistant":
+                    st.download_button(
+                        label="💾 다운로드",
+                        data=last_response["content"],
+                        file_name=f"법률연구_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                        mime="text/plain"
+                    )
 
         # 검색 실행
         if search_button or clicked_example:
@@ -4273,45 +4754,51 @@ def main():
                 st.error("법제처 API 키를 입력해주세요.")
             else:
                 # 세션 상태에서 선택된 위원회 수집
-                engine_for_options = LegalAIEngine()
+                engine_for_options = get_engine()
+
+                # 체크된 위원회/부처 키를 세션 상태 한 번 순회로 수집 (키마다 get 호출 방지)
+                checked_committees = set()
+                checked_ministries = set()
+                for state_key, checked in ss.items():
+                    if state_key.startswith('comm_'):
+                        if checked:
+                            checked_committees.add(state_key[5:])
+                    elif state_key.startswith('min_'):
+                        if checked:
+                            checked_ministries.add(state_key[4:])
 
                 # 위원회 전체 선택 체크 시 모든 위원회 선택
-                if st.session_state.get("select_all_comm", False):
+                if ss.get("select_all_comm", False):
                     selected_committees = list(engine_for_options.committee_targets.keys())
                 else:
                     selected_committees = [
                         key for key in engine_for_options.committee_targets.keys()
-                        if st.session_state.get(f"comm_{key}", False)
+                        if key in checked_committees
                     ]
 
-                # 세션 상태에서 선택된 부처 수집
-                major_ministry_keys = ['moelCgmExpc', 'molitCgmExpc', 'moisCgmExpc',
-                                       'mohwCgmExpc', 'molegCgmExpc', 'mojCgmExpc']
-                other_ministry_keys = [k for k in engine_for_options.ministry_targets.keys()
-                                       if k not in major_ministry_keys]
-
+                # 세션 상태에서 선택된 부처 수집 (주요/기타 부처 구분은 모듈 상수 사용)
                 selected_ministries = []
 
                 # 부처 전체 선택 체크 시 모든 부처 선택
-                if st.session_state.get("select_all_ministry", False):
+                if ss.get("select_all_ministry", False):
                     selected_ministries = list(engine_for_options.ministry_targets.keys())
                 else:
                     # 주요 부처 전체 선택 체크 시
-                    if st.session_state.get("select_all_major_min", False):
-                        selected_ministries.extend(major_ministry_keys)
+                    if ss.get("select_all_major_min", False):
+                        selected_ministries.extend(MAJOR_MINISTRY_KEYS)
                     else:
                         selected_ministries.extend([
-                            key for key in major_ministry_keys
-                            if st.session_state.get(f"min_{key}", False)
+                            key for key in MAJOR_MINISTRY_KEYS
+                            if key in checked_ministries
                         ])
 
                     # 기타 부처 전체 선택 체크 시
-                    if st.session_state.get("select_all_other_min", False):
-                        selected_ministries.extend(other_ministry_keys)
+                    if ss.get("select_all_other_min", False):
+                        selected_ministries.extend(OTHER_MINISTRY_KEYS)
                     else:
                         selected_ministries.extend([
-                            key for key in other_ministry_keys
-                            if st.session_state.get(f"min_{key}", False)
+                            key for key in OTHER_MINISTRY_KEYS
+                            if key in checked_ministries
                         ])
 
                 # 검색 옵션 구성
@@ -4324,22 +4811,20 @@ def main():
                 }
 
                 # 검색 실행
-                legal_data, fact_sheet, advice, engine = asyncio.run(
-                    process_search(query, search_options)
-                )
+                legal_data, fact_sheet, advice, engine = process_search(query, search_options)
 
                 # 결과 저장
-                st.session_state.search_results = legal_data
-                st.session_state.fact_sheet = fact_sheet
+                ss.search_results = legal_data
+                ss.fact_sheet = fact_sheet
 
                 # 채팅 히스토리에 추가
-                st.session_state.chat_history.append({
+                ss.chat_history.append({
                     "role": "user",
                     "content": query,
                     "timestamp": datetime.now().isoformat()
                 })
 
-                st.session_state.chat_history.append({
+                ss.chat_history.append({
                     "role": "assistant",
                     "content": advice,
                     "legal_data": legal_data,
@@ -4350,32 +4835,32 @@ def main():
                 st.rerun()
 
         # 검색 통계 표시
-        if st.session_state.fact_sheet:
-            engine = LegalAIEngine()
-            display_search_statistics(st.session_state.fact_sheet, engine)
+        if ss.fact_sheet:
+            engine = get_engine()
+            display_search_statistics(ss.fact_sheet, engine)
 
     # 검색 결과 상세 표시 (판례, 유권해석 등)
-    if st.session_state.search_results:
-        engine = LegalAIEngine()
+    if ss.search_results:
+        engine = get_engine()
 
         # 검색 결과 없음 분석이 있는 경우
-        if st.session_state.search_results.get('no_result_analysis'):
-            display_no_result_analysis(st.session_state.search_results)
+        if ss.search_results.get('no_result_analysis'):
+            display_no_result_analysis(ss.search_results)
         else:
             # 정상적인 검색 결과 표시
             st.markdown("---")
             st.markdown("## 📑 검색된 법률 자료")
             # fact_sheet에서 쿼리 가져오기
-            current_query = st.session_state.fact_sheet.get('query', '') if st.session_state.fact_sheet else ''
-            display_search_results_detail(st.session_state.search_results, engine, query=current_query)
+            current_query = ss.fact_sheet.get('query', '') if ss.fact_sheet else ''
+            display_search_results_detail(ss.search_results, engine, query=current_query)
 
             # 다운로드 섹션 표시
-            display_download_section(st.session_state.search_results, engine)
+            display_download_section(ss.search_results, engine)
 
     # 검색 통계 표시
-    if st.session_state.fact_sheet:
-        engine = LegalAIEngine()
-        display_search_statistics(st.session_state.fact_sheet, engine)
+    if ss.fact_sheet:
+        engine = get_engine()
+        display_search_statistics(ss.fact_sheet, engine)
 
 # ===== 앱 실행 =====
 if __name__ == "__main__":
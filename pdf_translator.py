@@ -10,7 +10,7 @@ import logging
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from PIL import Image
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Tesseract OCR (선택적)
 try:
@@ -229,20 +229,54 @@ class OCRProcessor:
 class Translator:
     """텍스트 번역기 (OpenAI 기반)"""
 
+    LANG_NAMES = {
+        'ko': '한국어', 'en': '영어', 'ja': '일본어',
+        'zh': '중국어', 'de': '독일어', 'fr': '프랑스어',
+        'es': '스페인어', 'ru': '러시아어'
+    }
+
+    # 일괄 번역 설정: 요청 1건에 묶을 최대 블록 수/문자 수, 동시 요청 수
+    BATCH_MAX_BLOCKS = 16
+    BATCH_MAX_CHARS = 3000
+    MAX_WORKERS = 4
+
+    # 일괄 번역 요청/응답의 블록 구분자 (<<<번호>>>)
+    BATCH_MARKER_PATTERN = re.compile(r'<<<(\d+)>>>')
+
     def __init__(self, openai_client, source_lang: str = "en",
-                 target_lang: str = "ko"):
+                 target_lang: str = "ko", max_batch: int = BATCH_MAX_BLOCKS,
+                 max_workers: int = MAX_WORKERS):
         self.client = openai_client
         self.source_lang = source_lang
         self.target_lang = target_lang
+        self.max_batch = max(1, max_batch)
+        self.max_workers = max(1, max_workers)
         self.cache = {}  # 번역 캐시
 
+    def _cache_key(self, text: str) -> str:
+        return f"{self.source_lang}_{self.target_lang}_{text}"
+
+    def _system_prompt(self, batch: bool = False) -> str:
+        """번역 시스템 프롬프트 (batch=True면 구분자 유지 지시 추가)"""
+        target_name = self.LANG_NAMES.get(self.target_lang, self.target_lang)
+        prompt = f"""당신은 전문 번역가입니다.
+텍스트를 {target_name}로 정확하게 번역하세요.
+- 수식, 숫자, 변수명은 그대로 유지하세요.
+- 학술 용어는 적절히 번역하되 괄호 안에 원문을 표기할 수 있습니다.
+- 번역문만 출력하세요."""
+        if batch:
+            prompt += """
+- 입력은 <<<번호>>> 구분자로 나뉜 여러 텍스트입니다. 각 텍스트를 따로 번역하고,
+  같은 구분자를 같은 순서로 그대로 남긴 채 각 구분자 다음 줄에 해당 번역문을 출력하세요."""
+        return prompt
+
     def translate_text(self, text: str) -> str:
         """단일 텍스트 번역"""
         if not text or not text.strip():
             return text
 
         # 캐시 확인
-        cache_key = f"{self.source_lang}_{self.target_lang}_{text}"
+        cache_key = self._cache_key(text)
         if cache_key in self.cache:
             return self.cache[cache_key]
 
@@ -250,24 +284,10 @@ class Translator:
             return text
 
         try:
-            lang_names = {
-                'ko': '한국어', 'en': '영어', 'ja': '일본어',
-                'zh': '중국어', 'de': '독일어', 'fr': '프랑스어',
-                'es': '스페인어', 'ru': '러시아어'
-            }
-            target_name = lang_names.get(self.target_lang, self.target_lang)
-
             response = self.client.chat.completions.create(
                 model="gpt-4",
                 messages=[
-                    {
-                        "role": "system",
-                        "content": f"""당신은 전문 번역가입니다.
-텍스트를 {target_name}로 정확하게 번역하세요.
-- 수식, 숫자, 변수명은 그대로 유지하세요.
-- 학술 용어는 적절히 번역하되 괄호 안에 원문을 표기할 수 있습니다.
-- 번역문만 출력하세요."""
-                    },
+                    {"role": "system", "content": self._system_prompt()},
                     {"role": "user", "content": text}
                 ],
                 temperature=0.3,
@@ -282,36 +302,109 @@ class Translator:
             logger.error(f"번역 실패: {e}")
             return text
 
-    def translate_blocks(self, blocks: List[TextBlock],
-                        progress_callback=None) -> List[Tuple[TextBlock, str]]:
-        """텍스트 블록 일괄 번역"""
-        results = []
-        total = len(blocks)
+    def _translate_batch(self, texts: List[str]) -> List[str]:
+        """여러 텍스트를 요청 1건으로 번역 (응답을 구분자로 나누지 못하면 블록별 번역으로 대체)"""
+        if len(texts) == 1:
+            return [self.translate_text(texts[0])]
 
-        for idx, block in enumerate(blocks):
-            # 수식은 번역하지 않음
-            if block.is_formula:
-                results.append((block, block.text))
+        content = "\n".join(f"<<<{idx}>>>\n{text}" for idx, text in enumerate(texts, 1))
+        try:
+            response = self.client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": self._system_prompt(batch=True)},
+                    {"role": "user", "content": content}
+                ],
+                temperature=0.3,
+                max_tokens=4000
+            )
+
+            # split 결과: ['', '1', '번역1', '2', '번역2', ...]
+            # 구분자는 1..n이 중복 없이 순서대로 정확히 한 번씩 나와야 함
+            parts = self.BATCH_MARKER_PATTERN.split(response.choices[0].message.content)
+            markers = parts[1::2]
+            results = [part.strip() for part in parts[2::2]]
+            if markers != [str(idx) for idx in range(1, len(texts) + 1)] or not all(results):
+                raise ValueError(f"구분자 불일치 (요청 {len(texts)}개, 응답 {len(markers)}개)")
+
+        except Exception as e:
+            logger.warning(f"일괄 번역 실패, 블록별 번역으로 대체: {e}")
+            return [self.translate_text(text) for text in texts]
+
+        for text, result in zip(texts, results):
+            self.cache[self._cache_key(text)] = result
+        return results
+
+    def _make_batches(self, texts: List[str]) -> List[List[str]]:
+        """블록 수(max_batch)/문자 수(BATCH_MAX_CHARS) 한도 안에서 순서대로 묶기"""
+        batches = []
+        batch, batch_chars = [], 0
+        for text in texts:
+            if batch and (len(batch) >= self.max_batch or batch_chars + len(text) > self.BATCH_MAX_CHARS):
+                batches.append(batch)
+                batch, batch_chars = [], 0
+            batch.append(text)
+            batch_chars += len(text)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def translate_texts(self, texts: List[str], progress_callback=None) -> List[str]:
+        """여러 텍스트 번역 - 캐시/중복을 제외한 텍스트를 묶어 요청하고 묶음들은 동시에 처리
+
+        블록마다 요청을 순서대로 보내면 페이지 수에 비례해 왕복 지연이 쌓이므로
+        max_batch개씩 요청 1건으로 묶고, 묶음 요청은 max_workers개까지 병렬 실행
+        progress_callback은 완료된 묶음 기준으로 호출 스레드에서 호출
+        """
+        results = list(texts)
+        if not self.client:
+            if progress_callback:
+                progress_callback(1.0)
+            return results
+
+        # 번역할 고유 텍스트 → 결과를 채울 위치
+        pending: Dict[str, List[int]] = {}
+        for idx, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            cached = self.cache.get(self._cache_key(text))
+            if cached is not None:
+                results[idx] = cached
             else:
-                translated = self.translate_text(block.text)
-                results.append((block, translated))
+                pending.setdefault(text, []).append(idx)
 
+        batches = self._make_batches(list(pending))
+        if not batches:
             if progress_callback:
-                progress_callback((idx + 1) / total)
+                progress_callback(1.0)
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+            futures = {executor.submit(self._translate_batch, batch): batch for batch in batches}
+            for done, future in enumerate(as_completed(futures), 1):
+                for text, translated in zip(futures[future], future.result()):
+                    for idx in pending[text]:
+                        results[idx] = translated
+                if progress_callback:
+                    progress_callback(done / len(batches))
 
         return results
 
+    def translate_blocks(self, blocks: List[TextBlock],
+                        progress_callback=None) -> List[Tuple[TextBlock, str]]:
+        """텍스트 블록 일괄 번역"""
+        # 수식은 번역하지 않음
+        texts = [block.text for block in blocks if not block.is_formula]
+        translated = iter(self.translate_texts(texts, progress_callback))
+        return [(block, block.text if block.is_formula else next(translated)) for block in blocks]
+
     def translate_images(self, images: List[ImageBlock],
                         progress_callback=None) -> List[ImageBlock]:
         """이미지 OCR 텍스트 번역"""
-        total = len(images)
-
-        for idx, img in enumerate(images):
-            if img.ocr_text:
-                img.translated_text = self.translate_text(img.ocr_text)
-
-            if progress_callback:
-                progress_callback((idx + 1) / total)
+        targets = [img for img in images if img.ocr_text]
+        translated = self.translate_texts([img.ocr_text for img in targets], progress_callback)
+        for img, text in zip(targets, translated):
+            img.translated_text = text
 
         return images
 
@@ -493,7 +586,9 @@ class PDFTranslator:
 
     def __init__(self, openai_client=None,
                  source_lang: str = "en",
-                 target_lang: str = "ko"):
+                 target_lang: str = "ko",
+                 max_batch: int = Translator.BATCH_MAX_BLOCKS,
+                 max_workers: int = Translator.MAX_WORKERS):
         self.openai_client = openai_client
         self.source_lang = source_lang
         self.target_lang = target_lang
@@ -501,7 +596,8 @@ class PDFTranslator:
         # 컴포넌트 초기화
         self.extractor = PDFTextExtractor(preserve_formulas=True)
         self.ocr_processor = OCRProcessor(lang="kor+eng")
-        self.translator = Translator(openai_client, source_lang, target_lang)
+        self.translator = Translator(openai_client, source_lang, target_lang,
+                                     max_batch=max_batch, max_workers=max_workers)
         self.renderer = PDFRenderer()
 
     def translate_pdf(self,
@@ -613,13 +709,21 @@ def translate_pdf_file(pdf_bytes: bytes,
                       target_lang: str = "ko",
                       translate_text: bool = True,
                       translate_images: bool = False,
-                      progress_callback=None) -> bytes:
-    """PDF 파일 번역 헬퍼 함수"""
+                      progress_callback=None,
+                      max_batch: int = Translator.BATCH_MAX_BLOCKS,
+                      max_workers: int = Translator.MAX_WORKERS) -> bytes:
+    """PDF 파일 번역 헬퍼 함수
+
+    max_batch: 번역 요청 1건에 묶을 최대 텍스트 블록 수
+    max_workers: 동시에 보낼 번역 요청 수
+    """
 
     translator = PDFTranslator(
         openai_client=openai_client,
         source_lang=source_lang,
-        target_lang=target_lang
+        target_lang=target_lang,
+        max_batch=max_batch,
+        max_workers=max_workers
     )
 
     return translator.translate_pdf(